@@ -4,10 +4,12 @@ Uses aiosqlite for non-blocking database operations compatible
 with FastAPI's async request handling.
 """
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import aiosqlite
 
@@ -15,6 +17,19 @@ from backend.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on pooled read-only connections used by history/list endpoints
+_READ_POOL_SIZE = min(os.cpu_count() or 1, 8)
+
+# Memory-map up to 256 MiB of the database file for reads
+_MMAP_SIZE = 268435456
+
+# sqlite3 keeps prepared statements per connection keyed by SQL text;
+# size it so every hot query the routers issue stays prepared.
+_STATEMENT_CACHE_SIZE = 256
+
+# Page cache per connection, in KiB (negative cache_size means KiB)
+_PAGE_CACHE_KIB = 16384
+
 # SQL schema definitions
 _SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS scan_results (
@@ -64,7 +79,38 @@ CREATE INDEX IF NOT EXISTS idx_scan_results_target ON scan_results(target);
 CREATE INDEX IF NOT EXISTS idx_scan_results_severity ON scan_results(severity);
 CREATE INDEX IF NOT EXISTS idx_scan_history_module ON scan_history(module);
 CREATE INDEX IF NOT EXISTS idx_scan_history_status ON scan_history(status);
+CREATE INDEX IF NOT EXISTS idx_scan_history_started ON scan_history(started_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_reports_type ON reports(report_type);
+CREATE INDEX IF NOT EXISTS idx_reports_created ON reports(created_at DESC, id DESC);
+"""
+
+# Additive column migrations, applied when the column is missing.
+# (table, column, ALTER statement)
+_COLUMN_MIGRATIONS: tuple[tuple[str, str, str], ...] = (
+    (
+        "scan_results", "scan_type_lc",
+        "ALTER TABLE scan_results ADD COLUMN scan_type_lc TEXT "
+        "GENERATED ALWAYS AS (lower(scan_type)) VIRTUAL",
+    ),
+    (
+        "scan_results", "severity_lc",
+        "ALTER TABLE scan_results ADD COLUMN severity_lc TEXT "
+        "GENERATED ALWAYS AS (lower(severity)) VIRTUAL",
+    ),
+    (
+        # Module family ('recon', 'osint', ...) from '<family>_<kind>' names
+        "scan_history", "module_kind",
+        "ALTER TABLE scan_history ADD COLUMN module_kind TEXT "
+        "GENERATED ALWAYS AS (CASE WHEN instr(module, '_') > 0 "
+        "THEN substr(module, 1, instr(module, '_') - 1) ELSE module END) VIRTUAL",
+    ),
+)
+
+# Indexes that depend on migrated columns
+_MIGRATION_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_scan_results_type_lc ON scan_results(scan_type_lc);
+CREATE INDEX IF NOT EXISTS idx_scan_results_severity_lc ON scan_results(severity_lc);
+CREATE INDEX IF NOT EXISTS idx_scan_history_kind ON scan_history(module_kind, started_at DESC, id DESC);
 """
 
 
@@ -79,6 +125,8 @@ class Database:
         settings = get_settings()
         self._db_path: str = db_path or settings.DB_PATH
         self._connection: Optional[aiosqlite.Connection] = None
+        self._read_pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._read_opened: int = 0
 
     async def init_db(self) -> None:
         """Create the database file, parent directories, and all tables.
@@ -90,9 +138,24 @@ class Database:
 
         conn = await self.get_connection()
         await conn.executescript(_SCHEMA_SQL)
+        await self._migrate(conn)
         await conn.commit()
         logger.info("Database initialized at %s", self._db_path)
 
+    async def _migrate(self, conn: aiosqlite.Connection) -> None:
+        """Add columns and indexes introduced after a table was first created."""
+        existing: dict[str, set[str]] = {}
+        for table, column, ddl in _COLUMN_MIGRATIONS:
+            if table not in existing:
+                # table_xinfo also lists generated columns
+                cursor = await conn.execute(f"PRAGMA table_xinfo({table})")
+                existing[table] = {row["name"] for row in await cursor.fetchall()}
+            if column not in existing[table]:
+                await conn.execute(ddl)
+                existing[table].add(column)
+                logger.info("Added column %s.%s", table, column)
+        await conn.executescript(_MIGRATION_INDEX_SQL)
+
     async def get_connection(self) -> aiosqlite.Connection:
         """Return the active database connection, opening one if needed.
 
@@ -100,14 +163,49 @@ class Database:
         better concurrency and data integrity.
         """
         if self._connection is None:
-            self._connection = await aiosqlite.connect(self._db_path)
-            self._connection.row_factory = aiosqlite.Row
-            await self._connection.execute("PRAGMA journal_mode=WAL;")
-            await self._connection.execute("PRAGMA foreign_keys=ON;")
+            self._connection = await self._open()
         return self._connection
 
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled read-only connection for the duration of the block.
+
+        Connections are opened lazily up to ``_READ_POOL_SIZE`` and then
+        reused. WAL mode lets these readers run alongside the writer
+        connection returned by :meth:`get_connection`.
+        """
+        if self._read_pool.empty() and self._read_opened < _READ_POOL_SIZE:
+            self._read_opened += 1
+            try:
+                conn = await self._open(read_only=True)
+            except Exception:
+                self._read_opened -= 1
+                raise
+        else:
+            conn = await self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    async def _open(self, read_only: bool = False) -> aiosqlite.Connection:
+        """Open and configure a new SQLite connection."""
+        conn = await aiosqlite.connect(self._db_path, cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA journal_mode=WAL;")
+        await conn.execute("PRAGMA synchronous=NORMAL;")
+        await conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE};")
+        await conn.execute(f"PRAGMA cache_size=-{_PAGE_CACHE_KIB};")
+        await conn.execute("PRAGMA foreign_keys=ON;")
+        if read_only:
+            await conn.execute("PRAGMA query_only=ON;")
+        return conn
+
     async def close(self) -> None:
-        """Close the database connection if open."""
+        """Close the database connection and any pooled read connections."""
+        while not self._read_pool.empty():
+            await self._read_pool.get_nowait().close()
+        self._read_opened = 0
         if self._connection is not None:
             await self._connection.close()
             self._connection = None
@@ -116,3 +214,9 @@ class Database:
 
 # Module-level singleton
 db = Database()
+
+
+async def get_read_connection() -> AsyncIterator[aiosqlite.Connection]:
+    """FastAPI dependency yielding a pooled read-only connection."""
+    async with db.read_connection() as conn:
+        yield conn
@@ -6,7 +6,7 @@ Respects the HIBP rate limit of 1.5 seconds between requests.
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
@@ -23,9 +23,17 @@ _RATE_LIMIT_DELAY = 1.5  # seconds between requests
 class HIBPClient:
     """Async client for the Have I Been Pwned API v3."""
 
-    def __init__(self, api_key: str = "") -> None:
+    def __init__(self, api_key: str = "", client: Optional[httpx.AsyncClient] = None) -> None:
         self._api_key = api_key
         self._last_request_time: float = 0.0
+        self._client = client
+
+    async def _get(self, url: str, params: dict[str, str]) -> httpx.Response:
+        """GET *url* on the shared client, or a one-off client if none was given."""
+        if self._client is not None:
+            return await self._client.get(url, headers=self._get_headers(), params=params, timeout=15.0)
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            return await client.get(url, headers=self._get_headers(), params=params)
 
     def _get_headers(self) -> dict[str, str]:
         """Build request headers with API key and user agent."""
@@ -63,26 +71,24 @@ class HIBPClient:
         await self._rate_limit()
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    _HIBP_API_BASE + "/breachedaccount/" + email,
-                    headers=self._get_headers(),
-                    params={"truncateResponse": "false"},
-                )
-
-                if response.status_code == 404:
-                    logger.info("No breaches found for %s", email)
-                    return []
-                elif response.status_code == 401:
-                    logger.error("HIBP API key required or invalid")
-                    return []
-                elif response.status_code == 429:
-                    logger.warning("HIBP rate limit exceeded")
-                    return []
-
-                response.raise_for_status()
-                breaches = response.json()
-                return [self._parse_breach(b) for b in breaches]
+            response = await self._get(
+                _HIBP_API_BASE + "/breachedaccount/" + email,
+                params={"truncateResponse": "false"},
+            )
+
+            if response.status_code == 404:
+                logger.info("No breaches found for %s", email)
+                return []
+            elif response.status_code == 401:
+                logger.error("HIBP API key required or invalid")
+                return []
+            elif response.status_code == 429:
+                logger.warning("HIBP rate limit exceeded")
+                return []
+
+            response.raise_for_status()
+            breaches = response.json()
+            return [self._parse_breach(b) for b in breaches]
 
         except Exception as exc:
             logger.error("HIBP email check failed for %s: %s", email, exc)
@@ -100,19 +106,17 @@ class HIBPClient:
         await self._rate_limit()
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    _HIBP_API_BASE + "/breaches",
-                    headers=self._get_headers(),
-                    params={"domain": domain},
-                )
-
-                if response.status_code == 404:
-                    return []
-
-                response.raise_for_status()
-                breaches = response.json()
-                return [self._parse_breach(b) for b in breaches]
+            response = await self._get(
+                _HIBP_API_BASE + "/breaches",
+                params={"domain": domain},
+            )
+
+            if response.status_code == 404:
+                return []
+
+            response.raise_for_status()
+            breaches = response.json()
+            return [self._parse_breach(b) for b in breaches]
 
         except Exception as exc:
             logger.error("HIBP domain check failed for %s: %s", domain, exc)
@@ -93,25 +93,27 @@ class NvdClient:
         """Parse an nvdlib CVE object into a CveResult."""
         cve_id = getattr(cve_obj, "id", "")
 
-        description = ""
-        if hasattr(cve_obj, "descriptions"):
-            for desc in cve_obj.descriptions:
-                if desc.lang == "en":
-                    description = desc.value[:1000]
-                    break
+        # First English description; stops at the first match
+        description = next(
+            (d.value[:1000] for d in getattr(cve_obj, "descriptions", None) or () if d.lang == "en"), "",
+        )
 
         severity = ""
         cvss_score = 0.0
-        if hasattr(cve_obj, "metrics") and cve_obj.metrics:
-            if hasattr(cve_obj.metrics, "cvssMetricV31") and cve_obj.metrics.cvssMetricV31:
-                m = cve_obj.metrics.cvssMetricV31[0]
-                if hasattr(m, "cvssData"):
-                    cvss_score = m.cvssData.baseScore
-                    severity = m.cvssData.baseSeverity
-            elif hasattr(cve_obj.metrics, "cvssMetricV2") and cve_obj.metrics.cvssMetricV2:
-                m = cve_obj.metrics.cvssMetricV2[0]
-                if hasattr(m, "cvssData"):
-                    cvss_score = m.cvssData.baseScore
+        # getattr() with a default stands in for each hasattr() + attribute pair
+        metrics = getattr(cve_obj, "metrics", None)
+        v31 = getattr(metrics, "cvssMetricV31", None)
+        if v31:
+            data = getattr(v31[0], "cvssData", None)
+            if data is not None:
+                cvss_score = data.baseScore
+                severity = data.baseSeverity
+        else:
+            v2 = getattr(metrics, "cvssMetricV2", None)
+            if v2:
+                data = getattr(v2[0], "cvssData", None)
+                if data is not None:
+                    cvss_score = data.baseScore
 
         published = ""
         if hasattr(cve_obj, "published"):
@@ -5,7 +5,7 @@ hashes against the VirusTotal threat intelligence database.
 """
 
 import logging
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
@@ -20,9 +20,17 @@ _VT_API_BASE = "https://www.virustotal.com/api/v3"
 class VirusTotalClient:
     """Async client for the VirusTotal API v3."""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, client: Optional[httpx.AsyncClient] = None) -> None:
         self._api_key = api_key
         self._headers = {"x-apikey": api_key}
+        self._client = client
+
+    async def _get(self, url: str) -> httpx.Response:
+        """GET *url* on the shared client, or a one-off client if none was given."""
+        if self._client is not None:
+            return await self._client.get(url, headers=self._headers, timeout=30.0)
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            return await client.get(url, headers=self._headers)
 
     async def _request(self, endpoint: str) -> dict[str, Any]:
         """Make an authenticated GET request to the VT API.
@@ -35,13 +43,9 @@ class VirusTotalClient:
         """
         try:
             await rate_limiter.acquire("virustotal")
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    _VT_API_BASE + endpoint,
-                    headers=self._headers,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get(_VT_API_BASE + endpoint)
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as exc:
             logger.error("VT API error %d for %s: %s", exc.response.status_code, endpoint, exc)
             return {"error": str(exc)}
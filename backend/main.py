@@ -11,10 +11,15 @@ from typing import AsyncGenerator
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from backend.config import get_settings
 from backend.database import db
 from backend.routers import assistant, exploit, health, logs, osint, recon, reports, seek_enter, settings as settings_router, stats, threat, vuln, websocket
+from backend.services.exploit_service import ExploitService
+from backend.services.osint_service import OsintService
+from backend.services.recon_service import ReconService
+from backend.services.vuln_service import VulnService
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +34,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Startup:
         - Initialise the SQLite database and run migrations.
+        - Open the shared keep-alive HTTP clients for OSINT integrations,
+          recon scanners, header analysis and NVD dependency lookups, and
+          the exploit scanners' connection pool.
     Shutdown:
+        - Close the shared HTTP clients and connection pool.
         - Close the database connection cleanly.
     """
     # -- Startup --
     logger.info("CyberLancer API starting up")
     await db.init_db()
     logger.info("Database ready")
+    await OsintService.open_http_client()
+    await ReconService.open_http_clients()
+    await VulnService.open_http_clients()
+    await ExploitService.open_http_transport()
 
     yield
 
     # -- Shutdown --
     logger.info("CyberLancer API shutting down")
+    await OsintService.close_http_client()
+    await ReconService.close_http_clients()
+    await VulnService.close_http_clients()
+    await ExploitService.close_http_transport()
     await db.close()
     logger.info("Cleanup complete")
 
@@ -68,6 +85,11 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # -- Compression --
+    # Recon results and history pages are often tens of KB of JSON;
+    # small responses are left uncompressed.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # -- Routers --
     app.include_router(health.router, prefix="/api")
     app.include_router(recon.router, prefix="/api")
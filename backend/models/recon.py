@@ -37,12 +37,21 @@ class WhoisResult(BaseModel):
     name_servers: list[str] = Field(default_factory=list, description="Authoritative name servers.")
     status: list[str] = Field(default_factory=list, description="Domain status codes.")
     raw: dict[str, Any] = Field(default_factory=dict, description="Raw WHOIS data.")
+    frontend_fields: list[dict[str, str]] = Field(
+        default_factory=list,
+        exclude=True,
+        description="Pre-formatted label/value rows for the frontend WHOIS view.",
+    )
 
 
 class DnsRecord(BaseModel):
     """A single DNS resource record."""
 
-    record_type: str = Field(..., description="Record type: A, AAAA, MX, NS, TXT, CNAME, SOA.")
+    record_type: str = Field(
+        ...,
+        serialization_alias="type",
+        description="Record type: A, AAAA, MX, NS, TXT, CNAME, SOA. Serialized by alias as 'type'.",
+    )
     name: str = Field(..., description="Record name / owner.")
     value: str = Field(..., description="Record data / value.")
     ttl: int = Field(default=0, ge=0, description="Time-to-live in seconds.")
@@ -51,7 +60,11 @@ class DnsRecord(BaseModel):
 class TechStackResult(BaseModel):
     """A detected technology from HTTP fingerprinting."""
 
-    technology: str = Field(..., description="Technology name (e.g. nginx, React).")
+    technology: str = Field(
+        ...,
+        serialization_alias="name",
+        description="Technology name (e.g. nginx, React). Serialized by alias as 'name'.",
+    )
     category: str = Field(default="", description="Category: server, framework, cms, etc.")
     version: str = Field(default="", description="Detected version string.")
     confidence: float = Field(default=1.0, ge=0.0, le=1.0, description="Detection confidence 0-1.")
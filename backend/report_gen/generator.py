@@ -17,11 +17,23 @@ _jinja_env = Environment(
     autoescape=True,
 )
 
+# Severity rows rendered in the Markdown statistics block, in display order
+_SEV_ROWS: tuple[tuple[str, str], ...] = (
+    ("critical", "Critical"),
+    ("high", "High"),
+    ("medium", "Medium"),
+    ("low", "Low"),
+    ("info", "Info"),
+)
+
 
 def render_html(report_data: dict, template_name: str) -> str:
-    """Render report data into an HTML string using a Jinja2 template."""
-    template = _jinja_env.get_template(template_name)
-    return template.render(report=report_data)
+    """Render report data into an HTML string using a Jinja2 template.
+
+    The environment caches compiled templates itself and reloads them
+    when the file changes.
+    """
+    return _jinja_env.get_template(template_name).render(report=report_data)
 
 
 def html_to_pdf(html: str, output_path: str) -> str:
@@ -38,6 +50,25 @@ def html_to_pdf(html: str, output_path: str) -> str:
     return output_path
 
 
+def _trim(text: str, limit: int) -> str:
+    """Return *text* cut to *limit* characters, slicing only when it is longer."""
+    return text if len(text) <= limit else text[:limit]
+
+
+def _finding_label(finding: dict) -> str:
+    """Pick the display name for a finding row.
+
+    Uses the first non-empty label key and only falls back to
+    ``str(finding)`` when none of them has a value.
+    """
+    return (
+        finding.get("name")
+        or finding.get("title")
+        or finding.get("host")
+        or _trim(str(finding), 50)
+    )
+
+
 def render_markdown(report_data: dict) -> str:
     """Render report data as a Markdown document."""
     lines: list[str] = []
@@ -67,10 +98,9 @@ def render_markdown(report_data: dict) -> str:
         lines.append("")
         lines.append(f"- **Total Scans:** {stats.get('total_scans', 0)}")
         lines.append(f"- **Total Findings:** {stats.get('total_findings', 0)}")
-        sev_counts = stats.get("severity_counts", {})
-        for sev_name in ["critical", "high", "medium", "low", "info"]:
-            count = sev_counts.get(sev_name, 0)
-            lines.append(f"- **{sev_name.capitalize()}:** {count}")
+        sev_get = stats.get("severity_counts", {}).get
+        for sev_name, label in _SEV_ROWS:
+            lines.append(f"- **{label}:** {sev_get(sev_name, 0)}")
         lines.append("")
 
     # Scan Results
@@ -98,10 +128,10 @@ def render_markdown(report_data: dict) -> str:
                     lines.append("|---|---------|----------|")
                     for idx, anom in enumerate(anomalies[:20], 1):
                         if isinstance(anom, dict):
-                            reason = anom.get("reason", "Unknown")[:60]
+                            reason = _trim(anom.get("reason", "Unknown"), 60)
                             asev = anom.get("severity", "info")
                         else:
-                            reason = str(anom)[:60]
+                            reason = _trim(str(anom), 60)
                             asev = "info"
                         lines.append(f"| {idx} | {reason} | {asev} |")
                     if len(anomalies) > 20:
@@ -120,10 +150,10 @@ def render_markdown(report_data: dict) -> str:
                     lines.append("|---|---------|----------|")
                     for idx, finding in enumerate(results[:20], 1):
                         if isinstance(finding, dict):
-                            name = finding.get("name", finding.get("title", finding.get("host", str(finding)[:50])))
-                            fsev = finding.get("severity", finding.get("risk", "info"))
+                            name = _finding_label(finding)
+                            fsev = finding.get("severity") or finding.get("risk") or "info"
                         else:
-                            name = str(finding)[:50]
+                            name = _trim(str(finding), 50)
                             fsev = "info"
                         lines.append(f"| {idx} | {name} | {fsev} |")
                     if len(results) > 20:
@@ -10,6 +10,7 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from backend.services.exploit_service import exploit_service
@@ -17,7 +18,7 @@ from backend.utils.progress import ProgressEmitter
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/exploit", tags=["exploit"])
+router = APIRouter(prefix="/api/exploit", tags=["exploit"], default_response_class=ORJSONResponse)
 
 
 class ExploitRequest(BaseModel):
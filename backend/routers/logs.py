@@ -33,15 +33,9 @@ async def analyze_logs(request: LogAnalysisRequest) -> dict[str, Any]:
             scan_id=scan_id,
             emitter=emitter,
         )
-        return {
-            "scan_id": scan_id,
-            "entries": [e.model_dump() for e in result.entries],
-            "total_lines": result.total_lines,
-            "parsed_lines": result.parsed_lines,
-            "format_detected": result.format_detected,
-            "anomalies": [a.model_dump() for a in result.anomalies],
-            "statistics": result.statistics,
-        }
+        # One model_dump over the whole result serializes entries and
+        # anomalies in a single pydantic-core pass.
+        return {"scan_id": scan_id, **result.model_dump()}
     except Exception as exc:
         logger.error("Log analysis failed: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -76,16 +70,7 @@ async def upload_log_file(
             scan_id=scan_id,
             emitter=emitter,
         )
-        return {
-            "scan_id": scan_id,
-            "filename": file.filename,
-            "entries": [e.model_dump() for e in result.entries],
-            "total_lines": result.total_lines,
-            "parsed_lines": result.parsed_lines,
-            "format_detected": result.format_detected,
-            "anomalies": [a.model_dump() for a in result.anomalies],
-            "statistics": result.statistics,
-        }
+        return {"scan_id": scan_id, "filename": file.filename, **result.model_dump()}
     except Exception as exc:
         logger.error("Log file analysis failed: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -3,38 +3,59 @@
 Provides endpoints for Shodan, VirusTotal, HIBP, and reputation lookups.
 """
 
+import asyncio
 import logging
 from typing import Any
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+import aiosqlite
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
 
-from backend.database import db
+from backend.database import get_read_connection
 from backend.models.base import ScanRequest
+from backend.models.osint import BreachResult, ReputationResult, ShodanHostResult, VirusTotalResult
 from backend.services.osint_service import OsintService
 from backend.utils.validators import sanitize_input, validate_domain, validate_ip
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/osint", tags=["osint"])
 
+# Serializes a whole breach list in one pydantic-core pass
+_BREACH_LIST = TypeAdapter(list[BreachResult])
 
-def _get_api_key(service: str) -> str:
-    """Retrieve an API key from the OS keyring."""
+# VirusTotal vendor verdict indexed by bool(detected)
+_VT_VERDICT = ("clean", "malicious")
+
+
+async def _get_api_key(service: str) -> str:
+    """Retrieve an API key from the OS keyring.
+
+    The keyring backend is synchronous (and may hit the OS credential
+    store), so the lookup runs in the default thread executor to keep
+    the event loop responsive.
+    """
     try:
         import keyring
-        key = keyring.get_password("cyberlancer", service)
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(None, keyring.get_password, "cyberlancer", service)
         return key or ""
     except Exception:
         return ""
 
 
-def _get_service() -> OsintService:
+async def _get_service() -> OsintService:
     """Create an OsintService with available API keys."""
+    shodan_key, virustotal_key, hibp_key = await asyncio.gather(
+        _get_api_key("shodan"),
+        _get_api_key("virustotal"),
+        _get_api_key("hibp"),
+    )
     return OsintService(
-        shodan_key=_get_api_key("shodan"),
-        virustotal_key=_get_api_key("virustotal"),
-        hibp_key=_get_api_key("hibp"),
+        shodan_key=shodan_key,
+        virustotal_key=virustotal_key,
+        hibp_key=hibp_key,
     )
 
 
@@ -50,15 +71,24 @@ class HIBPRequest(BaseModel):
     target_type: str = Field(default="email", description="One of: email, domain")
 
 
-@router.post("/shodan", summary="Shodan host lookup")
-async def shodan_lookup(request: ScanRequest) -> dict[str, Any]:
-    """Look up host intelligence from Shodan."""
+async def _ip_target(request: ScanRequest) -> str:
+    """Dependency: the sanitized request target, which must be an IP address."""
     target = sanitize_input(request.target)
     if not validate_ip(target):
         raise HTTPException(status_code=400, detail="Shodan requires a valid IP address")
-    service = _get_service()
-    scan_id = str(uuid4())
-    result = await service.run_shodan_lookup(target, scan_id)
+    return target
+
+
+async def _host_target(request: ScanRequest) -> str:
+    """Dependency: the sanitized request target, which must be an IP or domain."""
+    target = sanitize_input(request.target)
+    if not (validate_ip(target) or validate_domain(target)):
+        raise HTTPException(status_code=400, detail="Invalid target (IP or domain required)")
+    return target
+
+
+def _shodan_response(scan_id: str, target: str, result: ShodanHostResult) -> dict[str, Any]:
+    """Flatten a Shodan result to match frontend ShodanResponse."""
     data = result.model_dump()
     # Flatten to match frontend ShodanResponse: {host, ports, services, vulnerabilities}
     return {
@@ -78,24 +108,27 @@ async def shodan_lookup(request: ScanRequest) -> dict[str, Any]:
     }
 
 
-@router.post("/virustotal", summary="VirusTotal scan")
-async def virustotal_scan(request: VirusTotalRequest) -> dict[str, Any]:
-    """Scan a target against VirusTotal."""
-    target = sanitize_input(request.target)
-    service = _get_service()
-    scan_id = str(uuid4())
-    result = await service.run_virustotal_scan(target, request.target_type, scan_id)
+def _flatten_vt_vendors(vendor_results: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert per-engine VirusTotal results into frontend vendor rows."""
+    verdict = _VT_VERDICT
+    return [
+        {"vendor": k, "verdict": verdict[bool(v.get("detected"))], "detail": v.get("result", "")}
+        for k, v in vendor_results.items()
+    ]
+
+
+def _virustotal_response(
+    scan_id: str, target: str, target_type: str, result: VirusTotalResult,
+) -> dict[str, Any]:
+    """Flatten a VirusTotal result to match frontend VtResponse."""
     data = result.model_dump()
     # Flatten to match frontend VtResponse: {target, positives, total, vendors, ...}
     vendor_results = data.get("results", {})
-    vendors = [
-        {"vendor": k, "verdict": ("malicious" if v.get("detected") else "clean"), "detail": v.get("result", "")}
-        for k, v in vendor_results.items()
-    ] if isinstance(vendor_results, dict) else []
+    vendors = _flatten_vt_vendors(vendor_results) if isinstance(vendor_results, dict) else []
     return {
         "scan_id": scan_id,
         "target": data.get("target", target),
-        "targetType": data.get("target_type", request.target_type),
+        "targetType": data.get("target_type", target_type),
         "positives": data.get("positives", 0),
         "total": data.get("total", 0),
         "scanDate": data.get("scan_date", ""),
@@ -104,15 +137,47 @@ async def virustotal_scan(request: VirusTotalRequest) -> dict[str, Any]:
     }
 
 
+def _reputation_response(scan_id: str, target: str, result: ReputationResult) -> dict[str, Any]:
+    """Flatten a reputation result to match frontend ReputationResponse."""
+    data = result.model_dump()
+    # Flatten to match frontend ReputationResponse: {target, score, categories, details}
+    return {
+        "scan_id": scan_id,
+        "target": data.get("target", target),
+        "score": data.get("reputation_score", 0),
+        "categories": [{"name": c, "score": 0} for c in data.get("categories", [])],
+        "details": data.get("details", {}),
+    }
+
+
+@router.post("/shodan", summary="Shodan host lookup")
+async def shodan_lookup(target: str = Depends(_ip_target)) -> dict[str, Any]:
+    """Look up host intelligence from Shodan."""
+    service = await _get_service()
+    scan_id = str(uuid4())
+    result = await service.run_shodan_lookup(target, scan_id)
+    return _shodan_response(scan_id, target, result)
+
+
+@router.post("/virustotal", summary="VirusTotal scan")
+async def virustotal_scan(request: VirusTotalRequest) -> dict[str, Any]:
+    """Scan a target against VirusTotal."""
+    target = sanitize_input(request.target)
+    service = await _get_service()
+    scan_id = str(uuid4())
+    result = await service.run_virustotal_scan(target, request.target_type, scan_id)
+    return _virustotal_response(scan_id, target, request.target_type, result)
+
+
 @router.post("/hibp", summary="HIBP breach check")
 async def hibp_check(request: HIBPRequest) -> dict[str, Any]:
     """Check for data breaches via Have I Been Pwned."""
     target = sanitize_input(request.target)
-    service = _get_service()
+    service = await _get_service()
     scan_id = str(uuid4())
     results = await service.run_hibp_check(target, request.target_type, scan_id)
     # Flatten to match frontend BreachResponse: {target, totalBreaches, breaches}
-    breaches = [r.model_dump() for r in results]
+    breaches = _BREACH_LIST.dump_python(results)
     return {
         "scan_id": scan_id,
         "target": target,
@@ -121,24 +186,52 @@ async def hibp_check(request: HIBPRequest) -> dict[str, Any]:
     }
 
 
-@router.post("/reputation", summary="Reputation check")
-async def reputation_check(request: ScanRequest) -> dict[str, Any]:
-    """Check domain/IP reputation score."""
-    target = sanitize_input(request.target)
-    if not (validate_ip(target) or validate_domain(target)):
-        raise HTTPException(status_code=400, detail="Invalid target (IP or domain required)")
-    service = _get_service()
+@router.post("/reputation", summary="Reputation check", response_class=ORJSONResponse)
+async def reputation_check(target: str = Depends(_host_target)) -> ORJSONResponse:
+    """Check domain/IP reputation score.
+
+    The payload is already JSON-ready, so it is handed straight to
+    orjson instead of going through FastAPI's jsonable_encoder walk.
+    """
+    service = await _get_service()
     scan_id = str(uuid4())
     result = await service.run_reputation_check(target, scan_id)
-    data = result.model_dump()
-    # Flatten to match frontend ReputationResponse: {target, score, categories, details}
-    return {
-        "scan_id": scan_id,
-        "target": data.get("target", target),
-        "score": data.get("reputation_score", 0),
-        "categories": [{"name": c, "score": 0} for c in data.get("categories", [])],
-        "details": data.get("details", {}),
+    return ORJSONResponse(_reputation_response(scan_id, target, result))
+
+
+@router.post("/scan-all", summary="Combined OSINT lookup")
+async def scan_all(target: str = Depends(_host_target)) -> dict[str, Any]:
+    """Run Shodan, VirusTotal, and reputation lookups for one target concurrently.
+
+    Shodan is only queried for IP targets. Each lookup keeps its own
+    scan_id and history row, and a failing lookup is reported under
+    its key instead of failing the whole request.
+    """
+    is_ip = validate_ip(target)
+    service = await _get_service()
+    target_type = "ip" if is_ip else "domain"
+    shodan_id, vt_id, rep_id = str(uuid4()), str(uuid4()), str(uuid4())
+
+    lookups = {
+        "virustotal": service.run_virustotal_scan(target, target_type, vt_id),
+        "reputation": service.run_reputation_check(target, rep_id),
     }
+    if is_ip:
+        lookups["shodan"] = service.run_shodan_lookup(target, shodan_id)
+    outcomes = dict(zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)))
+
+    response: dict[str, Any] = {"target": target, "targetType": target_type, "shodan": None}
+    for name, outcome in outcomes.items():
+        if isinstance(outcome, BaseException):
+            logger.error("Combined OSINT %s lookup failed for %s: %s", name, target, outcome)
+            response[name] = {"error": str(outcome)}
+        elif name == "shodan":
+            response[name] = _shodan_response(shodan_id, target, outcome)
+        elif name == "virustotal":
+            response[name] = _virustotal_response(vt_id, target, target_type, outcome)
+        else:
+            response[name] = _reputation_response(rep_id, target, outcome)
+    return response
 
 
 @router.get("/history", summary="OSINT scan history")
@@ -146,12 +239,12 @@ async def osint_history(
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
     search: str = Query(default="", max_length=200),
+    conn: aiosqlite.Connection = Depends(get_read_connection),
 ) -> dict[str, Any]:
     """List past OSINT scans with pagination and optional target search."""
-    conn = await db.get_connection()
     offset = (page - 1) * per_page
-    params: list = ["osint_%"]
-    where = "WHERE module LIKE ?"
+    params: list = ["osint"]
+    where = "WHERE module_kind = ?"
     if search:
         where += " AND target LIKE ?"
         params.append(f"%{search}%")
@@ -5,11 +5,15 @@ WHOIS lookups, DNS analysis, and technology fingerprinting.
 """
 
 import logging
-from typing import Any
+import random
+import re
+from typing import Any, AsyncIterator
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_json
 
 from backend.database import db
 from backend.models.base import ScanRequest
@@ -23,13 +27,123 @@ from backend.models.recon import (
 )
 from backend.routers.websocket import manager
 from backend.services.recon_service import ReconService
+from backend.utils.pagination import decode_cursor, encode_cursor
 from backend.utils.progress import ProgressEmitter
+from backend.utils.ttl_cache import AsyncTTLCache
 from backend.utils.validators import sanitize_input, validate_domain, validate_ip, validate_ip_range, validate_url
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/recon", tags=["recon"])
+router = APIRouter(prefix="/recon", tags=["recon"], default_response_class=ORJSONResponse)
 _service = ReconService()
 
+# Whole-list serializers: one pydantic-core pass per response instead of
+# a model_dump() call per row. DNS and tech rows dump by alias so the
+# frontend gets 'type' and 'name' keys.
+_SUBDOMAIN_LIST = TypeAdapter(list[SubdomainResult])
+_PORT_LIST = TypeAdapter(list[PortScanResult])
+_DNS_LIST = TypeAdapter(list[DnsRecord])
+_TECH_LIST = TypeAdapter(list[TechStackResult])
+
+_NDJSON = "application/x-ndjson"
+
+
+def _wants_ndjson(http_request: Request) -> bool:
+    """Return True if the client asked for a streamed NDJSON response."""
+    return _NDJSON in http_request.headers.get("accept", "")
+
+
+def _ndjson_response(lines: AsyncIterator[Any]) -> StreamingResponse:
+    """Stream each yielded object as one JSON line.
+
+    Models are dumped by field name, matching the model_dump() payloads
+    of the non-streamed responses.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        async for line in lines:
+            yield to_json(line, by_alias=False) + b"\n"
+
+    return StreamingResponse(body(), media_type=_NDJSON, headers={"Cache-Control": "no-cache"})
+
+# Repeat DNS/WHOIS lookups for the same domain are served from memory.
+# DNS entries live for the smallest record TTL; WHOIS for 6 hours, since
+# registration data rarely changes and WHOIS servers rate-limit hard.
+# Subdomain and tech scans go through the same cache with a zero TTL, so
+# concurrent identical requests share one upstream run but nothing is kept.
+_DNS_MAX_TTL = 3600.0
+_DNS_EMPTY_TTL = 60.0
+_WHOIS_TTL = 6 * 3600.0
+_WHOIS_ERROR_TTL = 60.0
+_WHOIS_BACKOFF_MAX = 3600.0
+_lookup_cache = AsyncTTLCache(maxsize=2048, ttl=_WHOIS_TTL)
+
+# Consecutive rate-limited WHOIS failures per domain, for backoff
+_whois_failures = AsyncTTLCache(maxsize=2048, ttl=2 * _WHOIS_BACKOFF_MAX)
+_RATE_LIMIT_RE = re.compile(r"rate.?limit|too many|exceeded|quota|try again later", re.IGNORECASE)
+
+
+def _dns_ttl(records: list[DnsRecord]) -> float:
+    """Cache DNS answers no longer than the shortest record TTL."""
+    if not records:
+        return _DNS_EMPTY_TTL
+    return min(_DNS_MAX_TTL, min(r.ttl for r in records))
+
+
+def _whois_ttl(result: WhoisResult) -> float:
+    """Cache failed WHOIS lookups only briefly so they are retried.
+
+    Rate-limit failures back off exponentially with jitter, so a domain
+    whose WHOIS server keeps refusing us is retried less and less often
+    (capped at an hour) instead of once a minute.
+    """
+    key = result.domain.lower()
+    error = result.raw.get("error")
+    if error is None:
+        _whois_failures.invalidate(key)
+        return _WHOIS_TTL
+    if not _RATE_LIMIT_RE.search(str(error)):
+        return _WHOIS_ERROR_TTL
+    failures = _whois_failures.get(key, 0)
+    _whois_failures.set(key, failures + 1)
+    backoff = _WHOIS_ERROR_TTL * (2 ** failures) * random.uniform(0.5, 1.5)
+    return min(_WHOIS_BACKOFF_MAX, backoff)
+
+
+async def _cached_dns(domain: str) -> list[DnsRecord]:
+    """Run DNS analysis through the TTL cache, coalescing concurrent lookups."""
+    return await _lookup_cache.get_or_compute(
+        ("dns", domain.lower()), lambda: _service.run_dns_analysis(domain), ttl=_dns_ttl,
+    )
+
+
+async def _cached_whois(domain: str) -> WhoisResult:
+    """Run a WHOIS lookup through the TTL cache, coalescing concurrent lookups."""
+    return await _lookup_cache.get_or_compute(
+        ("whois", domain.lower()), lambda: _service.run_whois(domain), ttl=_whois_ttl,
+    )
+
+
+async def _coalesced_subdomains(domain: str) -> tuple[str, list[SubdomainResult]]:
+    """Enumerate subdomains, sharing one scan between concurrent identical requests.
+
+    Results are not cached (TTL 0); callers that arrive while a scan for
+    the same domain is running receive that scan's id and results.
+    """
+
+    async def scan() -> tuple[str, list[SubdomainResult]]:
+        scan_id = uuid4().hex
+        emitter = ProgressEmitter(manager, scan_id)
+        return scan_id, await _service.run_subdomain_scan(domain, scan_id, emitter)
+
+    return await _lookup_cache.get_or_compute(("subdomains", domain.lower()), scan, ttl=0)
+
+
+async def _coalesced_tech(url: str) -> list[TechStackResult]:
+    """Fingerprint *url*, sharing one fetch between concurrent identical requests."""
+    return await _lookup_cache.get_or_compute(
+        ("tech", url), lambda: _service.run_tech_fingerprint(url), ttl=0,
+    )
+
 
 class PortScanRequest(BaseModel):
     """Request body for port scanning."""
@@ -49,69 +163,83 @@ async def subdomain_scan(request: ScanRequest) -> dict[str, Any]:
     domain = sanitize_input(request.target)
     if not validate_domain(domain):
         raise HTTPException(status_code=400, detail="Invalid domain name")
-    scan_id = str(uuid4())
-    emitter = ProgressEmitter(manager, scan_id)
-    results = await _service.run_subdomain_scan(domain, scan_id, emitter)
+    scan_id, results = await _coalesced_subdomains(domain)
     return {
         "scan_id": scan_id,
         "target": domain,
-        "subdomains": [r.model_dump() for r in results],
+        "subdomains": _SUBDOMAIN_LIST.dump_python(results),
         "total": len(results),
     }
 
 
-@router.post("/ports", summary="Port scan")
-async def port_scan(request: PortScanRequest) -> dict[str, Any]:
-    """Scan ports on the given target."""
+@router.post("/ports", summary="Port scan", response_model=None)
+async def port_scan(request: PortScanRequest, http_request: Request) -> dict[str, Any] | StreamingResponse:
+    """Scan ports on the given target.
+
+    With ``Accept: application/x-ndjson`` the response is streamed: a
+    header line, one line per open port as it is found, and a summary
+    line with the totals, or an ``{"error"}`` line if the scan fails.
+    """
     target = sanitize_input(request.target)
-    if not (validate_ip_range(target) or validate_domain(target)):
+    # Domain first: a single regex match, whereas validate_ip_range
+    # raises and catches several ValueErrors before rejecting a hostname.
+    if not (validate_domain(target) or validate_ip_range(target)):
         raise HTTPException(status_code=400, detail="Invalid target (IP, IP range, CIDR, or domain required)")
-    scan_id = str(uuid4())
+    scan_id = uuid4().hex
     emitter = ProgressEmitter(manager, scan_id)
+    if _wants_ndjson(http_request):
+        return _ndjson_response(_stream_ports(target, request.resolved_ports, scan_id, emitter))
     results, hosts_alive = await _service.run_port_scan(target, request.resolved_ports, scan_id, emitter)
     return {
         "scan_id": scan_id,
         "target": target,
         "portRange": request.resolved_ports,
-        "ports": [r.model_dump() for r in results],
+        "ports": _PORT_LIST.dump_python(results),
         "total": len(results),
         "openPorts": len(results),
         "hostsAlive": hosts_alive,
     }
 
 
+async def _stream_ports(
+    target: str, ports: str, scan_id: str, emitter: ProgressEmitter,
+) -> AsyncIterator[Any]:
+    """Yield the NDJSON lines of a streamed port scan.
+
+    A failed scan ends with an ``{"error"}`` line instead of the totals.
+    """
+    yield {"scan_id": scan_id, "target": target, "portRange": ports}
+    alive_hosts: set[str] = set()
+    total = 0
+    try:
+        async for result in _service.stream_port_scan(target, ports, scan_id, emitter, alive_hosts):
+            total += 1
+            yield result
+    except Exception as exc:
+        yield {"error": str(exc)}
+        return
+    yield {"total": total, "openPorts": total, "hostsAlive": len(alive_hosts)}
+
+
 @router.post("/whois", summary="WHOIS lookup")
 async def whois_lookup(request: ScanRequest) -> dict[str, Any]:
     """Perform a WHOIS lookup for the given domain."""
     domain = sanitize_input(request.target)
     if not validate_domain(domain):
         raise HTTPException(status_code=400, detail="Invalid domain name")
-    result = await _service.run_whois(domain)
-    data = result.model_dump()
-    # Add camelCase aliases expected by the frontend
-    data["createdDate"] = data.get("creation_date", "")
-    data["expiresDate"] = data.get("expiration_date", "")
-    data["updatedDate"] = data.get("updated_date", "")
-    data["nameServers"] = data.get("name_servers", [])
-    data["registrant"] = data.get("registrant", "")
-    # Build fields array for the frontend WhoisResponse type
-    data["fields"] = [
-        {"label": k.replace("_", " ").title(), "value": str(v)[:200]}
-        for k, v in data.items()
-        if k not in ("raw", "fields", "createdDate", "expiresDate", "updatedDate", "nameServers")
-        and v and not isinstance(v, (dict, list))
-    ]
-    # Return flat structure matching frontend WhoisResponse type
+    result = await _cached_whois(domain)
+    # Flat structure matching frontend WhoisResponse type. The model has
+    # no updated date or registrant, so those stay empty.
     return {
-        "domain": data.get("domain", domain),
-        "registrar": data.get("registrar", ""),
-        "createdDate": data["createdDate"],
-        "expiresDate": data["expiresDate"],
-        "updatedDate": data["updatedDate"],
-        "nameServers": data["nameServers"],
-        "status": data.get("status", []),
-        "registrant": data["registrant"],
-        "fields": data["fields"],
+        "domain": result.domain or domain,
+        "registrar": result.registrar,
+        "createdDate": result.creation_date,
+        "expiresDate": result.expiration_date,
+        "updatedDate": "",
+        "nameServers": result.name_servers,
+        "status": result.status,
+        "registrant": "",
+        "fields": result.frontend_fields,
     }
 
 
@@ -121,16 +249,11 @@ async def dns_analysis(request: ScanRequest) -> dict[str, Any]:
     domain = sanitize_input(request.target)
     if not validate_domain(domain):
         raise HTTPException(status_code=400, detail="Invalid domain name")
-    results = await _service.run_dns_analysis(domain)
-    records = []
-    for r in results:
-        d = r.model_dump()
-        d["type"] = d.pop("record_type", d.get("type", ""))
-        records.append(d)
+    results = await _cached_dns(domain)
     return {
         "target": domain,
         "domain": domain,
-        "records": records,
+        "records": _DNS_LIST.dump_python(results, by_alias=True),
     }
 
 
@@ -141,59 +264,97 @@ async def tech_fingerprint(request: ScanRequest) -> dict[str, Any]:
     url = target if target.startswith("http") else "https://" + target
     if not validate_url(url):
         raise HTTPException(status_code=400, detail="Invalid URL")
-    results = await _service.run_tech_fingerprint(url)
-    technologies = []
-    for r in results:
-        d = r.model_dump()
-        d["name"] = d.pop("technology", d.get("name", ""))
-        technologies.append(d)
+    results = await _coalesced_tech(url)
     return {
         "target": url,
         "url": url,
-        "technologies": technologies,
+        "technologies": _TECH_LIST.dump_python(results, by_alias=True),
     }
 
 
-@router.post("/full", summary="Full reconnaissance scan")
-async def full_recon(request: ScanRequest) -> dict[str, Any]:
-    """Run a full reconnaissance scan on the target."""
+@router.post("/full", summary="Full reconnaissance scan", response_model=None)
+async def full_recon(request: ScanRequest, http_request: Request) -> dict[str, Any] | StreamingResponse:
+    """Run a full reconnaissance scan on the target.
+
+    With ``Accept: application/x-ndjson`` the response is streamed: a
+    header line followed by one ``{"phase", "data"}`` line per completed
+    phase, keyed by the ReconFullResult field names, and a final
+    ``{"error"}`` line if the scan fails.
+    """
     target = sanitize_input(request.target)
     if not validate_domain(target):
         raise HTTPException(status_code=400, detail="Invalid domain name")
-    scan_id = str(uuid4())
+    scan_id = uuid4().hex
     emitter = ProgressEmitter(manager, scan_id)
+    if _wants_ndjson(http_request):
+        return _ndjson_response(_stream_full_recon(target, scan_id, emitter))
     result = await _service.run_full_recon(target, scan_id, emitter)
     return {"scan_id": scan_id, "target": target, "result": result.model_dump()}
 
 
+async def _stream_full_recon(target: str, scan_id: str, emitter: ProgressEmitter) -> AsyncIterator[Any]:
+    """Yield the NDJSON lines of a streamed full recon scan.
+
+    A failed scan ends with an ``{"error"}`` line after the completed phases.
+    """
+    yield {"scan_id": scan_id, "target": target}
+    try:
+        async for phase, value in _service.iter_full_recon(target, scan_id, emitter):
+            yield {"phase": phase, "data": value}
+    except Exception as exc:
+        yield {"error": str(exc)}
+
+
+# History SQL is assembled from fixed pieces so each filter combination
+# always yields the same text and hits the connection's statement cache.
+_HISTORY_SELECT = (
+    "SELECT id, module, target, status, started_at, completed_at, result_count "
+    "FROM scan_history"
+)
+_HISTORY_ORDER = "ORDER BY started_at DESC, id DESC LIMIT ?"
+
+
 @router.get("/history", summary="Recon scan history")
 async def recon_history(
-    page: int = Query(default=1, ge=1),
+    cursor: str | None = Query(default=None, max_length=512),
     per_page: int = Query(default=20, ge=1, le=100),
     search: str = Query(default="", max_length=200),
+    include_total: bool = Query(default=False),
 ) -> dict[str, Any]:
-    """List past recon scans with pagination and optional target search."""
+    """List past recon scans, newest first, with optional target search.
+
+    Pages are keyed on ``(started_at, id)``: pass the previous response's
+    ``next_cursor`` to fetch the following page. ``next_cursor`` is None
+    on the last page. ``total`` is only counted when ``include_total`` is
+    set, since the count scans every matching row; otherwise it is None.
+    """
     conn = await db.get_connection()
-    offset = (page - 1) * per_page
-    params: list = ["recon_%"]
-    where = "WHERE module LIKE ?"
+    params: list = ["recon"]
+    where = "WHERE module_kind = ?"
     if search:
         where += " AND target LIKE ?"
         params.append(f"%{search}%")
-    count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt FROM scan_history {where}", params)
-    total = (await count_cursor.fetchone())["cnt"]
-    cursor = await conn.execute(
-        f"SELECT id, module, target, status, started_at, completed_at, result_count "
-        f"FROM scan_history {where} ORDER BY started_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
+    total = None
+    if include_total:
+        count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt FROM scan_history {where}", params)
+        total = (await count_cursor.fetchone())["cnt"]
+    if cursor:
+        try:
+            params.extend(decode_cursor(cursor))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        where += " AND (started_at, id) < (?, ?)"
+    # Fetch one extra row to learn whether another page follows
+    rows_cursor = await conn.execute(
+        f"{_HISTORY_SELECT} {where} {_HISTORY_ORDER}", params + [per_page + 1],
     )
-    rows = await cursor.fetchall()
+    rows = await rows_cursor.fetchall()
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(rows[-1]["started_at"], rows[-1]["id"])
     return {
-        "scans": [
-            {"id": row["id"], "module": row["module"], "target": row["target"],
-             "status": row["status"], "started_at": row["started_at"],
-             "completed_at": row["completed_at"], "result_count": row["result_count"]}
-            for row in rows
-        ],
-        "total": total, "page": page, "per_page": per_page,
+        # The SELECT lists exactly the response keys
+        "scans": [dict(row) for row in rows],
+        "total": total, "per_page": per_page, "next_cursor": next_cursor,
     }
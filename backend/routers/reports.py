@@ -8,16 +8,17 @@ import logging
 from typing import Any
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse, ORJSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 
 from backend.routers.websocket import manager
 from backend.services.report_service import report_service
+from backend.utils.pagination import decode_cursor, encode_cursor
 from backend.utils.progress import ProgressEmitter
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/reports", tags=["reports"])
+router = APIRouter(prefix="/reports", tags=["reports"], default_response_class=ORJSONResponse)
 
 
 class GenerateReportRequest(BaseModel):
@@ -31,7 +32,7 @@ class GenerateReportRequest(BaseModel):
 @router.post("/generate", summary="Generate a report")
 async def generate_report(request: GenerateReportRequest) -> dict[str, Any]:
     """Generate a new report from selected scan results."""
-    scan_id = str(uuid4())
+    scan_id = uuid4().hex
     emitter = ProgressEmitter(manager, scan_id)
     try:
         report = await report_service.generate_report(
@@ -49,10 +50,31 @@ async def generate_report(request: GenerateReportRequest) -> dict[str, Any]:
 
 
 @router.get("/", summary="List all reports")
-async def list_reports() -> dict[str, Any]:
-    """Return all generated reports."""
-    reports = await report_service.list_reports()
-    return {"reports": reports, "count": len(reports)}
+async def list_reports(
+    cursor: str | None = Query(default=None, max_length=512),
+    limit: int | None = Query(default=None, ge=1, le=100),
+) -> dict[str, Any]:
+    """Return generated reports, newest first.
+
+    Without ``limit`` every report is returned. With ``limit``, pages are
+    keyed on ``(created_at, id)``; pass ``next_cursor`` back as ``cursor``
+    to fetch the next page.
+    """
+    before = None
+    if cursor:
+        try:
+            before = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # Fetch one extra row to learn whether another page follows
+    reports = await report_service.list_reports(
+        limit=None if limit is None else limit + 1, before=before,
+    )
+    next_cursor = None
+    if limit is not None and len(reports) > limit:
+        reports = reports[:limit]
+        next_cursor = encode_cursor(reports[-1]["created_at"], reports[-1]["id"])
+    return {"reports": reports, "count": len(reports), "next_cursor": next_cursor}
 
 
 @router.get("/scans/available", summary="List available scans")
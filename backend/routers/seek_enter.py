@@ -4,12 +4,11 @@ Provides endpoints for CIDR host discovery (Seek) and
 exploitation (Enter) with SSE terminal streaming.
 """
 
-import json
 import logging
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.models.seek_enter import EnterRequest
@@ -18,7 +17,7 @@ from backend.utils.validators import sanitize_input, validate_ip_range
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/seek-enter", tags=["seek-enter"])
+router = APIRouter(prefix="/seek-enter", tags=["seek-enter"], default_response_class=ORJSONResponse)
 
 
 class SeekRequest(BaseModel):
@@ -72,14 +71,8 @@ async def enter_exploit(request: EnterRequest) -> StreamingResponse:
 
     Returns a Server-Sent Events (SSE) stream of terminal output.
     """
-
-    async def event_generator():
-        async for event in seek_enter_service.run_enter(request):
-            data = json.dumps(event.model_dump())
-            yield f"data: {data}\n\n"
-
     return StreamingResponse(
-        event_generator(),
+        seek_enter_service.run_enter_sse(request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
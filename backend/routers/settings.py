@@ -8,7 +8,9 @@ secure storage and SQLite for metadata.
 import json
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from backend.database import db
 from backend.models.settings import (
@@ -19,10 +21,19 @@ from backend.models.settings import (
     SettingsUpdate,
 )
 from backend.services.keystore_service import keystore
+from backend.services.vuln_service import reload_keys as reload_vuln_keys
+from backend.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/settings", tags=["settings"])
+router = APIRouter(prefix="/api/settings", tags=["settings"], default_response_class=ORJSONResponse)
+
+_SELECT_SETTINGS_SQL = "SELECT key, value_json FROM settings"
+
+# The settings view polls key listings/status together and each check is
+# an OS keyring round trip; keep answers briefly and drop them whenever a
+# key is stored or deleted.
+_keystore_cache = AsyncTTLCache(maxsize=64, ttl=30.0)
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +49,8 @@ async def store_api_key(payload: ApiKeyStore) -> dict[str, str]:
     Only metadata (service name, last 4 chars hint) is persisted in SQLite.
     """
     success = await keystore.store_key(payload.service, payload.key)
+    _keystore_cache.clear()
+    reload_vuln_keys()
     if not success:
         raise HTTPException(status_code=500, detail="Failed to store API key in keyring")
     return {"status": "ok", "message": f"API key stored for {payload.service}"}
@@ -50,7 +63,7 @@ async def list_api_keys() -> list[ApiKeyInfo]:
     Returns service names, key hints (last 4 chars), and timestamps.
     Never returns the actual API keys.
     """
-    services = await keystore.list_services()
+    services = await _keystore_cache.get_or_compute("services", keystore.list_services)
     return [
         ApiKeyInfo(
             service=svc["service"],
@@ -66,6 +79,8 @@ async def list_api_keys() -> list[ApiKeyInfo]:
 async def delete_api_key(service: str) -> dict[str, str]:
     """Delete an API key from the keyring and its metadata from the database."""
     success = await keystore.delete_key(service)
+    _keystore_cache.clear()
+    reload_vuln_keys()
     if not success:
         raise HTTPException(status_code=500, detail=f"Failed to delete API key for {service}")
     return {"status": "ok", "message": f"API key removed for {service}"}
@@ -74,7 +89,9 @@ async def delete_api_key(service: str) -> dict[str, str]:
 @router.get("/api-keys/{service}/status", summary="Check API key status")
 async def check_api_key_status(service: str) -> ApiKeyStatus:
     """Check whether an API key is configured for a specific service."""
-    configured = await keystore.is_configured(service)
+    configured = await _keystore_cache.get_or_compute(
+        ("configured", service), lambda: keystore.is_configured(service),
+    )
     return ApiKeyStatus(service=service, configured=configured)
 
 
@@ -87,19 +104,21 @@ async def check_api_key_status(service: str) -> ApiKeyStatus:
 async def get_app_settings() -> AppSettings:
     """Retrieve the current application settings."""
     conn = await db.get_connection()
-    cursor = await conn.execute(
-        "SELECT key, value_json FROM settings"
-    )
+    cursor = await conn.execute(_SELECT_SETTINGS_SQL)
     rows = await cursor.fetchall()
 
+    # Only parse values for known keys; orjson parses in C
+    fields = AppSettings.model_fields
     settings_dict: dict[str, object] = {}
-    for row in rows:
+    for key, value_json in rows:
+        if key not in fields:
+            continue
         try:
-            settings_dict[row["key"]] = json.loads(row["value_json"])
-        except (json.JSONDecodeError, TypeError):
+            settings_dict[key] = orjson.loads(value_json)
+        except (orjson.JSONDecodeError, TypeError):
             pass
 
-    return AppSettings(**{k: v for k, v in settings_dict.items() if k in AppSettings.model_fields})
+    return AppSettings(**settings_dict)
 
 
 @router.put("/app", summary="Update an application setting")
@@ -5,19 +5,81 @@ dashboard, including scan counts, vulnerability metrics, and
 recent activity data.
 """
 
+import hashlib
 import logging
+from dataclasses import dataclass
 from typing import Any
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from backend.database import db
+from backend.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/stats", tags=["stats"])
+router = APIRouter(prefix="/stats", tags=["stats"], default_response_class=ORJSONResponse)
+
+# scan_type_lc/severity_lc are indexed generated columns (see database.py).
+# Every module writes scan types as '<module>_<kind>', so anchored GLOB
+# prefixes match the same rows as a substring search while staying
+# index-eligible.
+_COUNTS_SQL = (
+    "SELECT "
+    "(SELECT COUNT(*) FROM scan_history) AS total_scans, "
+    "(SELECT COUNT(*) FROM scan_results "
+    " WHERE scan_type_lc GLOB 'vuln*' "
+    " OR severity_lc IN ('critical', 'high')) AS vulnerabilities_found, "
+    "(SELECT COUNT(*) FROM scan_results "
+    " WHERE scan_type_lc GLOB 'threat*' "
+    " OR scan_type_lc GLOB 'osint*') AS threats_detected, "
+    "(SELECT COUNT(*) FROM reports) AS reports_generated"
+)
+
+_RECENT_SCANS_SQL = (
+    "SELECT id, module, target, status, started_at "
+    "FROM scan_history "
+    "ORDER BY started_at DESC "
+    "LIMIT 5"
+)
+
+_MODULE_ACTIVITY_SQL = (
+    "SELECT module, COUNT(*) as count "
+    "FROM scan_history "
+    "GROUP BY module "
+    "ORDER BY count DESC"
+)
+
+# Dashboards poll this endpoint; keep the last computed payload for a
+# few seconds, keyed by the writer connection's change counter so any
+# committed write invalidates it immediately.
+_DASHBOARD_TTL = 5.0
+_dashboard_cache = AsyncTTLCache(maxsize=1, ttl=_DASHBOARD_TTL)
+
+
+@dataclass(slots=True)
+class DashboardStats:
+    """Fixed-shape dashboard payload, serialized directly by orjson."""
+
+    total_scans: int
+    vulnerabilities_found: int
+    threats_detected: int
+    reports_generated: int
+    recent_scans: list[dict[str, Any]]
+    module_activity: list[dict[str, Any]]
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match covers *etag*."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
 
 
 @router.get("/dashboard", summary="Dashboard statistics")
-async def dashboard_stats() -> dict[str, Any]:
+async def dashboard_stats(request: Request) -> Response:
     """Return aggregated statistics for the dashboard.
 
     Includes:
@@ -27,75 +89,55 @@ async def dashboard_stats() -> dict[str, Any]:
         - reports_generated: count of generated reports
         - recent_scans: last 5 scans with basic metadata
         - module_activity: scan count per module for charting
+
+    Responses carry an ETag; a matching If-None-Match yields 304.
     """
     conn = await db.get_connection()
-
-    # Total scans
-    cursor = await conn.execute("SELECT COUNT(*) as cnt FROM scan_history")
-    row = await cursor.fetchone()
-    total_scans: int = row["cnt"] if row else 0
-
-    # Vulnerabilities found: scan_results where scan_type contains 'vuln'
-    # or severity is critical/high
-    cursor = await conn.execute(
-        "SELECT COUNT(*) as cnt FROM scan_results "
-        "WHERE LOWER(scan_type) LIKE '%vuln%' "
-        "OR LOWER(severity) IN ('critical', 'high')"
+    body, etag = await _dashboard_cache.get_or_compute(
+        conn.total_changes, _build_dashboard_stats,
     )
-    row = await cursor.fetchone()
-    vulnerabilities_found: int = row["cnt"] if row else 0
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    # Body is serialized once per cache fill; hits send the bytes as-is
+    return Response(content=body, media_type="application/json", headers=headers)
 
-    # Threats detected: scan_results where scan_type contains 'threat' or 'osint'
-    cursor = await conn.execute(
-        "SELECT COUNT(*) as cnt FROM scan_results "
-        "WHERE LOWER(scan_type) LIKE '%threat%' "
-        "OR LOWER(scan_type) LIKE '%osint%'"
-    )
-    row = await cursor.fetchone()
-    threats_detected: int = row["cnt"] if row else 0
 
-    # Reports generated
-    cursor = await conn.execute("SELECT COUNT(*) as cnt FROM reports")
+async def _build_dashboard_stats() -> tuple[bytes, str]:
+    """Run the dashboard queries and return (serialized body, etag)."""
+    conn = await db.get_connection()
+
+    # Headline counters, fused into one round trip:
+    #   - total scans from scan_history
+    #   - vulnerabilities: scan_results whose scan_type starts with 'vuln'
+    #     or whose severity is critical/high
+    #   - threats: scan_results whose scan_type starts with 'threat' or 'osint'
+    #   - reports generated
+    cursor = await conn.execute(_COUNTS_SQL)
     row = await cursor.fetchone()
-    reports_generated: int = row["cnt"] if row else 0
+    total_scans: int = row["total_scans"] if row else 0
+    vulnerabilities_found: int = row["vulnerabilities_found"] if row else 0
+    threats_detected: int = row["threats_detected"] if row else 0
+    reports_generated: int = row["reports_generated"] if row else 0
 
     # Recent scans (last 5)
-    cursor = await conn.execute(
-        "SELECT id, module, target, status, started_at "
-        "FROM scan_history "
-        "ORDER BY started_at DESC "
-        "LIMIT 5"
-    )
+    cursor = await conn.execute(_RECENT_SCANS_SQL)
     rows = await cursor.fetchall()
-    recent_scans: list[dict[str, Any]] = [
-        {
-            "id": r["id"],
-            "module": r["module"],
-            "target": r["target"],
-            "status": r["status"],
-            "started_at": r["started_at"],
-        }
-        for r in rows
-    ]
+    recent_scans: list[dict[str, Any]] = [dict(r) for r in rows]
 
     # Module activity: count of scans per module
-    cursor = await conn.execute(
-        "SELECT module, COUNT(*) as count "
-        "FROM scan_history "
-        "GROUP BY module "
-        "ORDER BY count DESC"
-    )
+    cursor = await conn.execute(_MODULE_ACTIVITY_SQL)
     rows = await cursor.fetchall()
-    module_activity: list[dict[str, Any]] = [
-        {"module": r["module"], "count": r["count"]}
-        for r in rows
-    ]
-
-    return {
-        "total_scans": total_scans,
-        "vulnerabilities_found": vulnerabilities_found,
-        "threats_detected": threats_detected,
-        "reports_generated": reports_generated,
-        "recent_scans": recent_scans,
-        "module_activity": module_activity,
-    }
+    module_activity: list[dict[str, Any]] = [dict(r) for r in rows]
+
+    stats = DashboardStats(
+        total_scans=total_scans,
+        vulnerabilities_found=vulnerabilities_found,
+        threats_detected=threats_detected,
+        reports_generated=reports_generated,
+        recent_scans=recent_scans,
+        module_activity=module_activity,
+    )
+    body = orjson.dumps(stats)
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return body, f'"{digest}"'
@@ -9,18 +9,26 @@ from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from backend.database import db
 from backend.routers.websocket import manager
 from backend.services.threat_service import ThreatService
 from backend.utils.progress import ProgressEmitter
+from backend.utils.ttl_cache import AsyncTTLCache
 from backend.utils.validators import sanitize_input, validate_ip, validate_domain, validate_url, validate_hash
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/threat", tags=["threat"])
+router = APIRouter(prefix="/threat", tags=["threat"], default_response_class=ORJSONResponse)
 _service = ThreatService()
 
+# GeoIP and reputation answers come from rate-limited third-party APIs and
+# change slowly; keep them per IP for 10 minutes. Concurrent lookups of the
+# same IP share one upstream call. Failed lookups are not kept.
+_IP_LOOKUP_TTL = 600.0
+_ip_cache = AsyncTTLCache(maxsize=10_000, ttl=_IP_LOOKUP_TTL)
+
 
 class IocLookupRequest(BaseModel):
     """Request body for IOC lookups."""
@@ -33,18 +41,55 @@ class IpRequest(BaseModel):
     target: str = Field(..., min_length=1, max_length=253)
 
 
+def _geo_ttl(result: dict) -> float:
+    """Cache successful geolocations only."""
+    return 0.0 if result.get("error") else _IP_LOOKUP_TTL
+
+
+def _rep_ttl(result: dict) -> float:
+    """Cache reputation checks only when every source answered."""
+    if result.get("error") or result.get("abuseipdb_error") or result.get("geoip_error"):
+        return 0.0
+    return _IP_LOOKUP_TTL
+
+
+async def _cached_geo(ip: str) -> dict:
+    """Geolocate *ip*, served from the cache when recently looked up."""
+    return await _ip_cache.get_or_compute(("geo", ip), lambda: _service.geolocate_ip(ip), ttl=_geo_ttl)
+
+
+async def _cached_rep(ip: str) -> dict:
+    """Check the reputation of *ip*, served from the cache when fresh.
+
+    A cache hit returns the earlier check as-is, including its scan_id,
+    rather than recording a new scan.
+    """
+    async def _check() -> dict:
+        scan_id = str(uuid4())
+        emitter = ProgressEmitter(manager, scan_id)
+        return await _service.check_ip_reputation(ip, scan_id, emitter)
+
+    return await _ip_cache.get_or_compute(("rep", ip), _check, ttl=_rep_ttl)
+
+
 def _detect_ioc_type(value: str) -> str:
-    """Auto-detect the IOC type from its value."""
+    """Auto-detect the IOC type from its value.
+
+    The IOC kinds have disjoint shapes, so one cheap character test picks
+    the single validator worth running instead of trying each in turn:
+    only URLs contain '://', only IPv6 addresses contain ':', hashes have
+    no '.', and anything left is an IPv4 address or a domain.
+    """
+    value = value.strip()
+    if "://" in value:
+        return "url" if validate_url(value) else "unknown"
+    if ":" in value:
+        return "ip" if validate_ip(value) else "unknown"
+    if "." not in value:
+        return "hash" if validate_hash(value)[0] else "unknown"
     if validate_ip(value):
         return "ip"
-    if validate_domain(value):
-        return "domain"
-    if validate_url(value):
-        return "url"
-    is_hash, _ = validate_hash(value)
-    if is_hash:
-        return "hash"
-    return "unknown"
+    return "domain" if validate_domain(value) else "unknown"
 
 
 @router.post("/ioc", summary="IOC lookup")
@@ -73,10 +118,7 @@ async def ip_reputation(request: IpRequest) -> dict[str, Any]:
     if not validate_ip(ip):
         raise HTTPException(status_code=400, detail="Invalid IP address")
 
-    scan_id = str(uuid4())
-    emitter = ProgressEmitter(manager, scan_id)
-    result = await _service.check_ip_reputation(ip, scan_id, emitter)
-    return result
+    return await _cached_rep(ip)
 
 
 @router.get("/feed", summary="Threat feed")
@@ -93,8 +135,13 @@ async def geoip_lookup(request: IpRequest) -> dict[str, Any]:
     if not validate_ip(ip):
         raise HTTPException(status_code=400, detail="Invalid IP address")
 
-    result = await _service.geolocate_ip(ip)
-    return result
+    return await _cached_geo(ip)
+
+
+# History rows are read positionally and zipped with these names instead
+# of going through per-key sqlite3.Row lookups.
+_HISTORY_COLUMNS = ("id", "module", "target", "status", "started_at", "completed_at", "result_count")
+_HISTORY_SELECT = ", ".join(_HISTORY_COLUMNS)
 
 
 @router.get("/history", summary="Threat intel scan history")
@@ -106,25 +153,30 @@ async def threat_history(
     """List past threat intelligence scans with pagination and optional target search."""
     conn = await db.get_connection()
     offset = (page - 1) * per_page
-    params: list = ["threat_%"]
-    where = "WHERE module LIKE ?"
+    params: list = ["threat"]
+    where = "WHERE module_kind = ?"
     if search:
         where += " AND target LIKE ?"
         params.append(f"%{search}%")
-    count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt FROM scan_history {where}", params)
-    total = (await count_cursor.fetchone())["cnt"]
+    # The total rides along on every row as a window count, saving a
+    # separate COUNT(*) round trip; rows come back as plain tuples.
     cursor = await conn.execute(
-        f"SELECT id, module, target, status, started_at, completed_at, result_count "
+        f"SELECT {_HISTORY_SELECT}, COUNT(*) OVER () AS total "
         f"FROM scan_history {where} ORDER BY started_at DESC LIMIT ? OFFSET ?",
         params + [per_page, offset],
     )
+    cursor.row_factory = None
     rows = await cursor.fetchall()
+    if rows:
+        total = rows[0][-1]
+    elif offset:
+        # Past the last page: the window saw no rows, so count directly
+        count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt FROM scan_history {where}", params)
+        total = (await count_cursor.fetchone())["cnt"]
+    else:
+        total = 0
     return {
-        "scans": [
-            {"id": row["id"], "module": row["module"], "target": row["target"],
-             "status": row["status"], "started_at": row["started_at"],
-             "completed_at": row["completed_at"], "result_count": row["result_count"]}
-            for row in rows
-        ],
+        # zip() stops at the named columns, leaving out the trailing total
+        "scans": [dict(zip(_HISTORY_COLUMNS, row)) for row in rows],
         "total": total, "page": page, "per_page": per_page,
     }
@@ -5,36 +5,69 @@ CVE lookups, dependency scanning, and full vulnerability scans.
 """
 
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
+from urllib.parse import urlsplit
 from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 
 from backend.database import db
 from backend.models.base import ScanRequest
+from backend.models.vuln import CveResult, DependencyVuln
 from backend.routers.websocket import manager
-from backend.services.vuln_service import VulnService
+from backend.services.vuln_service import get_vuln_service
 from backend.utils.progress import ProgressEmitter
-from backend.utils.validators import sanitize_input, validate_domain, validate_ip, validate_url
+from backend.utils.validators import sanitize_input, validate_domain, validate_ip
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/vuln", tags=["vulnerability"])
+router = APIRouter(prefix="/vuln", tags=["vulnerability"], default_response_class=ORJSONResponse)
 
+# Whole-list serializers: one pydantic-core pass per response instead of
+# a model_dump() call per row.
+_CVE_LIST = TypeAdapter(list[CveResult])
+_DEPENDENCY_LIST = TypeAdapter(list[DependencyVuln])
 
-def _get_api_key(service: str) -> str:
-    """Retrieve an API key from the OS keyring."""
+
+def _classify_target(raw: str) -> tuple[str, str, str]:
+    """Classify a sanitized scan target, parsing it only once.
+
+    Returns ``(kind, url, hostname)``. *kind* is ``"ip"`` or ``"domain"``
+    for a bare host, ``"url"`` for an http(s) URL, ``"host"`` for other
+    schemeless input that still forms a URL once ``https://`` is added
+    (e.g. ``localhost:8080``), or ``""`` if it is not usable. *url* is the
+    target with a scheme and *hostname* its host part.
+    """
+    if "://" not in raw:
+        if validate_ip(raw):
+            return "ip", f"https://[{raw}]" if ":" in raw else f"https://{raw}", raw
+        if validate_domain(raw):
+            return "domain", f"https://{raw}", raw
+        kind, url = "host", f"https://{raw}"
+    else:
+        kind, url = "url", raw
     try:
-        import keyring
-        key = keyring.get_password("cyberlancer", service)
-        return key or ""
-    except Exception:
-        return ""
+        parts = urlsplit(url)
+        hostname = parts.hostname or ""
+    except ValueError:
+        return "", url, ""
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return "", url, hostname
+    return kind, url, hostname
+
 
+# Header grade by pass ratio, best first; anything lower is an F
+_GRADE_THRESHOLDS = ((0.9, "A+"), (0.8, "A"), (0.6, "B"), (0.4, "C"), (0.2, "D"))
 
-def _get_service() -> VulnService:
-    """Create a VulnService with available API keys."""
-    return VulnService(nvd_api_key=_get_api_key("nvd"))
+
+def _header_grade(ratio: float) -> str:
+    """Return the letter grade for a header pass ratio."""
+    for threshold, grade in _GRADE_THRESHOLDS:
+        if ratio >= threshold:
+            return grade
+    return "F"
 
 
 class SslCheckRequest(BaseModel):
@@ -60,29 +93,27 @@ class DependencyCheckRequest(BaseModel):
 @router.post("/headers", summary="HTTP header analysis")
 async def header_analysis(request: ScanRequest) -> dict[str, Any]:
     """Analyze HTTP security headers for the target URL."""
-    target = sanitize_input(request.target)
-    url = target if target.startswith("http") else "https://" + target
-    if not validate_url(url):
+    kind, url, _ = _classify_target(sanitize_input(request.target))
+    if not kind:
         raise HTTPException(status_code=400, detail="Invalid URL")
-    service = _get_service()
     scan_id = str(uuid4())
+    service = await get_vuln_service()
     results = await service.run_header_analysis(url, scan_id)
-    headers_list = [r.model_dump() for r in results]
     # Compute grade from pass/fail ratio
-    passes = sum(1 for h in headers_list if h.get("status") == "pass")
-    total_h = len(headers_list) or 1
+    passes = sum(1 for h in results if h.status == "pass")
+    total_h = len(results) or 1
     ratio = passes / total_h
-    grade = "A+" if ratio >= 0.9 else "A" if ratio >= 0.8 else "B" if ratio >= 0.6 else "C" if ratio >= 0.4 else "D" if ratio >= 0.2 else "F"
+    grade = _header_grade(ratio)
     # Match frontend HeaderAnalysisResponse: {url, grade, headers, score}
     return {
         "scan_id": scan_id,
         "url": url,
         "grade": grade,
         "score": round(ratio * 100),
+        # Rows are built straight from the models; no intermediate dump
         "headers": [
-            {"name": h.get("header", ""), "value": h.get("value", ""),
-             "status": h.get("status", "warning"), "description": h.get("description", "")}
-            for h in headers_list
+            {"name": h.header, "value": h.value, "status": h.status, "description": h.description}
+            for h in results
         ],
     }
 
@@ -91,10 +122,10 @@ async def header_analysis(request: ScanRequest) -> dict[str, Any]:
 async def ssl_check(request: SslCheckRequest) -> dict[str, Any]:
     """Check SSL/TLS certificate and configuration."""
     hostname = sanitize_input(request.hostname)
-    if not (validate_domain(hostname) or validate_ip(hostname)):
+    if _classify_target(hostname)[0] not in ("ip", "domain"):
         raise HTTPException(status_code=400, detail="Invalid hostname")
-    service = _get_service()
     scan_id = str(uuid4())
+    service = await get_vuln_service()
     result = await service.run_ssl_check(hostname, request.port, scan_id)
     data = result.model_dump()
     # Match frontend SslCheckResponse: {hostname, grade, isValid, certificate, protocols, cipher, issues}
@@ -121,32 +152,35 @@ async def ssl_check(request: SslCheckRequest) -> dict[str, Any]:
 async def cve_search(request: CveSearchRequest) -> dict[str, Any]:
     """Search NVD for CVEs matching the keyword."""
     keyword = sanitize_input(request.keyword)
-    service = _get_service()
     scan_id = str(uuid4())
+    service = await get_vuln_service()
     results = await service.run_cve_search(keyword, scan_id)
     # Match frontend CveLookupResponse: {query, total, results}
     return {
         "scan_id": scan_id,
         "query": keyword,
         "total": len(results),
-        "results": [r.model_dump() for r in results],
+        "results": _CVE_LIST.dump_python(results),
     }
 
 
 @router.post("/dependencies", summary="Dependency vulnerability check")
 async def dependency_check(request: DependencyCheckRequest) -> dict[str, Any]:
     """Check project dependencies for known vulnerabilities."""
-    service = _get_service()
     scan_id = str(uuid4())
+    service = await get_vuln_service()
     results = await service.run_dependency_check(
         request.content, request.file_type, scan_id,
     )
-    packages = [r.model_dump() for r in results]
+    packages = _DEPENDENCY_LIST.dump_python(results)
+    # Line count without building a list of every line
+    stripped = request.content.strip()
+    total_packages = stripped.count("\n") + 1 if stripped else 0
     # Match frontend DependencyCheckResponse: {filename, totalPackages, vulnerableCount, packages}
     return {
         "scan_id": scan_id,
         "filename": f"{request.file_type}.txt",
-        "totalPackages": len(request.content.strip().splitlines()),
+        "totalPackages": total_packages,
         "vulnerableCount": len(packages),
         "packages": packages,
     }
@@ -156,43 +190,82 @@ async def dependency_check(request: DependencyCheckRequest) -> dict[str, Any]:
 async def full_vuln_scan(request: ScanRequest) -> dict[str, Any]:
     """Run a full vulnerability scan on the target."""
     target = sanitize_input(request.target)
-    if not (validate_domain(target) or validate_ip(target) or validate_url(target)):
+    kind, url, hostname = _classify_target(target)
+    if kind not in ("ip", "domain", "url"):
         raise HTTPException(status_code=400, detail="Invalid target")
-    service = _get_service()
     scan_id = str(uuid4())
     emitter = ProgressEmitter(manager, scan_id)
-    result = await service.run_full_scan(target, scan_id, emitter)
+    service = await get_vuln_service()
+    result = await service.run_full_scan(target, scan_id, emitter, url=url, hostname=hostname)
     return {"scan_id": scan_id, "target": target, "result": result.model_dump()}
 
 
-@router.get("/history", summary="Vulnerability scan history")
+# History rows are read positionally and zipped with these names.
+_HISTORY_COLUMNS = ("id", "module", "target", "status", "started_at", "completed_at", "result_count")
+_HISTORY_SELECT = ", ".join(_HISTORY_COLUMNS)
+
+# The two possible history queries (with and without a target search),
+# fixed up front so the handler never formats SQL and both variants stay
+# in the connection's statement cache. The total rides along on every row
+# as a window count, saving a separate COUNT(*) round trip.
+_HISTORY_WHERE = "WHERE module_kind = 'vuln'"
+_HISTORY_WHERE_SEARCH = _HISTORY_WHERE + " AND target LIKE ?"
+_HISTORY_PAGE = (
+    f"SELECT {_HISTORY_SELECT}, COUNT(*) OVER () AS total FROM scan_history "
+    "{where} ORDER BY started_at DESC LIMIT ? OFFSET ?"
+)
+_SQL_NO_SEARCH = _HISTORY_PAGE.format(where=_HISTORY_WHERE)
+_SQL_WITH_SEARCH = _HISTORY_PAGE.format(where=_HISTORY_WHERE_SEARCH)
+_COUNT_NO_SEARCH = f"SELECT COUNT(*) FROM scan_history {_HISTORY_WHERE}"
+_COUNT_WITH_SEARCH = f"SELECT COUNT(*) FROM scan_history {_HISTORY_WHERE_SEARCH}"
+
+
+# Rows are pulled from the cursor in batches of this size and written out
+# as they arrive, so a page is never held as a list of dicts.
+_HISTORY_STREAM_BATCH = 25
+
+
+@router.get("/history", response_model=None, summary="Vulnerability scan history")
 async def vuln_history(
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
     search: str = Query(default="", max_length=200),
-) -> dict[str, Any]:
-    """List past vulnerability scans with pagination and optional target search."""
-    conn = await db.get_connection()
+) -> StreamingResponse:
+    """List past vulnerability scans with pagination and optional target search.
+
+    The page is streamed from a pooled read connection. Headers are sent
+    before the query runs, so a failure part-way still closes the JSON
+    document, with an ``"error"`` key added.
+    """
     offset = (page - 1) * per_page
-    params: list = ["vuln_%"]
-    where = "WHERE module LIKE ?"
-    if search:
-        where += " AND target LIKE ?"
-        params.append(f"%{search}%")
-    count_cursor = await conn.execute(f"SELECT COUNT(*) as cnt FROM scan_history {where}", params)
-    total = (await count_cursor.fetchone())["cnt"]
-    cursor = await conn.execute(
-        f"SELECT id, module, target, status, started_at, completed_at, result_count "
-        f"FROM scan_history {where} ORDER BY started_at DESC LIMIT ? OFFSET ?",
-        params + [per_page, offset],
-    )
-    rows = await cursor.fetchall()
-    return {
-        "scans": [
-            {"id": row["id"], "module": row["module"], "target": row["target"],
-             "status": row["status"], "started_at": row["started_at"],
-             "completed_at": row["completed_at"], "result_count": row["result_count"]}
-            for row in rows
-        ],
-        "total": total, "page": page, "per_page": per_page,
-    }
+    filters = [f"%{search}%"] if search else []
+
+    async def body() -> AsyncIterator[bytes]:
+        total = None
+        sep = b""
+        tail = b""
+        yield b'{"scans":['
+        try:
+            async with db.read_connection() as conn:
+                async with conn.execute(
+                    _SQL_WITH_SEARCH if search else _SQL_NO_SEARCH, filters + [per_page, offset],
+                ) as cursor:
+                    # Plain tuples: read positionally instead of per-key Row lookups
+                    cursor.row_factory = None
+                    while rows := await cursor.fetchmany(_HISTORY_STREAM_BATCH):
+                        total = rows[0][-1]
+                        # zip() stops at the named columns, leaving out the trailing total
+                        yield sep + b",".join(orjson.dumps(dict(zip(_HISTORY_COLUMNS, row))) for row in rows)
+                        sep = b","
+                if total is None and offset:
+                    # Past the last page: the window saw no rows, so count directly
+                    async with conn.execute(
+                        _COUNT_WITH_SEARCH if search else _COUNT_NO_SEARCH, filters,
+                    ) as count_cursor:
+                        total = (await count_cursor.fetchone())[0]
+        except Exception as exc:
+            logger.error("Vulnerability history query failed: %s", exc)
+            tail = b',"error":"Failed to load scan history"'
+        yield b'],"total":%d,"page":%d,"per_page":%d%s}' % (total or 0, page, per_page, tail)
+
+    return StreamingResponse(body(), media_type="application/json")
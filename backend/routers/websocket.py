@@ -4,10 +4,13 @@ Manages active WebSocket connections and broadcasts progress
 updates to connected clients watching specific scans.
 """
 
+import asyncio
 import json
 import logging
 from typing import Any
 
+import orjson
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from backend.models.base import ScanProgress
@@ -25,36 +28,50 @@ class ConnectionManager:
     """
 
     def __init__(self) -> None:
-        self._active: dict[str, list[WebSocket]] = {}
+        self._active: dict[str, set[WebSocket]] = {}
 
     async def connect(self, scan_id: str, websocket: WebSocket) -> None:
         """Accept a new WebSocket and register it under *scan_id*."""
         await websocket.accept()
-        self._active.setdefault(scan_id, []).append(websocket)
+        self._active.setdefault(scan_id, set()).add(websocket)
         logger.info("WebSocket connected for scan %s", scan_id)
 
     def disconnect(self, scan_id: str, websocket: WebSocket) -> None:
         """Remove a WebSocket from the active pool for *scan_id*."""
-        connections = self._active.get(scan_id, [])
-        if websocket in connections:
-            connections.remove(websocket)
-        if not connections:
-            self._active.pop(scan_id, None)
+        connections = self._active.get(scan_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                del self._active[scan_id]
         logger.info("WebSocket disconnected for scan %s", scan_id)
 
+    def has_watchers(self, scan_id: str) -> bool:
+        """Return True if any client is watching *scan_id*."""
+        return scan_id in self._active
+
     async def broadcast_progress(self, scan_id: str, data: dict[str, Any]) -> None:
-        """Send a JSON payload to every client watching *scan_id*.
+        """Send a JSON payload to every client watching *scan_id*."""
+        if scan_id in self._active:
+            await self.broadcast_raw(scan_id, orjson.dumps(data).decode())
+
+    async def broadcast_raw(self, scan_id: str, payload: str) -> None:
+        """Send an already-encoded JSON text frame to every watcher of *scan_id*.
 
-        Silently removes any connections that have gone stale.
+        Watchers are sent to concurrently, so one slow client does not
+        hold up the others. Connections whose send fails are treated as
+        stale and removed. Text (not binary) frames are used because the
+        frontend parses ``event.data`` as a string.
         """
-        stale: list[WebSocket] = []
-        for ws in self._active.get(scan_id, []):
-            try:
-                await ws.send_json(data)
-            except Exception:
-                stale.append(ws)
-        for ws in stale:
-            self.disconnect(scan_id, ws)
+        # Snapshot: watchers may (dis)connect while the sends are awaited
+        connections = list(self._active.get(scan_id, ()))
+        if not connections:
+            return
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in connections), return_exceptions=True,
+        )
+        for ws, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(scan_id, ws)
 
     async def send_personal(self, websocket: WebSocket, data: dict[str, Any]) -> None:
         """Send a JSON message to a single WebSocket."""
@@ -70,6 +87,10 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+# Keep-alive messages are '{"type":"ping"}'; anything else is parsed
+_PING_PREFIX = '{"type":"ping"'
+
+
 @router.websocket("/ws/scan/{scan_id}")
 async def scan_progress_ws(websocket: WebSocket, scan_id: str) -> None:
     """WebSocket endpoint for receiving real-time scan progress.
@@ -78,10 +99,15 @@ async def scan_progress_ws(websocket: WebSocket, scan_id: str) -> None:
     JSON messages until the scan completes or the connection closes.
     """
     await manager.connect(scan_id, websocket)
+    pong = orjson.dumps({"type": "pong", "scan_id": scan_id}).decode()
     try:
         while True:
             # Keep the connection alive; clients can also send messages
             raw = await websocket.receive_text()
+            # Compact keep-alive pings are answered without parsing them
+            if raw.startswith(_PING_PREFIX):
+                await websocket.send_text(pong)
+                continue
             # Echo acknowledgement or handle client commands in the future
             try:
                 message = json.loads(raw)
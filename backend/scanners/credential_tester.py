@@ -2,15 +2,34 @@
 
 import asyncio
 import logging
+import re
 from typing import Optional
 
 import httpx
 
 from backend.models.exploit import CredentialResult
-from backend.utils.progress import ProgressEmitter
+from backend.utils.progress import ProgressEmitter, ThrottledEmitter
 
 logger = logging.getLogger(__name__)
 
+# Credential tests in flight at once (and pooled connections to the target)
+_MAX_CONCURRENCY = 10
+
+_LOGIN_PATHS = ("/login", "/admin/login", "/wp-login.php", "/user/login")
+
+# Login form field discovery: input names by role, most specific first
+_INPUT_NAME_RE = re.compile(r"<input\b[^>]*?\bname\s*=\s*[\"']?([^\"'\s>]+)", re.IGNORECASE)
+_USER_FIELDS = ("username", "user", "log", "login", "email", "user_login", "name")
+_PASS_FIELDS = ("password", "pass", "pwd", "passwd", "user_pass")
+
+# Location fragments that mark a post-login redirect as a success,
+# matched in one case-insensitive pass
+_SUCCESS_TOKENS = ("dashboard", "admin", "home")
+_SUCCESS_RE = re.compile("|".join(map(re.escape, _SUCCESS_TOKENS)), re.IGNORECASE)
+
+# Posted when a form's fields cannot be identified: input name -> role
+_FALLBACK_FIELDS = {"username": "username", "password": "password", "user": "username", "pass": "password"}
+
 # Common default credentials for various services
 _DEFAULT_CREDS = [
     {"service": "http", "username": "admin", "password": "admin"},
@@ -45,23 +64,72 @@ async def _test_http_basic(client: httpx.AsyncClient, url: str, username: str, p
         return False
 
 
-async def _test_http_form(client: httpx.AsyncClient, url: str, username: str, password: str) -> bool:
-    """Test common HTTP form login."""
-    login_paths = ["/login", "/admin/login", "/wp-login.php", "/user/login"]
-    for path in login_paths:
-        login_url = f"{url.rstrip('/')}{path}"
+async def _probe_basic_auth(client: httpx.AsyncClient, url: str) -> bool:
+    """Return True if *url* challenges for HTTP auth (or the probe fails).
+
+    Without a challenge every Basic-auth attempt "succeeds" trivially, so
+    the Basic branch is only worth running against targets that ask.
+    """
+    try:
+        resp = await client.head(url, timeout=5.0, follow_redirects=True)
+    except Exception:
+        return True
+    return resp.status_code == 401 or "www-authenticate" in resp.headers
+
+
+def _pick_field(names: list[str], candidates: tuple[str, ...]) -> Optional[str]:
+    """Return the first input name that matches one of *candidates*."""
+    lowered = {name.lower(): name for name in names}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    return None
+
+
+async def _discover_login_form(
+    client: httpx.AsyncClient, url: str, path: str,
+) -> Optional[tuple[str, dict[str, str]]]:
+    """Fetch a candidate login page once and work out its field names.
+
+    Returns ``(login_url, field_map)`` where *field_map* maps the
+    ``username``/``password`` roles to the form's input names, or None if
+    the path does not exist. Unrecognised forms fall back to posting the
+    common field names.
+    """
+    login_url = f"{url.rstrip('/')}{path}"
+    try:
+        resp = await client.get(login_url, timeout=5.0, follow_redirects=True)
+    except Exception:
+        return login_url, dict(_FALLBACK_FIELDS)
+    if resp.status_code in (404, 410):
+        return None
+    names = _INPUT_NAME_RE.findall(resp.text[:100_000])
+    user_field = _pick_field(names, _USER_FIELDS)
+    pass_field = _pick_field(names, _PASS_FIELDS)
+    if user_field and pass_field:
+        return login_url, {user_field: "username", pass_field: "password"}
+    return login_url, dict(_FALLBACK_FIELDS)
+
+
+async def _test_http_form(
+    client: httpx.AsyncClient,
+    forms: list[tuple[str, dict[str, str]]],
+    username: str,
+    password: str,
+) -> bool:
+    """Test credentials against the discovered login forms."""
+    values = {"username": username, "password": password}
+    for login_url, fields in forms:
         try:
             resp = await client.post(
                 login_url,
-                data={"username": username, "password": password, "user": username, "pass": password},
+                data={field: values[role] for field, role in fields.items()},
                 timeout=5.0,
                 follow_redirects=False,
             )
             # A redirect (302) after login often means success
-            if resp.status_code in (302, 303) and "location" in resp.headers:
-                loc = resp.headers["location"].lower()
-                if "dashboard" in loc or "admin" in loc or "home" in loc:
-                    return True
+            if resp.status_code in (302, 303) and _SUCCESS_RE.search(resp.headers.get("location", "")):
+                return True
         except Exception:
             continue
     return False
@@ -71,41 +139,86 @@ async def scan_credentials(
     target: str,
     creds: list[dict] | None = None,
     progress_emitter: Optional[ProgressEmitter] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
 ) -> list[CredentialResult]:
-    """Test default credentials against target services."""
+    """Test default credentials against target services.
+
+    Credentials are tested concurrently, at most ``_MAX_CONCURRENCY``
+    at a time over one pooled client. Results keep the order of the
+    credential list; progress is reported as each test finishes.
+
+    Args:
+        target: Base URL to test.
+        creds: Credentials to try; defaults to the built-in HTTP list.
+        progress_emitter: Optional emitter for real-time progress.
+        transport: Shared keep-alive transport (connection pool) to send
+            through; it must skip certificate verification. Each scan
+            still gets its own client, so login cookies never carry over
+            between scans. Without one a private pool is opened and
+            closed around the scan.
+    """
     if progress_emitter:
         await progress_emitter.emit(0, "running", f"Starting credential test on {target}", "creds")
 
     test_creds = creds or [c for c in _DEFAULT_CREDS if c["service"] == "http"]
-    results: list[CredentialResult] = []
+    results: list[Optional[CredentialResult]] = [None] * len(test_creds)
     total = len(test_creds)
-
-    async with httpx.AsyncClient(verify=False) as client:
-        for idx, cred in enumerate(test_creds):
+    port = 443 if target.startswith("https") else 80
+    sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    client = httpx.AsyncClient(
+        verify=False,
+        limits=httpx.Limits(max_connections=_MAX_CONCURRENCY),
+        transport=transport,
+    )
+    try:
+        # One-off probes shared by every credential: whether Basic auth
+        # is challenged, and which login paths exist and their field names
+        try_basic, *discovered = await asyncio.gather(
+            _probe_basic_auth(client, target),
+            *(_discover_login_form(client, target, path) for path in _LOGIN_PATHS),
+        )
+        forms = [form for form in discovered if form is not None]
+
+        async def _probe(idx: int, cred: dict) -> CredentialResult:
             username = cred["username"]
             password = cred["password"]
-
-            # Test HTTP Basic Auth
-            success = await _test_http_basic(client, target, username, password)
-            if not success:
-                success = await _test_http_form(client, target, username, password)
-
-            results.append(CredentialResult(
+            async with sem:
+                # Test HTTP Basic Auth, then fall back to form login
+                success = try_basic and await _test_http_basic(client, target, username, password)
+                if not success and forms:
+                    success = await _test_http_form(client, forms, username, password)
+            result = results[idx] = CredentialResult(
                 host=target,
-                port=443 if target.startswith("https") else 80,
+                port=port,
                 service="http",
                 username=username,
                 password=password,
                 success=success,
-            ))
+            )
+            return result
 
-            if progress_emitter:
-                pct = int(((idx + 1) / total) * 90) + 5
-                found = sum(1 for r in results if r.success)
-                await progress_emitter.emit(pct, "running", f"Tested {idx+1}/{total} creds, {found} valid", "creds")
+        tasks = [asyncio.create_task(_probe(idx, cred)) for idx, cred in enumerate(test_creds)]
+        done = found = 0
+        throttle = ThrottledEmitter(progress_emitter)
+        try:
+            for task in asyncio.as_completed(tasks):
+                result = await task
+                done += 1
+                found += result.success
+                await throttle.emit(
+                    int((done / total) * 90) + 5, "running",
+                    f"Tested {done}/{total} creds, {found} valid", "creds", force=done == total,
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+    finally:
+        # Closing the client would close a shared transport with it
+        if transport is None:
+            await client.aclose()
 
     if progress_emitter:
-        found = sum(1 for r in results if r.success)
         await progress_emitter.emit(100, "completed", f"Credential test complete: {found} valid credentials", "creds")
 
-    return results
+    return [r for r in results if r is not None]
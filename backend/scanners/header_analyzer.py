@@ -5,6 +5,7 @@ presence, absence, and configuration of security-relevant headers.
 """
 
 import logging
+from typing import Optional
 
 import httpx
 
@@ -76,7 +77,19 @@ _DISCLOSURE_HEADERS: list[tuple[str, str]] = [
 ]
 
 
-async def analyze_headers(url: str) -> list[HeaderAnalysis]:
+async def _fetch_headers(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """Fetch *url* for its headers without downloading the page.
+
+    Uses HEAD, falling back to a GET for a single byte when the server
+    refuses HEAD.
+    """
+    response = await client.head(url, timeout=15.0)
+    if response.status_code in (405, 501):
+        response = await client.get(url, timeout=15.0, headers={"Range": "bytes=0-0"})
+    return response
+
+
+async def analyze_headers(url: str, client: Optional[httpx.AsyncClient] = None) -> list[HeaderAnalysis]:
     """Analyze HTTP security headers for the given *url*.
 
     Checks for the presence of recommended security headers and flags
@@ -84,6 +97,9 @@ async def analyze_headers(url: str) -> list[HeaderAnalysis]:
 
     Args:
         url: Target URL to analyze (must include http:// or https://).
+        client: Shared keep-alive client to fetch with. It must follow
+            redirects and skip certificate verification, like the
+            one-off client used when none is given.
 
     Returns:
         List of HeaderAnalysis objects, one per checked header.
@@ -91,18 +107,22 @@ async def analyze_headers(url: str) -> list[HeaderAnalysis]:
     results: list[HeaderAnalysis] = []
 
     try:
-        async with httpx.AsyncClient(
-            timeout=15.0,
-            follow_redirects=True,
-            verify=False,
-        ) as client:
-            response = await client.get(url)
-
-        resp_headers = {k.lower(): v for k, v in response.headers.items()}
+        if client is not None:
+            response = await _fetch_headers(client, url)
+        else:
+            async with httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                verify=False,
+            ) as one_off:
+                response = await _fetch_headers(one_off, url)
+
+        # httpx.Headers looks names up case-insensitively
+        resp_headers = response.headers
 
         # Check required security headers
         for header_name, importance, missing_severity, desc_present, desc_missing in _SECURITY_HEADERS:
-            value = resp_headers.get(header_name.lower(), "")
+            value = resp_headers.get(header_name, "")
             if value:
                 results.append(
                     HeaderAnalysis(
@@ -126,7 +146,7 @@ async def analyze_headers(url: str) -> list[HeaderAnalysis]:
 
         # Check information-disclosure headers (should NOT be present)
         for header_name, description in _DISCLOSURE_HEADERS:
-            value = resp_headers.get(header_name.lower(), "")
+            value = resp_headers.get(header_name, "")
             if value:
                 results.append(
                     HeaderAnalysis(
@@ -5,18 +5,28 @@ Falls back to an asyncio socket-based scanner when nmap is unavailable.
 """
 
 import asyncio
+import collections
+import errno
+import functools
 import ipaddress
 import logging
+import selectors
 import shutil
-from typing import Optional
+import socket
+import struct
+import time
+from itertools import compress
+from typing import AsyncIterator, Optional, Sequence
 
 from backend.models.recon import PortScanResult
-from backend.utils.progress import ProgressEmitter
+from backend.utils.progress import ProgressEmitter, ThrottledEmitter
 
 logger = logging.getLogger(__name__)
 
-# Detect nmap availability at import time
-_NMAP_AVAILABLE: bool = shutil.which("nmap") is not None
+# Detect nmap availability at import time; python-nmap is pointed at the
+# resolved binary so it does not probe its own list of search paths
+_NMAP_PATH: Optional[str] = shutil.which("nmap")
+_NMAP_AVAILABLE: bool = _NMAP_PATH is not None
 
 if _NMAP_AVAILABLE:
     try:
@@ -43,24 +53,28 @@ _COMMON_SERVICES: dict[int, str] = {
 }
 
 
-def _expand_hosts(target: str) -> list[str]:
-    """Expand an IP range spec into a list of individual host strings.
+# The key is client-supplied and a /16 expands to 65k strings, so only
+# the last few host lists are kept
+@functools.lru_cache(maxsize=4)
+def _expand_hosts(target: str) -> tuple[str, ...]:
+    """Expand an IP range spec into a tuple of individual host strings.
 
     Handles single IPs, CIDR blocks (up to /16), and nmap last-octet ranges.
+    Cached, so the result is an immutable tuple.
     """
     target = target.strip()
     # Single IP
     try:
         ipaddress.ip_address(target)
-        return [target]
+        return (target,)
     except ValueError:
         pass
     # CIDR block
     try:
         network = ipaddress.ip_network(target, strict=False)
         if network.num_addresses <= 65536:
-            return [str(h) for h in network.hosts()] or [str(network.network_address)]
-        return []
+            return tuple(str(h) for h in network.hosts()) or (str(network.network_address),)
+        return ()
     except ValueError:
         pass
     # Nmap last-octet dash range: A.B.C.start-end
@@ -72,45 +86,83 @@ def _expand_hosts(target: str) -> list[str]:
             prefix = str(base).rsplit(".", 1)[0]
             start = int(str(base).rsplit(".", 1)[1])
             if 0 <= end <= 255 and start <= end:
-                return [f"{prefix}.{i}" for i in range(start, end + 1)]
+                return tuple(f"{prefix}.{i}" for i in range(start, end + 1))
         except (ValueError, AttributeError):
             pass
     logger.warning("Could not expand target: %s", target)
-    return []
+    return ()
 
 
-def _parse_port_range(ports: str) -> list[int]:
-    """Parse a port specification string into a list of port numbers.
+# Keyed on the client's port spec and a full-range tuple is ~2.5 MB, so
+# the cache is kept small: enough for the few specs that recur
+@functools.lru_cache(maxsize=4)
+def _parse_port_range(ports: str) -> tuple[int, ...]:
+    """Parse a port specification string into a sorted tuple of port numbers.
 
     Supports ranges (1-100), comma-separated (80,443), and combinations.
+    Cached, since the same few specs ("1-1000") recur scan after scan.
     """
-    result: list[int] = []
+    # One flag byte per port: ranges are set with a slice assignment and
+    # read back in order by compress(), so no set of ints is built to
+    # dedupe and sort
+    selected = bytearray(65536)
     for part in ports.split(","):
         part = part.strip()
         if "-" in part:
             start_str, end_str = part.split("-", 1)
-            start, end = int(start_str), int(end_str)
-            result.extend(range(start, min(end + 1, 65536)))
+            start, end = int(start_str), min(int(end_str) + 1, 65536)
+            if start < end:
+                selected[start:end] = b"\x01" * (end - start)
         else:
             port = int(part)
             if 1 <= port <= 65535:
-                result.append(port)
-    return sorted(set(result))
+                selected[port] = 1
+    return tuple(compress(range(65536), selected))
+
+
+# SO_LINGER on with a zero timeout: close() sends RST instead of FIN
+_LINGER_RESET = struct.pack("ii", 1, 0)
+
+
+def _probe_socket(family: int, timeout: float) -> socket.socket:
+    """Create a non-blocking TCP socket for a single connect probe.
+
+    Closing it resets the connection, so open ports leave no TIME_WAIT
+    entries behind. Where supported, TCP_USER_TIMEOUT also stops the
+    kernel retrying past *timeout*.
+    """
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, int(timeout * 1000))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _family_for(target: str) -> int:
+    """Return the address family for *target*; names are treated as IPv4."""
+    try:
+        return socket.AF_INET6 if ipaddress.ip_address(target).version == 6 else socket.AF_INET
+    except ValueError:
+        return socket.AF_INET
 
 
 async def _scan_port_socket(target: str, port: int, timeout: float = 2.0) -> PortScanResult | None:
-    """Probe a single port using asyncio socket connection.
+    """Probe a single port with a bare non-blocking socket.
 
     Returns an open PortScanResult on success, a closed PortScanResult when
     the host is alive but the port is closed (TCP RST), or None on timeout.
     """
     try:
-        _, writer = await asyncio.wait_for(
-            asyncio.open_connection(target, port),
-            timeout=timeout,
-        )
-        writer.close()
-        await writer.wait_closed()
+        sock = _probe_socket(_family_for(target), timeout)
+    except OSError:
+        return None
+    try:
+        await asyncio.wait_for(asyncio.get_running_loop().sock_connect(sock, (target, port)), timeout=timeout)
         service = _COMMON_SERVICES.get(port, "")
         return PortScanResult(host=target, port=port, state="open", service=service)
     except ConnectionRefusedError:
@@ -120,22 +172,118 @@ async def _scan_port_socket(target: str, port: int, timeout: float = 2.0) -> Por
         return None
     except Exception:
         return None
+    finally:
+        sock.close()
+
+
+# Raw-socket connects in flight at once per scan in the socket fallback
+_SOCKET_CONCURRENCY = 500
+
+# Ports handed to each executor call; progress is reported between calls
+_SOCKET_BATCH = 1000
+
+# connect_ex() results meaning a non-blocking connect is still under way
+_CONNECT_PENDING = frozenset({errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN})
 
 
-async def _scan_with_nmap(
+def _fast_tcp_scan(
+    target: str,
+    ports: Sequence[int],
+    timeout: float = 2.0,
+    max_in_flight: int = _SOCKET_CONCURRENCY,
+    family: Optional[int] = None,
+) -> dict[int, str]:
+    """Probe *ports* on the IP literal *target* with raw non-blocking sockets.
+
+    Up to *max_in_flight* connects run at once behind a single selector,
+    with no stream objects or tasks per port. Each probe has its own
+    *timeout*, and a new connect starts as soon as one finishes, so a
+    slow port never holds up the rest. Blocking; run it in an executor.
+    Returns ``{port: "open" | "closed"}``; ports that time out or fail
+    otherwise are left out, as with :func:`_scan_port_socket`. *family*
+    defaults to the family of *target*.
+    """
+    if family is None:
+        family = _family_for(target)
+    states: dict[int, str] = {}
+    # (deadline, socket) in start order; with one timeout for every probe
+    # the head always expires first. Sockets that finish early stay queued
+    # until they reach the head, recognisable by their closed fd (-1).
+    started: collections.deque[tuple[float, socket.socket]] = collections.deque()
+    next_idx = 0
+
+    def _record(port: int, err: int) -> None:
+        if err == 0:
+            states[port] = "open"
+        elif err == errno.ECONNREFUSED:
+            # Host is alive but port is closed (TCP RST received)
+            states[port] = "closed"
+
+    with selectors.DefaultSelector() as sel:
+        in_flight = sel.get_map()
+
+        def _start_more() -> None:
+            nonlocal next_idx
+            while next_idx < len(ports) and len(in_flight) < max_in_flight:
+                port = ports[next_idx]
+                try:
+                    sock = _probe_socket(family, timeout)
+                except OSError as exc:
+                    # Out of descriptors: wait for probes in flight to free some
+                    if exc.errno in (errno.EMFILE, errno.ENFILE) and in_flight:
+                        return
+                    raise
+                next_idx += 1
+                err = sock.connect_ex((target, port))
+                if err in _CONNECT_PENDING:
+                    sel.register(sock, selectors.EVENT_WRITE, port)
+                    started.append((time.monotonic() + timeout, sock))
+                else:
+                    _record(port, err)
+                    sock.close()
+
+        try:
+            _start_more()
+            while started:
+                deadline, sock = started[0]
+                if sock.fileno() == -1:
+                    started.popleft()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # Timed out: no answer from this port
+                    started.popleft()
+                    sel.unregister(sock)
+                    sock.close()
+                    _start_more()
+                    continue
+                for key, _ in sel.select(remaining):
+                    ready = key.fileobj
+                    _record(key.data, ready.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR))
+                    sel.unregister(ready)
+                    ready.close()
+                _start_more()
+        finally:
+            for key in list(in_flight.values()):
+                sel.unregister(key.fileobj)
+                key.fileobj.close()
+    return states
+
+
+async def _iter_nmap(
     target: str,
     ports: str,
     progress_emitter: Optional[ProgressEmitter],
-) -> tuple[list[PortScanResult], int]:
-    """Run a port scan using python-nmap.
+    alive_hosts: set[str],
+) -> AsyncIterator[PortScanResult]:
+    """Run a port scan using python-nmap and yield open ports.
 
-    Executes nmap in a thread to avoid blocking the event loop.
-    Returns (open_results, hosts_alive_count).
+    Executes nmap in a thread to avoid blocking the event loop. Every
+    host nmap reports is added to *alive_hosts*.
     """
-    results: list[PortScanResult] = []
 
     def _do_nmap_scan() -> "nmap.PortScanner":
-        nm = nmap.PortScanner()
+        nm = nmap.PortScanner(nmap_search_path=(_NMAP_PATH,))
         # No --open so all discovered hosts appear in all_hosts()
         nm.scan(hosts=target, ports=ports, arguments="-sV -T4")
         return nm
@@ -147,109 +295,169 @@ async def _scan_with_nmap(
 
     try:
         nm = await loop.run_in_executor(None, _do_nmap_scan)
-        hosts_alive = len(nm.all_hosts())
-
-        for host in nm.all_hosts():
-            for proto in nm[host].all_protocols():
-                port_list = sorted(nm[host][proto].keys())
-                for port in port_list:
-                    info = nm[host][proto][port]
-                    if info.get("state") == "open":
-                        results.append(
-                            PortScanResult(
-                                host=host,
-                                port=port,
-                                state="open",
-                                service=info.get("name", ""),
-                                version=info.get("version", ""),
-                            )
-                        )
     except Exception as exc:
         logger.error("nmap scan failed: %s", exc)
-        hosts_alive = 0
-
-    return results, hosts_alive
+        return
+
+    alive_hosts.update(nm.all_hosts())
+    for host in nm.all_hosts():
+        for proto in nm[host].all_protocols():
+            port_list = sorted(nm[host][proto].keys())
+            for port in port_list:
+                info = nm[host][proto][port]
+                if info.get("state") == "open":
+                    yield PortScanResult(
+                        host=host,
+                        port=port,
+                        state="open",
+                        service=info.get("name", ""),
+                        version=info.get("version", ""),
+                    )
+
+
+async def _resolve_host(name: str) -> Optional[tuple[int, str]]:
+    """Resolve hostname *name* to ``(family, address)``, or None if it does not resolve.
+
+    Both address families are looked up. An IPv4 address is preferred
+    when the name has one, so dual-stack hosts are probed as before;
+    IPv6-only names get their first IPv6 address.
+    """
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            name, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM,
+        )
+    except (socket.gaierror, UnicodeError) as exc:
+        logger.warning("Could not resolve %s: %s", name, exc)
+        return None
+    infos = [info for info in infos if info[0] in (socket.AF_INET, socket.AF_INET6)]
+    if not infos:
+        return None
+    family, _, _, _, sockaddr = next((info for info in infos if info[0] == socket.AF_INET), infos[0])
+    return family, sockaddr[0]
 
 
-async def _scan_with_sockets(
+async def _iter_sockets(
     target: str,
     ports: str,
     progress_emitter: Optional[ProgressEmitter],
-) -> tuple[list[PortScanResult], int]:
-    """Run a port scan using pure-Python async sockets.
-
-    Expands IP ranges and scans ports in batches to control concurrency.
-    Returns (open_results, hosts_alive_count). A host is considered alive
-    if any port returns open or closed (TCP RST) rather than timing out.
+    alive_hosts: set[str],
+) -> AsyncIterator[PortScanResult]:
+    """Run a port scan using pure-Python sockets and yield open ports.
+
+    Expands IP ranges and scans each host's ports in batches of
+    ``_SOCKET_BATCH``. Each batch is one :func:`_fast_tcp_scan` call in an
+    executor thread, which keeps ``_SOCKET_CONCURRENCY`` probes in
+    flight, and its open ports are yielded when it completes. A host is
+    added to *alive_hosts* if any port returns open or closed (TCP RST)
+    rather than timing out. A hostname *target* is resolved once up front
+    and its address probed, while results still name the host.
     """
-    open_results: list[PortScanResult] = []
-    alive_hosts: set[str] = set()
-    hosts = _expand_hosts(target)
+    hosts = addresses = _expand_hosts(target)
+    family: Optional[int] = None
+    if not hosts:
+        resolved = await _resolve_host(target.strip())
+        if resolved:
+            family, address = resolved
+            hosts, addresses = (target.strip(),), (address,)
     port_list = _parse_port_range(ports)
     total = len(hosts) * len(port_list)
 
     if total == 0:
-        return open_results, 0
+        return
 
-    batch_size = 100
+    batch_size = _SOCKET_BATCH
     completed = 0
+    open_count = 0
+    loop = asyncio.get_running_loop()
+    throttle = ThrottledEmitter(progress_emitter)
 
-    for host in hosts:
+    for host, address in zip(hosts, addresses):
         for i in range(0, len(port_list), batch_size):
             batch = port_list[i : i + batch_size]
-            tasks = [_scan_port_socket(host, port) for port in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in batch_results:
-                if isinstance(result, PortScanResult):
-                    # Any TCP response (open or RST) means host is alive
-                    alive_hosts.add(result.host)
-                    if result.state == "open":
-                        open_results.append(result)
-
-            completed += len(batch)
-            if progress_emitter:
-                pct = int((completed / total) * 90) + 5  # 5-95%
-                await progress_emitter.emit(
-                    pct, "running",
-                    f"Scanning {host}: {completed}/{total} checked, {len(open_results)} open, {len(alive_hosts)} alive",
-                    "port_scan",
+            try:
+                states = await loop.run_in_executor(
+                    None, functools.partial(_fast_tcp_scan, address, batch, family=family),
                 )
+            except OSError as exc:
+                logger.debug("Socket scan batch on %s failed: %s", host, exc)
+                states = {}
+
+            if states:
+                # Any TCP response (open or RST) means host is alive
+                alive_hosts.add(host)
+            for port in batch:
+                if states.get(port) == "open":
+                    open_count += 1
+                    yield PortScanResult(host=host, port=port, state="open", service=_COMMON_SERVICES.get(port, ""))
 
-    return open_results, len(alive_hosts)
+            completed += len(batch)
+            await throttle.emit(
+                int((completed / total) * 90) + 5, "running",  # 5-95%
+                f"Scanning {host}: {completed}/{total} checked, {open_count} open, {len(alive_hosts)} alive",
+                "port_scan", force=completed == total,
+            )
 
 
-async def scan_ports(
+async def iter_ports(
     target: str,
     ports: str = "1-1000",
     progress_emitter: Optional[ProgressEmitter] = None,
-) -> tuple[list[PortScanResult], int]:
-    """Scan ports on *target*, preferring nmap with socket fallback.
+    alive_hosts: Optional[set[str]] = None,
+) -> AsyncIterator[PortScanResult]:
+    """Scan ports on *target*, yielding open ports as they are found.
+
+    Prefers nmap with socket fallback. Responding hosts are collected
+    into *alive_hosts* when a set is supplied, so callers can report the
+    alive count once iteration finishes.
 
     Args:
         target: IP address or hostname to scan.
         ports: Port specification (e.g. "1-1000", "80,443,8080").
         progress_emitter: Optional emitter for real-time progress updates.
-
-    Returns:
-        Tuple of (open_port_results, hosts_alive_count).
+        alive_hosts: Optional set that receives every responding host.
     """
+    alive = alive_hosts if alive_hosts is not None else set()
+    open_count = 0
+
     if progress_emitter:
         await progress_emitter.emit(0, "running", f"Starting port scan on {target}", "port_scan")
 
     if _NMAP_AVAILABLE:
         logger.info("Using nmap for port scan of %s ports %s", target, ports)
-        results, hosts_alive = await _scan_with_nmap(target, ports, progress_emitter)
+        scan = _iter_nmap(target, ports, progress_emitter, alive)
     else:
         logger.info("Using socket scanner for %s ports %s", target, ports)
-        results, hosts_alive = await _scan_with_sockets(target, ports, progress_emitter)
+        scan = _iter_sockets(target, ports, progress_emitter, alive)
+
+    async for result in scan:
+        open_count += 1
+        yield result
 
     if progress_emitter:
         await progress_emitter.emit(
             100, "completed",
-            f"Port scan complete: {len(results)} open ports, {hosts_alive} hosts alive",
+            f"Port scan complete: {open_count} open ports, {len(alive)} hosts alive",
             "port_scan",
         )
 
-    logger.info("Port scan of %s: %d open ports, %d hosts alive", target, len(results), hosts_alive)
-    return results, hosts_alive
+    logger.info("Port scan of %s: %d open ports, %d hosts alive", target, open_count, len(alive))
+
+
+async def scan_ports(
+    target: str,
+    ports: str = "1-1000",
+    progress_emitter: Optional[ProgressEmitter] = None,
+) -> tuple[list[PortScanResult], int]:
+    """Scan ports on *target*, preferring nmap with socket fallback.
+
+    Args:
+        target: IP address or hostname to scan.
+        ports: Port specification (e.g. "1-1000", "80,443,8080").
+        progress_emitter: Optional emitter for real-time progress updates.
+
+    Returns:
+        Tuple of (open_port_results, hosts_alive_count).
+    """
+    alive_hosts: set[str] = set()
+    results = [r async for r in iter_ports(target, ports, progress_emitter, alive_hosts)]
+    return results, len(alive_hosts)
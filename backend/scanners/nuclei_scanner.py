@@ -4,16 +4,47 @@ import asyncio
 import logging
 import shutil
 import re
-from typing import Optional
+from collections import defaultdict
+from typing import Any, Optional
 
 import httpx
+from pydantic import BaseModel, Field
 
 from backend.models.exploit import NucleiResult
-from backend.utils.progress import ProgressEmitter
+from backend.utils.progress import ProgressEmitter, ThrottledEmitter
 
 logger = logging.getLogger(__name__)
 
-_NUCLEI_AVAILABLE: bool = shutil.which("nuclei") is not None
+# Absolute path resolved once, so scans never search PATH again
+_NUCLEI_PATH: Optional[str] = shutil.which("nuclei")
+_NUCLEI_AVAILABLE: bool = _NUCLEI_PATH is not None
+
+# Signature checks in flight at once in the Python fallback
+_MAX_CONCURRENCY = 10
+
+# Longest nuclei JSONL line accepted; findings can embed whole responses
+_NUCLEI_LINE_LIMIT = 4 * 1024 * 1024
+
+# Fixed nuclei flags, placed after "-u <target>"
+_NUCLEI_ARGS = ("-jsonl", "-silent", "-severity", "info,low,medium,high,critical")
+
+
+class _NucleiInfo(BaseModel):
+    name: str = ""
+    severity: str = "info"
+
+
+class _NucleiLine(BaseModel):
+    """The fields read from one line of nuclei -jsonl output.
+
+    Parsed straight from the raw line by pydantic-core; every other key
+    (requests, responses, ...) is skipped without building objects.
+    """
+
+    template_id: str = Field(default="", alias="template-id")
+    info: _NucleiInfo = Field(default_factory=_NucleiInfo)
+    matched_at: Optional[str] = Field(default=None, alias="matched-at")
+    extracted_results: Any = Field(default="", alias="extracted-results")
 
 # Python-based signature checks when nuclei binary is not available
 _VULN_SIGNATURES = [
@@ -91,76 +122,148 @@ _VULN_SIGNATURES = [
 
 
 async def _run_nuclei_cli(target: str) -> list[NucleiResult]:
-    """Run nuclei binary and parse JSON output."""
+    """Run nuclei binary and parse its JSONL output as it streams in.
+
+    Each finding is parsed as soon as nuclei prints it, so only one line
+    is buffered at a time. The whole run is capped at 120 seconds; on
+    timeout nuclei is killed and the findings so far are kept.
+    """
     results: list[NucleiResult] = []
     try:
         proc = await asyncio.create_subprocess_exec(
-            "nuclei", "-u", target, "-jsonl", "-silent", "-severity", "info,low,medium,high,critical",
-            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            _NUCLEI_PATH, "-u", target, *_NUCLEI_ARGS,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+            limit=_NUCLEI_LINE_LIMIT,
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=120)
+    except Exception as exc:
+        logger.error("Nuclei CLI failed: %s", exc)
+        return results
 
-        import json
-        for line in stdout.decode(errors="replace").strip().split("\n"):
+    async def _collect() -> None:
+        async for line in proc.stdout:
             if not line.strip():
                 continue
             try:
-                data = json.loads(line)
-                results.append(NucleiResult(
-                    template_id=data.get("template-id", ""),
-                    name=data.get("info", {}).get("name", ""),
-                    severity=data.get("info", {}).get("severity", "info"),
-                    matched_url=data.get("matched-at", target),
-                    extracted_results=str(data.get("extracted-results", "")),
-                ))
-            except Exception:
+                finding = _NucleiLine.model_validate_json(line)
+            except ValueError:
                 continue
+            results.append(NucleiResult(
+                template_id=finding.template_id,
+                name=finding.info.name,
+                severity=finding.info.severity,
+                matched_url=target if finding.matched_at is None else finding.matched_at,
+                extracted_results=str(finding.extracted_results),
+            ))
+        await proc.wait()
+
+    try:
+        await asyncio.wait_for(_collect(), timeout=120)
+    except asyncio.TimeoutError:
+        logger.warning("Nuclei CLI timed out for %s after %d findings", target, len(results))
     except Exception as exc:
         logger.error("Nuclei CLI failed: %s", exc)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
 
     return results
 
 
-async def _run_python_checks(client: httpx.AsyncClient, target: str) -> list[NucleiResult]:
-    """Run Python-based vulnerability signature checks."""
-    results: list[NucleiResult] = []
+# Signatures grouped by the path they fetch, each with its index in
+# _VULN_SIGNATURES, so every path is requested once per scan
+_SIGS_BY_PATH: dict[str, list[tuple[int, dict]]] = defaultdict(list)
+for _idx, _sig in enumerate(_VULN_SIGNATURES):
+    _SIGS_BY_PATH[_sig["path"]].append((_idx, _sig))
+del _idx, _sig
+
+# Paths with at least one signature that inspects the response body
+_BODY_PATHS = frozenset(sig["path"] for sig in _VULN_SIGNATURES if "match" in sig)
 
-    for sig in _VULN_SIGNATURES:
-        url = f"{target.rstrip('/')}{sig['path']}"
+
+def _match_signature(sig: dict, resp: httpx.Response, url: str) -> NucleiResult | None:
+    """Return a finding if *resp* matches *sig*."""
+    extracted = ""
+    if "match" in sig and sig["match"].search(resp.text):
+        extracted = f"Pattern matched at {sig['path']}"
+    elif "match_header" in sig:
+        header_val = resp.headers.get(sig["match_header"], "")
+        if header_val:
+            extracted = f"{sig['match_header']}: {header_val}"
+    if not extracted:
+        return None
+    return NucleiResult(
+        template_id=sig["id"],
+        name=sig["name"],
+        severity=sig["severity"],
+        matched_url=url,
+        extracted_results=extracted,
+    )
+
+
+async def _run_python_checks(
+    client: httpx.AsyncClient,
+    target: str,
+    progress_emitter: Optional[ProgressEmitter] = None,
+) -> list[NucleiResult]:
+    """Run Python-based vulnerability signature checks.
+
+    Each distinct path is fetched once and every signature on it is
+    matched against that response; the body is only downloaded when a
+    signature on the path inspects it. Paths are fetched concurrently, at
+    most ``_MAX_CONCURRENCY`` at a time, so the scan takes about as long
+    as its slowest request. Findings keep the signature order; progress
+    is reported as each path finishes.
+    """
+    base_url = target.rstrip("/")
+    total = len(_VULN_SIGNATURES)
+    found: list[NucleiResult | None] = [None] * total
+    sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+    async def _probe(path: str, sigs: list[tuple[int, dict]]) -> int:
+        url = f"{base_url}{path}"
         try:
-            resp = await client.get(url, timeout=5.0, follow_redirects=True)
-
-            matched = False
-            extracted = ""
-
-            if "match" in sig and sig["match"].search(resp.text):
-                matched = True
-                extracted = f"Pattern matched in response body at {sig['path']}"
-            elif "match_header" in sig:
-                header_val = resp.headers.get(sig["match_header"], "")
-                if header_val:
-                    matched = True
-                    extracted = f"{sig['match_header']}: {header_val}"
-
-            if matched:
-                results.append(NucleiResult(
-                    template_id=sig["id"],
-                    name=sig["name"],
-                    severity=sig["severity"],
-                    matched_url=url,
-                    extracted_results=extracted,
-                ))
+            async with sem:
+                if path in _BODY_PATHS:
+                    resp = await client.get(url, timeout=5.0, follow_redirects=True)
+                else:
+                    # Only headers are inspected: close before the body is read
+                    async with client.stream("GET", url, timeout=5.0, follow_redirects=True) as resp:
+                        pass
         except Exception:
-            continue
+            return len(sigs)
+        for idx, sig in sigs:
+            found[idx] = _match_signature(sig, resp, url)
+        return len(sigs)
 
-    return results
+    tasks = [asyncio.create_task(_probe(path, sigs)) for path, sigs in _SIGS_BY_PATH.items()]
+    done = 0
+    throttle = ThrottledEmitter(progress_emitter)
+    try:
+        for task in asyncio.as_completed(tasks):
+            done += await task
+            await throttle.emit(
+                int((done / total) * 90) + 5, "running",
+                f"Checked {done}/{total} signatures", "nuclei", force=done == total,
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return [r for r in found if r is not None]
 
 
 async def scan_nuclei(
     target: str,
     progress_emitter: Optional[ProgressEmitter] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
 ) -> list[NucleiResult]:
-    """Scan target for known vulnerabilities using nuclei or Python fallback."""
+    """Scan target for known vulnerabilities using nuclei or Python fallback.
+
+    *transport* is a shared keep-alive connection pool for the Python
+    checks; it must skip certificate verification. Without one a private
+    pool is opened and closed around the scan.
+    """
     if progress_emitter:
         await progress_emitter.emit(0, "running", f"Starting vulnerability scan on {target}", "nuclei")
 
@@ -171,37 +274,13 @@ async def scan_nuclei(
         results = await _run_nuclei_cli(target)
     else:
         logger.info("Using Python signature checks for %s", target)
-        async with httpx.AsyncClient(verify=False) as client:
-            total = len(_VULN_SIGNATURES)
-            results = []
-            for idx, sig in enumerate(_VULN_SIGNATURES):
-                url = f"{target.rstrip('/')}{sig['path']}"
-                try:
-                    resp = await client.get(url, timeout=5.0, follow_redirects=True)
-                    matched = False
-                    extracted = ""
-                    if "match" in sig and sig["match"].search(resp.text):
-                        matched = True
-                        extracted = f"Pattern matched at {sig['path']}"
-                    elif "match_header" in sig:
-                        hv = resp.headers.get(sig["match_header"], "")
-                        if hv:
-                            matched = True
-                            extracted = f"{sig['match_header']}: {hv}"
-                    if matched:
-                        results.append(NucleiResult(
-                            template_id=sig["id"],
-                            name=sig["name"],
-                            severity=sig["severity"],
-                            matched_url=url,
-                            extracted_results=extracted,
-                        ))
-                except Exception:
-                    pass
-
-                if progress_emitter:
-                    pct = int(((idx + 1) / total) * 90) + 5
-                    await progress_emitter.emit(pct, "running", f"Checking signature {idx+1}/{total}", "nuclei")
+        client = httpx.AsyncClient(verify=False, transport=transport)
+        try:
+            results = await _run_python_checks(client, target, progress_emitter)
+        finally:
+            # Closing the client would close a shared transport with it
+            if transport is None:
+                await client.aclose()
 
     if progress_emitter:
         await progress_emitter.emit(100, "completed", f"Vuln scan complete: {len(results)} findings", "nuclei")
@@ -10,7 +10,6 @@ Falls back to async socket scanning when nmap is unavailable.
 
 import asyncio
 import logging
-import shutil
 from typing import Optional, Callable, Awaitable
 
 from backend.models.seek_enter import (
@@ -19,15 +18,21 @@ from backend.models.seek_enter import (
     SeekResult,
     ServiceVuln,
 )
+# nmap detection and the socket helpers live in the port scanner; the
+# seek scanner shares them rather than keeping copies
+from backend.scanners.nmap_scanner import (
+    _COMMON_SERVICES,
+    _NMAP_AVAILABLE,
+    _NMAP_PATH,
+    _expand_hosts,
+    _parse_port_range,
+    _scan_port_socket,
+)
 
-logger = logging.getLogger(__name__)
-
-_NMAP_AVAILABLE: bool = shutil.which("nmap") is not None
 if _NMAP_AVAILABLE:
-    try:
-        import nmap
-    except ImportError:
-        _NMAP_AVAILABLE = False
+    import nmap
+
+logger = logging.getLogger(__name__)
 
 ProgressCallback = Optional[Callable[[int, str], Awaitable[None]]]
 
@@ -54,7 +59,7 @@ async def _seek_with_nmap(
         await on_progress(5, "Phase 1: Host discovery (ping scan)")
 
     def _ping_scan():
-        nm = nmap.PortScanner()
+        nm = nmap.PortScanner(nmap_search_path=(_NMAP_PATH,))
         nm.scan(hosts=cidr, arguments="-sn -T4")
         return nm
 
@@ -73,7 +78,7 @@ async def _seek_with_nmap(
     hosts_str = " ".join(live_hosts)
 
     def _service_scan():
-        nm = nmap.PortScanner()
+        nm = nmap.PortScanner(nmap_search_path=(_NMAP_PATH,))
         nm.scan(hosts=hosts_str, ports=ports, arguments="-sV -O -T4 --script vulners")
         return nm
 
@@ -183,8 +188,6 @@ async def _seek_with_sockets(
          concurrently to find which ones are alive.
       3. Full port scan only the alive hosts.
     """
-    from backend.scanners.nmap_scanner import _expand_hosts, _scan_port_socket, _parse_port_range, _COMMON_SERVICES
-
     all_hosts = _expand_hosts(cidr)
     if not all_hosts:
         logger.warning("No hosts expanded from target: %s", cidr)
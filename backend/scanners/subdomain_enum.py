@@ -65,22 +65,24 @@ async def _resolve_subdomain(subdomain: str, domain: str) -> SubdomainResult | N
         return None
 
 
-async def _query_crt_sh(domain: str) -> list[SubdomainResult]:
+async def _query_crt_sh(domain: str, client: Optional[httpx.AsyncClient] = None) -> list[SubdomainResult]:
     """Query crt.sh certificate transparency logs for subdomains.
 
+    Uses *client* when given, otherwise a one-off client.
     Returns unique subdomains discovered via certificate records.
     """
     results: list[SubdomainResult] = []
     seen: set[str] = set()
+    url = f"https://crt.sh/?q=%25.{domain}&output=json"
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(
-                f"https://crt.sh/?q=%25.{domain}&output=json",
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            entries = response.json()
+        if client is not None:
+            response = await client.get(url, follow_redirects=True, timeout=15.0)
+        else:
+            async with httpx.AsyncClient(timeout=15.0) as one_off:
+                response = await one_off.get(url, follow_redirects=True)
+        response.raise_for_status()
+        entries = response.json()
 
         for entry in entries:
             name_value = entry.get("name_value", "")
@@ -101,12 +103,14 @@ async def _query_crt_sh(domain: str) -> list[SubdomainResult]:
 async def enumerate_subdomains(
     domain: str,
     progress_emitter: Optional[ProgressEmitter] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> list[SubdomainResult]:
     """Enumerate subdomains for *domain* using DNS brute-force and crt.sh.
 
     Args:
         domain: Target domain name to enumerate.
         progress_emitter: Optional emitter for real-time progress updates.
+        client: Shared keep-alive client for the crt.sh query.
 
     Returns:
         List of discovered SubdomainResult objects.
@@ -147,7 +151,7 @@ async def enumerate_subdomains(
     if progress_emitter:
         await progress_emitter.emit(80, "running", "Querying certificate transparency logs", "subdomain_enum")
 
-    crt_results = await _query_crt_sh(domain)
+    crt_results = await _query_crt_sh(domain, client)
     for result in crt_results:
         if result.subdomain not in seen:
             seen.add(result.subdomain)
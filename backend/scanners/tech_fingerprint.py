@@ -66,7 +66,7 @@ _HTML_RULES: list[tuple[str, str, str, Optional[int]]] = [
 ]
 
 
-async def fingerprint_tech(url: str) -> list[TechStackResult]:
+async def fingerprint_tech(url: str, client: Optional[httpx.AsyncClient] = None) -> list[TechStackResult]:
     """Fingerprint technologies used by the website at *url*.
 
     Examines HTTP response headers and HTML body content for known
@@ -74,6 +74,9 @@ async def fingerprint_tech(url: str) -> list[TechStackResult]:
 
     Args:
         url: Full URL to analyze (must include http:// or https://).
+        client: Shared keep-alive client to fetch with. It must follow
+            redirects and skip certificate verification, like the
+            one-off client used when none is given.
 
     Returns:
         List of detected TechStackResult objects.
@@ -95,12 +98,15 @@ async def fingerprint_tech(url: str) -> list[TechStackResult]:
             )
 
     try:
-        async with httpx.AsyncClient(
-            timeout=15.0,
-            follow_redirects=True,
-            verify=False,
-        ) as client:
-            response = await client.get(url)
+        if client is not None:
+            response = await client.get(url, timeout=15.0)
+        else:
+            async with httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                verify=False,
+            ) as one_off:
+                response = await one_off.get(url)
 
         # Phase 1: Header analysis
         headers = {k.lower(): v for k, v in response.headers.items()}
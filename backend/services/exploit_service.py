@@ -10,6 +10,8 @@ import logging
 import uuid
 from typing import Optional
 
+import httpx
+
 from backend.models.exploit import (
     SQLiResult,
     XSSResult,
@@ -26,12 +28,44 @@ from backend.scanners.web_fuzzer import scan_fuzz
 from backend.scanners.credential_tester import scan_credentials
 from backend.utils.progress import ProgressEmitter
 
+# httpx speaks HTTP/2 only when the optional h2 package is installed
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
 class ExploitService:
     """Orchestrates offensive security scanning operations."""
 
+    # Keep-alive connection pool shared by credential and nuclei scans, so
+    # repeat scans of a target reuse its connections and TLS sessions.
+    # With h2 installed, HTTPS targets that offer HTTP/2 get one
+    # multiplexed connection for all of a scan's concurrent requests.
+    # Opened and closed by the app lifespan; scanners fall back to a
+    # private pool while it is None.
+    _http_transport: Optional[httpx.AsyncHTTPTransport] = None
+
+    @classmethod
+    async def open_http_transport(cls) -> None:
+        """Create the shared connection pool if it is not open yet."""
+        if cls._http_transport is None:
+            cls._http_transport = httpx.AsyncHTTPTransport(
+                verify=False,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=25),
+            )
+
+    @classmethod
+    async def close_http_transport(cls) -> None:
+        """Close the shared connection pool."""
+        if cls._http_transport is not None:
+            await cls._http_transport.aclose()
+            cls._http_transport = None
+
     async def run_sqli(
         self,
         target: str,
@@ -70,7 +104,7 @@ class ExploitService:
     ) -> list[NucleiResult]:
         """Run nuclei vulnerability scan."""
         logger.info("Starting nuclei scan on %s", target)
-        return await scan_nuclei(target, progress_emitter)
+        return await scan_nuclei(target, progress_emitter, transport=ExploitService._http_transport)
 
     async def run_fuzz(
         self,
@@ -90,7 +124,9 @@ class ExploitService:
     ) -> list[CredentialResult]:
         """Run credential tester."""
         logger.info("Starting credential test on %s", target)
-        return await scan_credentials(target, progress_emitter=progress_emitter)
+        return await scan_credentials(
+            target, progress_emitter=progress_emitter, transport=ExploitService._http_transport,
+        )
 
     async def run_strike_chain(
         self,
@@ -121,11 +157,11 @@ class ExploitService:
         if "dirs" in all_modules:
             tasks["dirs"] = scan_dirs(target)
         if "nuclei" in all_modules:
-            tasks["nuclei"] = scan_nuclei(target)
+            tasks["nuclei"] = scan_nuclei(target, transport=ExploitService._http_transport)
         if "fuzz" in all_modules:
             tasks["fuzz"] = scan_fuzz(target)
         if "creds" in all_modules:
-            tasks["creds"] = scan_credentials(target)
+            tasks["creds"] = scan_credentials(target, transport=ExploitService._http_transport)
 
         if progress_emitter:
             await progress_emitter.emit(10, "running", f"Running {len(tasks)} modules in parallel", "strike_chain")
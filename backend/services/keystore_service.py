@@ -4,6 +4,7 @@ Uses the OS keyring (Windows Credential Manager on Windows 11) for
 secure key storage and aiosqlite for key metadata persistence.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -81,7 +82,7 @@ class KeystoreService:
             The key string or None if not found.
         """
         try:
-            return keyring.get_password(_KEYRING_SERVICE, service)
+            return await asyncio.to_thread(keyring.get_password, _KEYRING_SERVICE, service)
         except Exception:
             logger.exception("Failed to retrieve key from keyring for service=%s", service)
             return None
@@ -124,17 +125,17 @@ class KeystoreService:
         )
         rows = await cursor.fetchall()
 
-        results: list[dict] = []
-        for row in rows:
-            service = row["service"]
-            configured = await self.is_configured(service)
-            results.append({
-                "service": service,
+        # Keyring checks run in worker threads, so issue them together
+        configured = await asyncio.gather(*(self.is_configured(row["service"]) for row in rows))
+        return [
+            {
+                "service": row["service"],
                 "key_hint": row["key_hint"],
                 "created_at": row["created_at"],
-                "configured": configured,
-            })
-        return results
+                "configured": is_set,
+            }
+            for row, is_set in zip(rows, configured)
+        ]
 
     async def is_configured(self, service: str) -> bool:
         """Check whether an API key exists in the keyring for a service.
@@ -146,7 +147,7 @@ class KeystoreService:
             True if a key is stored, False otherwise.
         """
         try:
-            password = keyring.get_password(_KEYRING_SERVICE, service)
+            password = await asyncio.to_thread(keyring.get_password, _KEYRING_SERVICE, service)
             return password is not None
         except Exception:
             logger.exception("Failed to check keyring for service=%s", service)
@@ -5,6 +5,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import httpx
+
 from backend.database import db
 from backend.integrations.hibp_client import HIBPClient
 from backend.integrations.shodan_client import ShodanClient
@@ -22,15 +24,37 @@ logger = logging.getLogger(__name__)
 class OsintService:
     """Orchestrates OSINT scanning operations."""
 
+    # Keep-alive client shared by every instance so upstream TCP/TLS
+    # connections survive across requests. Opened and closed by the app
+    # lifespan; instances fall back to per-call clients when it is unset.
+    _http: Optional[httpx.AsyncClient] = None
+
     def __init__(
         self,
         shodan_key: str = "",
         virustotal_key: str = "",
         hibp_key: str = "",
     ) -> None:
+        http = OsintService._http
         self._shodan = ShodanClient(shodan_key) if shodan_key else None
-        self._virustotal = VirusTotalClient(virustotal_key) if virustotal_key else None
-        self._hibp = HIBPClient(hibp_key)
+        self._virustotal = VirusTotalClient(virustotal_key, client=http) if virustotal_key else None
+        self._hibp = HIBPClient(hibp_key, client=http)
+
+    @classmethod
+    async def open_http_client(cls) -> None:
+        """Create the shared upstream HTTP client if it is not open yet."""
+        if cls._http is None:
+            cls._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300.0),
+            )
+
+    @classmethod
+    async def close_http_client(cls) -> None:
+        """Close the shared upstream HTTP client."""
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
 
     async def _store_result(
         self, scan_id: str, scan_type: str, target: str,
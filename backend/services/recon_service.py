@@ -8,8 +8,11 @@ database and emits progress updates over WebSocket.
 import json
 import logging
 from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
 from uuid import uuid4
 
+import httpx
+
 from backend.database import db
 from backend.models.recon import (
     DnsRecord,
@@ -20,7 +23,7 @@ from backend.models.recon import (
     WhoisResult,
 )
 from backend.scanners.dns_analyzer import analyze_dns
-from backend.scanners.nmap_scanner import scan_ports
+from backend.scanners.nmap_scanner import iter_ports, scan_ports
 from backend.scanners.subdomain_enum import enumerate_subdomains
 from backend.scanners.tech_fingerprint import fingerprint_tech
 from backend.scanners.whois_lookup import lookup_whois
@@ -28,10 +31,60 @@ from backend.utils.progress import ProgressEmitter
 
 logger = logging.getLogger(__name__)
 
+# WhoisResult fields never shown as label/value rows
+_WHOIS_FIELD_SKIP = frozenset({"raw", "frontend_fields"})
+_WHOIS_VALUE_LIMIT = 200
+
+
+def _trunc(value: Any, limit: int = _WHOIS_VALUE_LIMIT) -> str:
+    """Return *value* as a string of at most *limit* characters.
+
+    Short strings are returned as-is; only longer ones are sliced and
+    only non-strings go through str().
+    """
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit]
+    return str(value)[:limit]
+
+
+def _whois_fields(result: WhoisResult) -> list[dict[str, str]]:
+    """Build the label/value rows for the frontend WhoisResponse type."""
+    return [
+        {"label": k.replace("_", " ").title(), "value": _trunc(v)}
+        for k, v in result
+        if k not in _WHOIS_FIELD_SKIP and v and not isinstance(v, (dict, list))
+    ]
+
 
 class ReconService:
     """Orchestrates reconnaissance scanning operations."""
 
+    # Shared keep-alive clients, opened in the app lifespan. Fingerprinting
+    # probes arbitrary target sites, so it gets its own client that skips
+    # certificate verification; crt.sh goes through the verifying one.
+    _http: Optional[httpx.AsyncClient] = None
+    _probe_http: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    async def open_http_clients(cls) -> None:
+        """Create the shared upstream HTTP clients if they are not open yet."""
+        limits = httpx.Limits(max_keepalive_connections=50, keepalive_expiry=300.0)
+        if cls._http is None:
+            cls._http = httpx.AsyncClient(timeout=15.0, limits=limits)
+        if cls._probe_http is None:
+            cls._probe_http = httpx.AsyncClient(
+                timeout=15.0, limits=limits, follow_redirects=True, verify=False,
+            )
+
+    @classmethod
+    async def close_http_clients(cls) -> None:
+        """Close the shared upstream HTTP clients."""
+        for attr in ("_http", "_probe_http"):
+            client = getattr(cls, attr)
+            if client is not None:
+                await client.aclose()
+                setattr(cls, attr, None)
+
     async def _store_result(
         self,
         scan_id: str,
@@ -76,7 +129,7 @@ class ReconService:
         """Run subdomain enumeration and store results."""
         await self._store_history(scan_id, "recon_subdomains", domain, "running", 0)
         try:
-            results = await enumerate_subdomains(domain, progress_emitter=emitter)
+            results = await enumerate_subdomains(domain, progress_emitter=emitter, client=ReconService._http)
             result_dicts = [r.model_dump() for r in results]
             await self._store_result(scan_id, "recon_subdomains", domain, result_dicts)
             await self._store_history(scan_id, "recon_subdomains", domain, "completed", len(results))
@@ -108,9 +161,47 @@ class ReconService:
             await emitter.emit(100, "error", str(exc), "port_scan")
             return [], 0
 
+    async def stream_port_scan(
+        self,
+        target: str,
+        ports: str,
+        scan_id: str,
+        emitter: ProgressEmitter,
+        alive_hosts: set[str],
+    ) -> AsyncIterator[PortScanResult]:
+        """Run a port scan, yielding open ports as they are found.
+
+        Responding hosts are collected into *alive_hosts*. Results are
+        stored once the scan finishes, exactly as in :meth:`run_port_scan`.
+        A scanner failure is recorded and re-raised; if the caller stops
+        iterating early the history row is marked as an error.
+        """
+        await self._store_history(scan_id, "recon_ports", target, "running", 0)
+        results: list[PortScanResult] = []
+        status, count = "error", 0
+        try:
+            async for result in iter_ports(target, ports, emitter, alive_hosts):
+                results.append(result)
+                yield result
+            result_dicts = [r.model_dump() for r in results]
+            await self._store_result(scan_id, "recon_ports", target, result_dicts)
+            status, count = "completed", len(results)
+        except Exception as exc:
+            logger.error("Port scan failed: %s", exc)
+            await emitter.emit(100, "error", str(exc), "port_scan")
+            raise
+        finally:
+            await self._store_history(scan_id, "recon_ports", target, status, count)
+
     async def run_whois(self, domain: str) -> WhoisResult:
-        """Run WHOIS lookup (no progress emitter needed -- fast operation)."""
-        return await lookup_whois(domain)
+        """Run WHOIS lookup (no progress emitter needed -- fast operation).
+
+        The frontend label/value rows are built here once, so cached
+        results are served without re-formatting.
+        """
+        result = await lookup_whois(domain)
+        result.frontend_fields = _whois_fields(result)
+        return result
 
     async def run_dns_analysis(self, domain: str) -> list[DnsRecord]:
         """Run DNS record analysis."""
@@ -118,7 +209,7 @@ class ReconService:
 
     async def run_tech_fingerprint(self, url: str) -> list[TechStackResult]:
         """Run technology stack fingerprinting."""
-        return await fingerprint_tech(url)
+        return await fingerprint_tech(url, ReconService._probe_http)
 
     async def run_full_recon(
         self,
@@ -131,35 +222,63 @@ class ReconService:
         Executes subdomain enumeration, port scanning, WHOIS lookup,
         DNS analysis, and technology fingerprinting sequentially.
         """
+        result = ReconFullResult(target=target)
+        try:
+            async for phase, value in self.iter_full_recon(target, scan_id, emitter):
+                setattr(result, phase, value)
+        except Exception:
+            # Already logged and recorded; return the phases that completed
+            pass
+        return result
+
+    async def iter_full_recon(
+        self,
+        target: str,
+        scan_id: str,
+        emitter: ProgressEmitter,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Run a full reconnaissance scan, yielding each phase as it completes.
+
+        Yields ``(field, value)`` pairs named after the ReconFullResult
+        fields. A failure is recorded and re-raised after the phases
+        completed so far; if the caller stops iterating early the history
+        row is marked as an error.
+        """
         await self._store_history(scan_id, "recon_full", target, "running", 0)
         result = ReconFullResult(target=target)
+        status, total_findings = "error", 0
 
         try:
             # Phase 1: Subdomains (0-30%)
             await emitter.emit(0, "running", "Starting subdomain enumeration", "recon_full")
-            result.subdomains = await enumerate_subdomains(target)
+            result.subdomains = await enumerate_subdomains(target, client=ReconService._http)
             await emitter.emit(20, "running", "Subdomain enumeration complete", "recon_full")
+            yield "subdomains", result.subdomains
 
             # Phase 2: Port scan (30-55%)
             await emitter.emit(25, "running", "Starting port scan", "recon_full")
             result.ports, _ = await scan_ports(target, ports="1-1000")
             await emitter.emit(50, "running", "Port scan complete", "recon_full")
+            yield "ports", result.ports
 
             # Phase 3: WHOIS (55-65%)
             await emitter.emit(55, "running", "Running WHOIS lookup", "recon_full")
             result.whois = await lookup_whois(target)
             await emitter.emit(65, "running", "WHOIS lookup complete", "recon_full")
+            yield "whois", result.whois
 
             # Phase 4: DNS (65-80%)
             await emitter.emit(65, "running", "Analyzing DNS records", "recon_full")
             result.dns_records = await analyze_dns(target)
             await emitter.emit(80, "running", "DNS analysis complete", "recon_full")
+            yield "dns_records", result.dns_records
 
             # Phase 5: Tech fingerprint (80-100%)
             url = "https://" + target if not target.startswith("http") else target
             await emitter.emit(80, "running", "Fingerprinting technology stack", "recon_full")
-            result.tech_stack = await fingerprint_tech(url)
+            result.tech_stack = await fingerprint_tech(url, ReconService._probe_http)
             await emitter.emit(100, "completed", "Full recon complete", "recon_full")
+            yield "tech_stack", result.tech_stack
 
             # Store aggregated results
             total_findings = (
@@ -171,11 +290,12 @@ class ReconService:
                 scan_id, "recon_full", target,
                 [result.model_dump()],
             )
-            await self._store_history(scan_id, "recon_full", target, "completed", total_findings)
-            return result
+            status = "completed"
 
         except Exception as exc:
             logger.error("Full recon failed for %s: %s", target, exc)
-            await self._store_history(scan_id, "recon_full", target, "error", 0)
+            total_findings = 0
             await emitter.emit(100, "error", str(exc), "recon_full")
-            return result
+            raise
+        finally:
+            await self._store_history(scan_id, "recon_full", target, status, total_findings)
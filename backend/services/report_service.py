@@ -129,12 +129,29 @@ class ReportService:
             raise ValueError(f"Report {report_id} not found")
         return render_markdown(report["content"])
 
-    async def list_reports(self) -> list[dict]:
-        """Return all reports ordered by creation date (newest first)."""
+    async def list_reports(
+        self,
+        limit: Optional[int] = None,
+        before: Optional[tuple[str, str]] = None,
+    ) -> list[dict]:
+        """Return reports ordered by creation date (newest first).
+
+        Args:
+            limit: Maximum number of reports to return (all if None).
+            before: ``(created_at, id)`` key of the last report already
+                seen; only older reports are returned.
+        """
         conn = await db.get_connection()
-        cursor = await conn.execute(
-            "SELECT id, title, report_type, content_json, pdf_path, created_at FROM reports ORDER BY created_at DESC",
-        )
+        sql = "SELECT id, title, report_type, content_json, pdf_path, created_at FROM reports"
+        params: list = []
+        if before is not None:
+            sql += " WHERE (created_at, id) < (?, ?)"
+            params.extend(before)
+        sql += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = await conn.execute(sql, params)
         rows = await cursor.fetchall()
         return [{"id": r["id"], "title": r["title"], "report_type": r["report_type"],
                  "content": json.loads(r["content_json"]), "pdf_path": r["pdf_path"],
@@ -16,7 +16,7 @@ from backend.models.seek_enter import (
     EnterResult,
     SeekResult,
 )
-from backend.scanners.enter_engine import _event, run_exploit, select_exploit
+from backend.scanners.enter_engine import _event, run_exploit, select_exploit, sse_frame
 from backend.scanners.seek_scanner import seek_scan
 
 logger = logging.getLogger(__name__)
@@ -179,5 +179,10 @@ class SeekEnterService:
             f"Access: {access_level} | Method: {method}",
         )
 
+    async def run_enter_sse(self, request: EnterRequest) -> AsyncGenerator[bytes, None]:
+        """Run :meth:`run_enter`, yielding each event as an encoded SSE frame."""
+        async for event in self.run_enter(request):
+            yield sse_frame(event)
+
 
 seek_enter_service = SeekEnterService()
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+import httpx
+
 from backend.database import db
 from backend.integrations.nvd_client import NvdClient
 from backend.models.vuln import (
@@ -21,6 +23,7 @@ from backend.models.vuln import (
 from backend.scanners.dependency_checker import check_package_json, check_requirements
 from backend.scanners.header_analyzer import analyze_headers
 from backend.scanners.ssl_checker import check_ssl
+from backend.services.keystore_service import keystore
 from backend.utils.progress import ProgressEmitter
 
 logger = logging.getLogger(__name__)
@@ -29,8 +32,41 @@ logger = logging.getLogger(__name__)
 class VulnService:
     """Orchestrates vulnerability scanning operations."""
 
+    # Keep-alive clients shared by every instance, opened and closed by the
+    # app lifespan; scanners fall back to one-off clients while they are
+    # None. _http serves NVD REST lookups made by the dependency checker.
+    # Header analysis fetches arbitrary target sites, so it gets its own
+    # client that follows redirects and skips certificate verification.
+    _http: Optional[httpx.AsyncClient] = None
+    _probe_http: Optional[httpx.AsyncClient] = None
+
     def __init__(self, nvd_api_key: str = "") -> None:
         self._nvd = NvdClient(api_key=nvd_api_key)
+        self._nvd_api_key = nvd_api_key
+
+    @classmethod
+    async def open_http_clients(cls) -> None:
+        """Create the shared HTTP clients if they are not open yet."""
+        if cls._http is None:
+            cls._http = httpx.AsyncClient(
+                timeout=10.0, limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        if cls._probe_http is None:
+            cls._probe_http = httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                verify=False,
+                limits=httpx.Limits(max_keepalive_connections=100, keepalive_expiry=60.0),
+            )
+
+    @classmethod
+    async def close_http_clients(cls) -> None:
+        """Close the shared HTTP clients."""
+        for attr in ("_http", "_probe_http"):
+            client = getattr(cls, attr)
+            if client is not None:
+                await client.aclose()
+                setattr(cls, attr, None)
 
     async def _store_result(
         self, scan_id: str, scan_type: str, target: str,
@@ -67,7 +103,7 @@ class VulnService:
         """Run HTTP security header analysis and store results."""
         await self._store_history(scan_id, "vuln_headers", url, "running", 0)
         try:
-            results = await analyze_headers(url)
+            results = await analyze_headers(url, VulnService._probe_http)
             fail_count = sum(1 for r in results if r.status == "fail")
             severity = "info"
             if fail_count > 3:
@@ -137,9 +173,9 @@ class VulnService:
         await self._store_history(scan_id, "vuln_deps", target_name, "running", 0)
         try:
             if file_type == "requirements":
-                results = await check_requirements(content)
+                results = await check_requirements(content, VulnService._http, self._nvd_api_key)
             else:
-                results = await check_package_json(content)
+                results = await check_package_json(content, VulnService._http, self._nvd_api_key)
             severity = "info"
             critical_count = sum(1 for r in results if r.severity == "CRITICAL")
             high_count = sum(1 for r in results if r.severity == "HIGH")
@@ -160,15 +196,22 @@ class VulnService:
 
     async def run_full_scan(
         self, target: str, scan_id: str, emitter: ProgressEmitter,
+        url: Optional[str] = None, hostname: Optional[str] = None,
     ) -> VulnScanResult:
-        """Run a full vulnerability scan combining all modules."""
+        """Run a full vulnerability scan combining all modules.
+
+        *url* and *hostname* may be passed when the caller has already
+        parsed the target; otherwise they are derived from it.
+        """
         await self._store_history(scan_id, "vuln_full", target, "running", 0)
         result = VulnScanResult(target=target)
         try:
-            url = target if target.startswith("http") else "https://" + target
-            hostname = target.split("://")[-1].split("/")[0].split(":")[0]
+            if url is None:
+                url = target if target.startswith("http") else "https://" + target
+            if hostname is None:
+                hostname = target.split("://")[-1].split("/")[0].split(":")[0]
             await emitter.emit(0, "running", "Analyzing HTTP headers", "vuln_full")
-            result.headers = await analyze_headers(url)
+            result.headers = await analyze_headers(url, VulnService._probe_http)
             await emitter.emit(30, "running", "Checking SSL/TLS", "vuln_full")
             result.ssl = await check_ssl(hostname)
             await emitter.emit(60, "running", "Searching for CVEs", "vuln_full")
@@ -183,3 +226,26 @@ class VulnService:
             await self._store_history(scan_id, "vuln_full", target, "error", 0)
             await emitter.emit(100, "error", str(exc), "vuln_full")
             return result
+
+
+_shared: Optional[VulnService] = None
+
+
+async def get_vuln_service() -> VulnService:
+    """Return the shared VulnService, created with the stored NVD key.
+
+    The keyring is read once per service instance; see :func:`reload_keys`.
+    """
+    global _shared
+    if _shared is None:
+        _shared = VulnService(nvd_api_key=await keystore.get_key("nvd") or "")
+    return _shared
+
+
+def reload_keys() -> None:
+    """Drop the shared service so the next request re-reads the keyring.
+
+    Called by the settings router whenever a key is stored or deleted.
+    """
+    global _shared
+    _shared = None
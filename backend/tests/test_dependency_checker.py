@@ -0,0 +1,62 @@
+"""Tests for dependency manifest parsing."""
+
+import random
+import re
+
+from backend.scanners.dependency_checker import _parse_requirements_txt
+
+
+def _reference_parse_requirements_txt(content: str) -> list[tuple[str, str]]:
+    """requirements.txt parsing as it was before the single fused pattern."""
+    packages: list[tuple[str, str]] = []
+    for line in content.strip().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("-"):
+            continue
+        match = re.match(r"^([A-Za-z0-9_.-]+)\s*[=~<>!]=?\s*([\d.]+)", line)
+        if match:
+            packages.append((match.group(1).lower(), match.group(2)))
+        else:
+            name_match = re.match(r"^([A-Za-z0-9_.-]+)", line)
+            if name_match:
+                packages.append((name_match.group(1).lower(), ""))
+    return packages
+
+
+_FRAGMENTS = (
+    "requests", "Django", "zope.interface", "my_pkg", "a-b", "1", "2.31.0",
+    "==", ">=", "<=", "~=", "!=", "===", "=", ">", "<", " ", "\t",
+    "\n", "\r\n", "\r", "\x0c", "\x1c", "\x85", "\u2028",
+    "#", "-r", "-e", "[extra]", ";", "python_version", "x", ".",
+)
+
+
+def _random_requirements(rng: random.Random) -> str:
+    return "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 25)))
+
+
+def test_parse_requirements_known_file() -> None:
+    content = (
+        "# pinned\n"
+        "requests==2.31.0\n"
+        "Django >= 4.2\r\n"
+        "-r base.txt\n"
+        "\n"
+        "zope.interface\r"
+        "uvicorn[standard]>=0.32.0\x0c"
+        "httpx~=0.28\n"
+    )
+    assert _parse_requirements_txt(content) == [
+        ("requests", "2.31.0"),
+        ("django", "4.2"),
+        ("zope.interface", ""),
+        ("uvicorn", ""),
+        ("httpx", "0.28"),
+    ]
+
+
+def test_parse_requirements_matches_reference() -> None:
+    rng = random.Random(20260703)
+    for _ in range(20000):
+        content = _random_requirements(rng)
+        assert _parse_requirements_txt(content) == _reference_parse_requirements_txt(content), repr(content)
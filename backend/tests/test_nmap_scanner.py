@@ -0,0 +1,64 @@
+"""Tests for the port scanner's target and port parsing."""
+
+import random
+
+import pytest
+
+from backend.scanners.nmap_scanner import _parse_port_range
+
+
+def _reference_parse_port_range(ports: str) -> tuple[int, ...]:
+    """Port spec parsing as it was before the flag array."""
+    result: list[int] = []
+    for part in ports.split(","):
+        part = part.strip()
+        if "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+            result.extend(range(start, min(end + 1, 65536)))
+        else:
+            port = int(part)
+            if 1 <= port <= 65535:
+                result.append(port)
+    return tuple(sorted(set(result)))
+
+
+def _outcome(parse, ports: str) -> tuple[int, ...] | type:
+    try:
+        return parse(ports)
+    except ValueError:
+        return ValueError
+
+
+def _random_port(rng: random.Random) -> str:
+    return str(rng.choice((0, 1, 22, 80, 443, 1000, 65534, 65535, 65536, 70000, rng.randint(0, 70000))))
+
+
+def _random_spec(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 5)):
+        if rng.random() < 0.5:
+            parts.append(f"{_random_port(rng)}-{_random_port(rng)}")
+        else:
+            parts.append(_random_port(rng))
+        if rng.random() < 0.1:
+            parts[-1] = rng.choice((" ", "x", "-", "")) + parts[-1]
+    return rng.choice((",", ", ")).join(parts)
+
+
+def test_parse_port_range_known_specs() -> None:
+    assert _parse_port_range("80,443") == (80, 443)
+    assert _parse_port_range("443, 80,80") == (80, 443)
+    assert _parse_port_range("1-5,3") == (1, 2, 3, 4, 5)
+    assert _parse_port_range("65530-70000") == (65530, 65531, 65532, 65533, 65534, 65535)
+    assert _parse_port_range("10-5") == ()
+    assert _parse_port_range("0,70000") == ()
+    with pytest.raises(ValueError):
+        _parse_port_range("http")
+
+
+def test_parse_port_range_matches_reference() -> None:
+    rng = random.Random(20260810)
+    for _ in range(500):
+        spec = _random_spec(rng)
+        assert _outcome(_parse_port_range, spec) == _outcome(_reference_parse_port_range, spec), spec
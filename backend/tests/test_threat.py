@@ -0,0 +1,48 @@
+"""Tests for the threat intelligence router helpers."""
+
+import random
+
+from backend.routers.threat import _detect_ioc_type
+from backend.utils.validators import validate_domain, validate_hash, validate_ip, validate_url
+
+
+def _reference_detect_ioc_type(value: str) -> str:
+    """IOC detection as it was before dispatching on one character test."""
+    if validate_ip(value):
+        return "ip"
+    if validate_domain(value):
+        return "domain"
+    if validate_url(value):
+        return "url"
+    is_hash, _ = validate_hash(value)
+    if is_hash:
+        return "hash"
+    return "unknown"
+
+
+_FRAGMENTS = (
+    "http://", "https://", "ftp://", "://", ":", "::", ".", "/", "-", "%",
+    "example", "com", "1", "255", "256", "fe80", "ffff", "a", "Z", " ",
+    "d41d8cd98f00b204", "e9800998ecf8427e", "0x", "[", "]", "@", "?", "#",
+)
+
+
+def _random_ioc(rng: random.Random) -> str:
+    return "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 8)))
+
+
+def test_detect_ioc_type_known_values() -> None:
+    assert _detect_ioc_type("8.8.8.8") == "ip"
+    assert _detect_ioc_type("2001:db8::1") == "ip"
+    assert _detect_ioc_type("example.com") == "domain"
+    assert _detect_ioc_type("https://example.com/path") == "url"
+    assert _detect_ioc_type("d41d8cd98f00b204e9800998ecf8427e") == "hash"
+    assert _detect_ioc_type("example.com:8080") == "unknown"
+    assert _detect_ioc_type("") == "unknown"
+
+
+def test_detect_ioc_type_matches_sequential_reference() -> None:
+    rng = random.Random(20260611)
+    for _ in range(20000):
+        value = _random_ioc(rng)
+        assert _detect_ioc_type(value) == _reference_detect_ioc_type(value), repr(value)
@@ -0,0 +1,191 @@
+"""Tests for the coalescing TTL cache."""
+
+import asyncio
+
+import pytest
+
+from backend.utils import ttl_cache
+from backend.utils.ttl_cache import AsyncTTLCache
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_cancelled_leader_does_not_cancel_waiters() -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def factory() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        leader = asyncio.create_task(cache.get_or_compute("k", factory))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_compute("k", factory))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == 42
+        assert leader.cancelled()
+        assert calls == 1
+        assert cache.get("k") == 42
+
+    asyncio.run(run())
+
+
+def test_concurrent_misses_share_one_computation() -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+        calls = 0
+
+        async def factory() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", factory) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert calls == 1
+
+    asyncio.run(run())
+
+
+def test_failures_reach_every_waiter_and_are_not_cached() -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+        calls = 0
+
+        async def failing() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        outcomes = await asyncio.gather(
+            cache.get_or_compute("k", failing), cache.get_or_compute("k", failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(o, ValueError) for o in outcomes)
+        assert calls == 1
+        assert cache.get("k", "missing") == "missing"
+
+        async def working() -> str:
+            return "recovered"
+
+        assert await cache.get_or_compute("k", working) == "recovered"
+
+    asyncio.run(run())
+
+
+def test_clear_during_computation_keeps_stale_value_out() -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+        release = asyncio.Event()
+
+        async def stale() -> str:
+            await release.wait()
+            return "stale"
+
+        async def fresh() -> str:
+            return "fresh"
+
+        pending = asyncio.create_task(cache.get_or_compute("k", stale))
+        await asyncio.sleep(0)
+        cache.clear()
+        # A caller after clear() starts afresh instead of joining the old run
+        assert await cache.get_or_compute("k", fresh) == "fresh"
+        release.set()
+        # The old run still answers its own waiter but does not overwrite
+        assert await pending == "stale"
+        assert cache.get("k") == "fresh"
+
+    asyncio.run(run())
+
+
+def test_clear_before_task_starts_keeps_value_out() -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+
+        async def factory() -> str:
+            return "value"
+
+        pending = asyncio.ensure_future(cache.get_or_compute("k", factory))
+        # Let get_or_compute create the task, then clear before it runs
+        await asyncio.sleep(0)
+        cache.clear()
+        assert await pending == "value"
+        assert cache.get("k") is None
+
+    asyncio.run(run())
+
+
+def test_zero_ttl_returns_value_without_storing() -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+
+        async def factory() -> str:
+            return "value"
+
+        assert await cache.get_or_compute("k", factory, ttl=0) == "value"
+        assert cache.get("k") is None
+
+    asyncio.run(run())
+
+
+def test_lru_eviction_drops_least_recently_used() -> None:
+    cache = AsyncTTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now the most recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl(clock: _Clock) -> None:
+    cache = AsyncTTLCache(ttl=10.0)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1.0)
+    clock.now += 5.0
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+    clock.now += 5.0
+    assert cache.get("default") is None
+
+
+def test_ttl_callable_derives_lifetime_from_value(clock: _Clock) -> None:
+    async def run() -> None:
+        cache = AsyncTTLCache()
+
+        async def factory() -> int:
+            return 3
+
+        await cache.get_or_compute("k", factory, ttl=lambda value: float(value))
+        clock.now += 2.0
+        assert cache.get("k") == 3
+        clock.now += 1.0
+        assert cache.get("k") is None
+
+    asyncio.run(run())
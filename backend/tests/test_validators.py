@@ -0,0 +1,55 @@
+"""Tests for the target validators."""
+
+import random
+import re
+import string
+
+from backend.utils.validators import validate_hash
+
+# validate_hash as it was before the length lookup: each anchored pattern
+# tried in turn. Kept as the reference the current version must match.
+_REFERENCE_HASH_PATTERNS = {
+    "md5": re.compile(r"^[a-fA-F0-9]{32}$"),
+    "sha1": re.compile(r"^[a-fA-F0-9]{40}$"),
+    "sha256": re.compile(r"^[a-fA-F0-9]{64}$"),
+}
+
+
+def _reference_validate_hash(hash_str: str) -> tuple[bool, str]:
+    cleaned = hash_str.strip().lower()
+    for hash_type, pattern in _REFERENCE_HASH_PATTERNS.items():
+        if pattern.match(cleaned):
+            return True, hash_type
+    return False, ""
+
+
+def _random_hash_like(rng: random.Random) -> str:
+    length = rng.choice((0, 1, 31, 32, 33, 39, 40, 41, 63, 64, 65, 128))
+    alphabet = rng.choice((
+        string.hexdigits,
+        string.hexdigits + "gxzG",
+        string.hexdigits + " \t\n",
+        string.ascii_letters + string.digits + "-_+",
+    ))
+    value = "".join(rng.choice(alphabet) for _ in range(length))
+    if rng.random() < 0.2:
+        # "\n" matches before "$" in the reference; stripping hides it
+        value = rng.choice((" ", "\n", "\t")) + value + rng.choice(("", " ", "\n"))
+    return value
+
+
+def test_validate_hash_known_values() -> None:
+    assert validate_hash("d41d8cd98f00b204e9800998ecf8427e") == (True, "md5")
+    assert validate_hash("DA39A3EE5E6B4B0D3255BFEF95601890AFD80709") == (True, "sha1")
+    assert validate_hash(" " + "a" * 64 + "\n") == (True, "sha256")
+    assert validate_hash("g" * 32) == (False, "")
+    assert validate_hash("0x" + "a" * 30) == (False, "")
+    assert validate_hash("a" * 128) == (False, "")
+    assert validate_hash("") == (False, "")
+
+
+def test_validate_hash_matches_regex_reference() -> None:
+    rng = random.Random(20260612)
+    for _ in range(20000):
+        value = _random_hash_like(rng)
+        assert validate_hash(value) == _reference_validate_hash(value), repr(value)
@@ -0,0 +1,34 @@
+"""Keyset pagination cursors.
+
+History and report listings page on ``(timestamp, id)`` rather than
+``OFFSET`` so each page is an index seek regardless of depth. The cursor
+handed to clients is the last row's key, base64-encoded so it can be
+passed back verbatim as a query parameter.
+"""
+
+import base64
+import binascii
+
+_SEP = "|"
+
+
+def encode_cursor(timestamp: str, row_id: str) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = f"{timestamp}{_SEP}{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    timestamp, sep, row_id = raw.partition(_SEP)
+    if not sep or not timestamp or not row_id:
+        raise ValueError("Invalid pagination cursor")
+    return timestamp, row_id
@@ -4,6 +4,9 @@ Wraps the WebSocket ConnectionManager to provide a convenient
 interface for scanner modules to report their progress.
 """
 
+import time
+from typing import Optional
+
 from backend.models.base import ScanProgress
 from backend.routers.websocket import ConnectionManager
 
@@ -23,6 +26,8 @@ class ProgressEmitter:
         await emitter.emit(100, "completed", "Scan finished")
     """
 
+    __slots__ = ("_manager", "_scan_id")
+
     def __init__(self, connection_manager: ConnectionManager, scan_id: str) -> None:
         self._manager = connection_manager
         self._scan_id = scan_id
@@ -36,12 +41,17 @@ class ProgressEmitter:
     ) -> None:
         """Broadcast a progress update to all watchers of this scan.
 
+        Nothing is built or encoded when no client is watching; otherwise
+        the message is encoded once by pydantic-core and sent pre-encoded.
+
         Args:
             progress: Completion percentage (0-100).
             status: Current phase -- pending, running, completed, error.
             current_task: Human-readable description of what is happening.
             module: Scanner module name (optional, useful for multi-module scans).
         """
+        if not self._manager.has_watchers(self._scan_id):
+            return
         message = ScanProgress(
             scan_id=self._scan_id,
             module=module,
@@ -49,6 +59,56 @@ class ProgressEmitter:
             status=status,
             current_task=current_task,
         )
-        await self._manager.broadcast_progress(
-            self._scan_id, message.model_dump()
-        )
+        await self._manager.broadcast_raw(self._scan_id, message.model_dump_json())
+
+
+class ThrottledEmitter:
+    """Coalesce running progress updates for scans with many small steps.
+
+    Wraps an optional ProgressEmitter and forwards an update only once the
+    percentage has advanced by *min_step* points or *min_interval* seconds
+    have passed since the last one sent. Pass ``force=True`` for the last
+    step so the final count is always reported. Without an emitter every
+    call is a no-op.
+
+    Example::
+
+        throttle = ThrottledEmitter(progress_emitter)
+        for done, path in enumerate(paths, 1):
+            ...
+            await throttle.emit(pct, "running", f"Checked {done}/{total}", "dirs", force=done == total)
+    """
+
+    __slots__ = ("_emitter", "_min_step", "_min_interval", "_last_progress", "_last_time")
+
+    def __init__(
+        self,
+        emitter: Optional[ProgressEmitter],
+        min_step: int = 5,
+        min_interval: float = 0.25,
+    ) -> None:
+        self._emitter = emitter
+        self._min_step = min_step
+        self._min_interval = min_interval
+        self._last_progress = 0
+        self._last_time = time.monotonic()
+
+    async def emit(
+        self,
+        progress: int,
+        status: str,
+        current_task: str = "",
+        module: str = "",
+        force: bool = False,
+    ) -> None:
+        """Forward the update if it is due; see :meth:`ProgressEmitter.emit`."""
+        if self._emitter is None:
+            return
+        now = time.monotonic()
+        if (
+            force
+            or progress - self._last_progress >= self._min_step
+            or now - self._last_time >= self._min_interval
+        ):
+            self._last_progress, self._last_time = progress, now
+            await self._emitter.emit(progress, status, current_task, module)
@@ -74,6 +74,7 @@ rate_limiter.configure("virustotal", max_calls=4, period=60.0)
 
 # NVD: 5 req/30sec without API key, 50 req/30sec with key
 rate_limiter.configure("nvd", max_calls=5, period=30.0)
+rate_limiter.configure("nvd_keyed", max_calls=50, period=30.0)
 
 # AbuseIPDB: 1000 req/day ~ 1 req/1.5sec to be safe
 rate_limiter.configure("abuseipdb", max_calls=1, period=1.5)
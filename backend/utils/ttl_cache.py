@@ -0,0 +1,129 @@
+"""In-process TTL cache with request coalescing.
+
+Memoizes the results of slow upstream lookups (DNS, WHOIS, ...) for a
+bounded time and makes concurrent callers asking for the same key share
+a single in-flight computation instead of each hitting the network.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+# TTL for an entry: fixed seconds, or derived from the computed value
+TTL = Union[float, Callable[[Any], float]]
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """Async LRU cache whose entries expire after a per-entry TTL.
+
+    Usage::
+
+        cache = AsyncTTLCache(maxsize=1024, ttl=300.0)
+        records = await cache.get_or_compute(("dns", domain), lambda: analyze_dns(domain))
+
+    A TTL of zero or less means the value is returned but not stored.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # Bumped by clear() so computations started before it are not stored
+        self._generation = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for *key*, or *default* if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store *value* under *key* for *ttl* seconds (default TTL if None)."""
+        ttl = self._ttl if ttl is None else ttl
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry.
+
+        Computations already in flight still answer their current waiters
+        but their results are not stored, and later callers start afresh.
+        """
+        self._data.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[TTL] = None,
+    ) -> Any:
+        """Return the cached value for *key*, computing it on a miss.
+
+        Concurrent misses for the same key await the first caller's
+        computation rather than starting their own. The computation runs
+        in its own task, so a caller being cancelled never cancels it for
+        the others. Exceptions are propagated to every waiter and are
+        never cached.
+
+        Args:
+            key: Hashable cache key.
+            factory: Zero-argument coroutine function producing the value.
+            ttl: Seconds to keep the value, or a callable deriving the TTL
+                from the value. Defaults to the cache-wide TTL.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compute(key, factory, ttl, self._generation))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    async def _compute(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[TTL],
+        generation: int,
+    ) -> Any:
+        """Run *factory*; cache its value only if the cache is still at *generation*.
+
+        *generation* is taken when the computation is requested, so a
+        clear() before the task first runs also keeps the value out.
+        """
+        value = await factory()
+        if generation == self._generation:
+            self.set(key, value, ttl(value) if callable(ttl) else ttl)
+        return value
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished computation."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so a failure nobody awaited is not logged as such
+            task.exception()
@@ -10,17 +10,17 @@ from urllib.parse import urlparse
 
 # Pre-compiled patterns
 _DOMAIN_RE = re.compile(
-    r"^(?!-)"                           # label cannot start with hyphen
+    r"^(?=.{4,253}$)"                   # total length 4-253 (RFC 1035)
+    r"(?!-)"                            # label cannot start with hyphen
     r"(?:[A-Za-z0-9-]{1,63}\.)*"        # subdomains
     r"[A-Za-z0-9-]{1,63}"              # TLD label
-    r"\.[A-Za-z]{2,}$"                 # TLD extension
+    r"\.[A-Za-z]{2,}$",                # TLD extension
+    re.ASCII,
 )
 
-_HASH_PATTERNS: dict[str, re.Pattern[str]] = {
-    "md5": re.compile(r"^[a-fA-F0-9]{32}$"),
-    "sha1": re.compile(r"^[a-fA-F0-9]{40}$"),
-    "sha256": re.compile(r"^[a-fA-F0-9]{64}$"),
-}
+# Hex hash type by digest length
+_HASH_LENS: dict[int, str] = {32: "md5", 40: "sha1", 64: "sha256"}
+_HEX_DIGITS = "0123456789abcdef"
 
 # Characters that should never appear in sanitised input
 _DANGEROUS_CHARS = re.compile(r"[;&|`$(){}!<>\x00-\x1f]")
@@ -75,10 +75,7 @@ def validate_domain(domain: str) -> bool:
     Rejects IPs, bare TLDs, and labels longer than 63 characters.
     Total length must not exceed 253 characters (RFC 1035).
     """
-    domain = domain.strip().rstrip(".")
-    if len(domain) > 253 or len(domain) < 4:
-        return False
-    return _DOMAIN_RE.match(domain) is not None
+    return _DOMAIN_RE.match(domain.strip().rstrip(".")) is not None
 
 
 def validate_url(url: str) -> bool:
@@ -101,10 +98,11 @@ def validate_hash(hash_str: str) -> tuple[bool, str]:
         'md5', 'sha1', 'sha256', or '' if not recognised.
     """
     cleaned = hash_str.strip().lower()
-    for hash_type, pattern in _HASH_PATTERNS.items():
-        if pattern.match(cleaned):
-            return True, hash_type
-    return False, ""
+    hash_type = _HASH_LENS.get(len(cleaned))
+    # strip() with the hex alphabet leaves nothing iff every char is hex
+    if hash_type is None or cleaned.strip(_HEX_DIGITS):
+        return False, ""
+    return True, hash_type
 
 
 def sanitize_input(input_str: str) -> str: